@@ -0,0 +1,298 @@
+"""PyPIRT APK yedekleme ve geri yükleme.
+
+Seçilen paketlerin tüm APK parçaları (base + split) içerik özetine göre
+adreslenen yerel bir depoya çekilir: aynı APK (aynı sürüm, başka cihaz ya da
+tekrar yedek) diskte bir kez tutulur ve cihazda hesaplanan sha256 depoda
+zaten varsa hiç çekilmez. Paket yolları, özetler ve sürüm kodları tek bir
+kabuk çağrısıyla alınır; eksik parçalar paralel çekilir.
+
+Geri yükleme her paketi `install-multiple` ile kurar. Cihazlar sınırlı bir
+iş havuzunda paralel işlenir; her cihazdaki kurulumlar (PackageManager zaten
+sıraya koyduğu için) art arda yapılır ve ilerleme/süre cihaz başına
+raporlanır.
+
+    apk_yedek/
+        blobs/<sha256>.apk
+        paketler/<paket>/<versionCode>.json
+"""
+import hashlib
+import json
+import shlex
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pypirt_core
+from pypirt_core import ADBClient
+
+
+def default_store() -> Path:
+    return pypirt_core.DATA_DIR / "apk_yedek"
+
+
+@dataclass
+class ApkPart:
+    name: str  # cihazdaki dosya adı (base.apk, split_config.arm64_v8a.apk...)
+    sha256: str
+    size: int
+
+
+@dataclass
+class ApkBackup:
+    package: str
+    version_code: int
+    parts: List[ApkPart]
+    device: str = ""
+    created: float = 0.0
+
+
+@dataclass
+class BackupResult:
+    package: str
+    ok: bool = False
+    version_code: int = 0
+    parts: int = 0
+    pulled: int = 0  # depoda olmadığı için çekilen parça
+    reused: int = 0  # depoda zaten olan parça
+    bytes_pulled: int = 0
+    ms: float = 0.0
+    error: str = ""
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+@dataclass
+class InstallResult:
+    device: str
+    package: str
+    ok: bool = False
+    ms: float = 0.0
+    error: str = ""
+
+
+@dataclass
+class DeviceRestore:
+    device: str
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    ms: float = 0.0
+    results: List[InstallResult] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ApkStore:
+    """İçerik özetiyle adreslenen yerel APK deposu"""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else default_store()
+        self.blobs = self.root / "blobs"
+        self.meta = self.root / "paketler"
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        self.meta.mkdir(parents=True, exist_ok=True)
+
+    def blob(self, sha256: str) -> Path:
+        return self.blobs / f"{sha256}.apk"
+
+    def has(self, sha256: str) -> bool:
+        return self.blob(sha256).exists()
+
+    def add_file(self, tmp: Path, expected: Optional[str] = None) -> Tuple[str, int]:
+        """Geçici dosyayı depoya taşı; (özet, boyut) döndür"""
+        digest = _sha256_file(tmp)
+        if expected and digest != expected:
+            tmp.unlink()
+            raise ValueError(f"Özet uyuşmuyor: {tmp.name}")
+        size = tmp.stat().st_size
+        dest = self.blob(digest)
+        if dest.exists():
+            tmp.unlink()
+        else:
+            tmp.replace(dest)
+        return digest, size
+
+    def save(self, backup: ApkBackup):
+        d = self.meta / backup.package
+        d.mkdir(exist_ok=True)
+        (d / f"{backup.version_code}.json").write_text(json.dumps(asdict(backup), ensure_ascii=False, indent=2),
+                                                       encoding="utf-8")
+
+    def packages(self) -> List[str]:
+        return sorted(p.name for p in self.meta.iterdir() if p.is_dir())
+
+    def latest(self, package: str) -> Optional[ApkBackup]:
+        d = self.meta / package
+        files = sorted(d.glob("*.json"), key=lambda p: int(p.stem)) if d.is_dir() else []
+        if not files:
+            return None
+        raw = json.loads(files[-1].read_text(encoding="utf-8"))
+        raw["parts"] = [ApkPart(**p) for p in raw["parts"]]
+        return ApkBackup(**raw)
+
+
+def _probe_script(packages: List[str]) -> str:
+    """Paket yolları, cihaz tarafı özetler ve sürüm kodları için tek kabuk betiği"""
+    pkgs = " ".join(shlex.quote(p) for p in packages)
+    return (f"for p in {pkgs}; do echo \"@@ $p\"; "
+            "for f in $(pm path $p | sed 's/^package://'); do "
+            "sha256sum \"$f\" 2>/dev/null || echo \"- $f\"; stat -c '%s %n' \"$f\"; done; "
+            "dumpsys package $p | grep -m1 -o 'versionCode=[0-9]*'; done")
+
+
+def parse_probe(text: str) -> Dict[str, Dict]:
+    """Betik çıktısı → {paket: {"version_code": int, "parts": {yol: {"sha256", "size"}}}}"""
+    out: Dict[str, Dict] = {}
+    cur = None
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("@@ "):
+            cur = out.setdefault(line[3:], {"version_code": 0, "parts": {}})
+            continue
+        if cur is None or not line:
+            continue
+        if line.startswith("versionCode="):
+            cur["version_code"] = int(line.split("=", 1)[1])
+            continue
+        head, _, path = line.partition(" ")
+        path = path.strip()
+        if not path.startswith("/"):
+            continue
+        part = cur["parts"].setdefault(path, {"sha256": "", "size": 0})
+        if head == "-":
+            continue  # cihazda sha256sum yok; çekildikten sonra hesaplanır
+        if head.isdigit():
+            part["size"] = int(head)
+        elif len(head) == 64:
+            part["sha256"] = head
+    return out
+
+
+def backup(client: ADBClient, packages: List[str], store: Optional[ApkStore] = None, workers: int = 4,
+           on_result: Optional[Callable[[BackupResult], None]] = None) -> List[BackupResult]:
+    """Paketleri depoya yedekle; depoda olan parçalar çekilmez"""
+    store = store or ApkStore()
+    cp = client._run(client._adb("shell", _probe_script(packages)), timeout=30 + 5 * len(packages), quiet=True)
+    probe = parse_probe(cp.stdout or "")
+    tmp_dir = store.root / "tmp"
+    tmp_dir.mkdir(exist_ok=True)
+    # Aynı çalışmada iki paketin ortak parçası (özeti aynı) bir kez çekilir
+    lock = threading.Lock()
+    inflight: Dict[str, threading.Event] = {}
+
+    def one(package: str) -> BackupResult:
+        t0 = time.perf_counter()
+        res = BackupResult(package=package)
+        info = probe.get(package)
+        try:
+            if not info or not info["parts"]:
+                raise LookupError("Paket cihazda bulunamadı")
+            res.version_code = info["version_code"]
+            parts = []
+            for k, (remote, meta) in enumerate(sorted(info["parts"].items())):
+                digest = meta["sha256"]
+                owner = None
+                if digest:
+                    with lock:
+                        waiting = inflight.get(digest)
+                        if waiting is None and not store.has(digest):
+                            owner = inflight[digest] = threading.Event()
+                    if waiting is not None:
+                        waiting.wait()
+                if digest and owner is None and store.has(digest):
+                    res.reused += 1
+                    size = store.blob(digest).stat().st_size
+                else:
+                    try:
+                        tmp = tmp_dir / f"{package}.{k}.{threading.get_ident()}.part"
+                        pull = client._run(client._adb("pull", remote, str(tmp)), timeout=600, quiet=True)
+                        if pull.returncode != 0 or not tmp.exists():
+                            raise RuntimeError(f"Çekilemedi: {remote}")
+                        digest, size = store.add_file(tmp, expected=digest or None)
+                    finally:
+                        if owner is not None:
+                            owner.set()
+                    res.pulled += 1
+                    res.bytes_pulled += size
+                parts.append(ApkPart(name=remote.rsplit("/", 1)[-1], sha256=digest, size=size))
+            store.save(ApkBackup(package=package, version_code=res.version_code, parts=parts,
+                                 device=client.serial or "", created=time.time()))
+            res.parts = len(parts)
+            res.ok = True
+        except Exception as e:
+            res.error = str(e)
+        res.ms = round((time.perf_counter() - t0) * 1000, 1)
+        client.on_log(f"[APK] {package} yedek: {'tamam' if res.ok else res.error} "
+                      f"({res.pulled} çekildi, {res.reused} depodan)")
+        if on_result:
+            on_result(res)
+        return res
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(one, packages))
+
+
+def install_backup(client: ADBClient, store: ApkStore, bk: ApkBackup) -> InstallResult:
+    """Tek paketi install-multiple ile kur (sürüm düşürmeye izin verir)"""
+    res = InstallResult(device=client.serial or "", package=bk.package)
+    t0 = time.perf_counter()
+    try:
+        files = [str(store.blob(p.sha256)) for p in bk.parts]
+        missing = [f for f in files if not Path(f).exists()]
+        if missing:
+            raise FileNotFoundError(f"Depoda eksik parça: {missing[0]}")
+        cp = client._run(client._adb("install-multiple", "-r", "-d", *files), timeout=600, quiet=True)
+        out = (cp.stdout or "").strip()
+        res.ok = cp.returncode == 0 and "Success" in out
+        if not res.ok:
+            res.error = out.splitlines()[-1] if out else "kurulum başarısız"
+    except Exception as e:
+        res.error = str(e)
+    res.ms = round((time.perf_counter() - t0) * 1000, 1)
+    return res
+
+
+def restore(adb: ADBClient, devices: List[str], packages: List[str], store: Optional[ApkStore] = None,
+            max_parallel: int = 4,
+            on_progress: Optional[Callable[[DeviceRestore, InstallResult], None]] = None) -> List[DeviceRestore]:
+    """Yedekleri cihazlara kur; en fazla max_parallel cihaz aynı anda"""
+    store = store or ApkStore()
+    backups = []
+    for pkg in packages:
+        bk = store.latest(pkg)
+        if bk is None:
+            raise LookupError(f"Depoda yedek yok: {pkg}")
+        backups.append(bk)
+
+    def per_device(serial: str) -> DeviceRestore:
+        client = adb.for_device(serial) if serial else adb
+        prog = DeviceRestore(device=serial, total=len(backups))
+        t0 = time.perf_counter()
+        for bk in backups:
+            res = install_backup(client, store, bk)
+            prog.results.append(res)
+            prog.done += 1
+            if not res.ok:
+                prog.failed += 1
+            prog.ms = round((time.perf_counter() - t0) * 1000, 1)
+            client.on_log(f"[APK] {serial or 'varsayılan'} {prog.done}/{prog.total} {bk.package}: "
+                          f"{'kuruldu' if res.ok else res.error} ({res.ms:.0f} ms)")
+            if on_progress:
+                on_progress(prog, res)
+        return prog
+
+    with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as pool:
+        return list(pool.map(per_device, devices))
@@ -0,0 +1,253 @@
+"""PyPIRT otomatik arayıcı.
+
+Kişi listesini sırayla arar; bir sonraki arama ancak önceki görüşme
+bittiğinde başlar. Arama durumu sabit beklemelerle ya da tekrar tekrar
+alınan tam dumpsys çıktılarıyla değil, cihaz başına açık tutulan tek bir
+süzülmüş `logcat` akışından izlenir. Akış cihazda hiç durum satırı
+üretmezse (bazı ROM'lar loglamaz) cihazda süzülen tek satırlık
+`mCallState` yoklamasına düşülür.
+
+Bir kişide beklenmeyen bir hata olursa (adb kopması, zaman aşımı) o kişi
+için "error" kaydı yazılır ve kişi bir kez daha kuyruğa konur; böylece
+başka bir cihaz ya da aynı cihaz sonra yeniden dener. Üst üste
+MAX_WORKER_ERRORS hata veren cihaz günlüğe yazılarak bırakılır.
+"""
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, List, Optional
+
+from pypirt_core import ADBClient, Kisi, sanitize_number
+
+
+IDLE, RINGING, OFFHOOK = 0, 1, 2
+MAX_WORKER_ERRORS = 3  # Üst üste bu kadar hata veren cihaz aramayı bırakır
+STATE_NAMES = {IDLE: "IDLE", RINGING: "RINGING", OFFHOOK: "OFFHOOK"}
+
+# Sadece arama durumu loglayan etiketler; geri kalan her şey cihazda susturulur
+LOGCAT_TAGS = ("GsmCdmaCallTracker", "CallTracker", "TelephonyRegistry", "Telecom", "PhoneStateListener")
+
+_NAME_TO_STATE = {
+    "IDLE": IDLE, "RINGING": RINGING, "OFFHOOK": OFFHOOK,
+    # Telecom çağrı durumları
+    "DIALING": OFFHOOK, "CONNECTING": OFFHOOK, "ACTIVE": OFFHOOK, "DISCONNECTED": IDLE,
+}
+_STATE_PATTERNS = [
+    re.compile(r"mCallState=(\d)"),
+    re.compile(r"notifyCallState\w*[:(].*?state=(\d)"),
+    re.compile(r"update phone state, old=\w+ new=(IDLE|RINGING|OFFHOOK)"),
+    re.compile(r"setCallState\b.*?->\s*(DIALING|CONNECTING|ACTIVE|DISCONNECTED)"),
+]
+
+
+def parse_call_state(line: str) -> Optional[int]:
+    """Tek bir log satırından arama durumunu çıkar (bulunamazsa None)"""
+    for pat in _STATE_PATTERNS:
+        m = pat.search(line)
+        if m:
+            val = m.group(1)
+            return int(val) if val.isdigit() else _NAME_TO_STATE.get(val)
+    return None
+
+
+class CallStateMonitor:
+    """Bir cihazın arama durumunu tek bir logcat akışından izler"""
+
+    def __init__(self, client: ADBClient, poll_interval: float = 1.0, stream_grace: float = 4.0):
+        self.client = client
+        self.poll_interval = poll_interval
+        self.stream_grace = stream_grace  # Bu süre akıştan olay gelmezse yoklamaya geç
+        self.state: Optional[int] = None
+        self.seq = 0
+        self.stream_events = 0
+        self.polling = False  # akış stream_grace içinde sessiz kaldıysa kalıcı olarak yoklamaya geçilir
+        self._started_at: Optional[float] = None
+        self._cond = threading.Condition()
+        self._proc = None
+
+    def start(self):
+        args = self.client._adb("logcat", "-T", "1", "-v", "brief", "-b", "main", "-b", "system",
+                                "-b", "radio", "-s", *[f"{t}:V" for t in LOGCAT_TAGS])
+        self._proc = self.client.popen(args)
+        self._started_at = time.monotonic()
+        threading.Thread(target=self._reader, daemon=True).start()
+
+    def stop(self):
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+
+    def _reader(self):
+        for line in self._proc.stdout:
+            st = parse_call_state(line)
+            if st is not None:
+                self.stream_events += 1
+                self._set(st)
+
+    def _set(self, st: int):
+        with self._cond:
+            if st != self.state:
+                self.state = st
+                self.seq += 1
+                self._cond.notify_all()
+
+    def mark(self) -> int:
+        """Şu anki olay sırası; wait_for bundan sonraki değişiklikleri bekler"""
+        with self._cond:
+            return self.seq
+
+    def wait_for(self, states: Iterable[int], timeout: float, since: int) -> Optional[int]:
+        """since'ten sonra durum states'ten birine geçene kadar bekle"""
+        states = set(states)
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                if self.seq > since and self.state in states:
+                    return self.state
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(min(remaining, self.poll_interval))
+            # Akış başladığından beri sessizse cihazda süzülmüş tek satırlık yoklama yap;
+            # süre her çağrıda değil izleyici başına bir kez sayılır
+            if not self.polling and self.stream_events == 0 and (
+                    self._started_at is None or time.monotonic() - self._started_at >= self.stream_grace):
+                self.polling = True
+            if self.polling:
+                st = self.client.call_state()
+                if st is not None:
+                    self._set(st)
+
+
+@dataclass
+class CallRecord:
+    ad: str
+    numara: str
+    device: str
+    ok: bool = False
+    result: str = ""  # completed / hung-up / no-connect / dial-failed / error
+    setup_ms: Optional[float] = None  # arama komutundan OFFHOOK'a (hat açıldı)
+    duration_s: Optional[float] = None  # OFFHOOK'tan IDLE'a
+    started_at: float = 0.0
+    error: str = ""
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class AutoDialer:
+    """Kişileri sırayla arar; birden çok cihaz ortak listeden paralel çeker"""
+
+    def __init__(self, adb: ADBClient, devices: List[str], max_call_s: float = 600.0,
+                 connect_timeout_s: float = 20.0, gap_s: float = 2.0,
+                 on_record: Optional[Callable[[CallRecord], None]] = None):
+        if not devices:
+            raise ValueError("En az bir cihaz gerekli")
+        self.adb = adb
+        self.devices = devices
+        self.max_call_s = max_call_s  # Bu süreden uzun görüşmeler kapatılır
+        self.connect_timeout_s = connect_timeout_s
+        self.gap_s = gap_s
+        self.on_record = on_record
+        self.stop_event = threading.Event()
+
+    def _dial_one(self, client: ADBClient, mon: CallStateMonitor, kisi: Kisi) -> CallRecord:
+        rec = CallRecord(ad=kisi.ad, numara=sanitize_number(kisi.numara), device=client.serial or "",
+                         started_at=time.time())
+        # Önceki görüşme hâlâ sürüyorsa bitmesini bekle
+        if mon.state not in (None, IDLE):
+            mon.wait_for({IDLE}, self.max_call_s, mon.mark())
+        since = mon.mark()
+        t0 = time.perf_counter()
+        if not client.call_immediate(kisi.numara):
+            rec.result = "dial-failed"
+            return rec
+        st = mon.wait_for({OFFHOOK}, self.connect_timeout_s, since)
+        if st is None:
+            rec.result = "no-connect"
+            client.end_call()
+            return rec
+        t_off = time.perf_counter()
+        rec.setup_ms = round((t_off - t0) * 1000, 1)
+        st = mon.wait_for({IDLE}, self.max_call_s, mon.mark())
+        rec.duration_s = round(time.perf_counter() - t_off, 2)
+        if st is None:
+            client.end_call()
+            mon.wait_for({IDLE}, 10, mon.mark())
+            rec.result = "hung-up"
+        else:
+            rec.result = "completed"
+        rec.ok = True
+        return rec
+
+    def run(self, kisiler: List[Kisi]) -> List[CallRecord]:
+        q: "queue.Queue[Kisi]" = queue.Queue()
+        for k in kisiler:
+            q.put(k)
+        records: List[CallRecord] = []
+        requeued = set()  # hata sonrası bir kez yeniden kuyruğa konan kişiler (id)
+        lock = threading.Lock()
+
+        def report(rec: CallRecord):
+            with lock:
+                records.append(rec)
+            if self.on_record:
+                self.on_record(rec)
+
+        def worker(serial: str):
+            client = self.adb.for_device(serial)
+            mon = CallStateMonitor(client)
+            try:
+                mon.start()
+            except Exception as e:
+                client.on_log(f"[Arama] {serial}: durum izleme başlatılamadı, cihaz bırakıldı: {e}")
+                return
+            errors = 0
+            try:
+                while not self.stop_event.is_set():
+                    try:
+                        kisi = q.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        rec = self._dial_one(client, mon, kisi)
+                        errors = 0
+                    except Exception as e:
+                        errors += 1
+                        rec = CallRecord(ad=kisi.ad, numara=sanitize_number(kisi.numara), device=serial,
+                                         result="error", error=str(e) or type(e).__name__, started_at=time.time())
+                        try:
+                            client.end_call()
+                        except Exception:
+                            pass
+                        with lock:
+                            retry = id(kisi) not in requeued
+                            requeued.add(id(kisi))
+                        if retry:
+                            q.put(kisi)
+                    report(rec)
+                    if errors >= MAX_WORKER_ERRORS:
+                        client.on_log(f"[Arama] {serial}: üst üste {errors} hata, cihaz bırakıldı "
+                                      f"(son hata: {rec.error})")
+                        return
+                    if self.stop_event.wait(self.gap_s):
+                        return
+            finally:
+                mon.stop()
+
+        threads = [threading.Thread(target=worker, args=(d,), daemon=True) for d in self.devices]
+        for th in threads:
+            th.start()
+        try:
+            while any(th.is_alive() for th in threads):
+                for th in threads:
+                    th.join(0.5)
+        except KeyboardInterrupt:
+            self.stop()
+            for th in threads:
+                th.join()
+        return records
+
+    def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,647 @@
+"""PyPIRT komut satırı arayüzü.
+
+Arayüz açmadan (tkinter/customtkinter/PIL yüklemeden) ADB işlemleri:
+
+    python PyPIRT.py call <isim|numara> [--dialer]
+    python PyPIRT.py sms <isim|numara> [mesaj]
+    python PyPIRT.py launch <paket>
+    python PyPIRT.py screenshot [dosya.png]
+    python PyPIRT.py devices
+    python PyPIRT.py info
+    python PyPIRT.py serve [--port 8765]
+    python PyPIRT.py bulk-sms --etiket is --sablon "Merhaba {ad}" [--checkpoint run.jsonl]
+    python PyPIRT.py autodial --etiket is [--cihazlar a,b] [--rapor arama.json]
+    python PyPIRT.py telemetry --csv telemetri.csv [--aralik 5] [--sure 3600]
+    python PyPIRT.py record [kayit.h264] [--cihazlar a,b] [--sure 600] [--bitrate 8]
+    python PyPIRT.py macro record makro.json [--sure 30]
+    python PyPIRT.py macro play makro.json [--cihazlar a,b] [--hiz 2] [--tekrar 5]
+    python PyPIRT.py apk backup <paket...|--hepsi> [--depo apk_yedek] [--paralel 4]
+    python PyPIRT.py apk restore <paket...|--hepsi> [--cihazlar a,b] [--paralel 4]
+    python PyPIRT.py apk list
+    python PyPIRT.py vdiff files referans.png yeni.png [--cikti fark/]
+    python PyPIRT.py vdiff dirs referans/ yeni/ [--cikti fark/] [--esik 24]
+    python PyPIRT.py vdiff device referans.png [--cihazlar a,b]
+    python PyPIRT.py vdiff fleet [--cihazlar a,b] [--referans a]
+    python PyPIRT.py discover [--ag 192.168.1.0/24] [--port 5555] [--baglan]
+    python PyPIRT.py push yerel.mp4 [daha.zip...] /sdcard/Download/ [--dogrula]
+    python PyPIRT.py pull /sdcard/DCIM/a.jpg [...] yerel_klasor/ [--dogrula]
+    python PyPIRT.py history sync [--cihazlar a,b] [--tur sms,arama]
+    python PyPIRT.py history search <metin|isim|numara> [--tur sms] [--gun 90] [--limit 50]
+    python PyPIRT.py history stats
+    python PyPIRT.py transport
+    python PyPIRT.py bench <paket...> [-n 10] [--kip soguk,sicak] [--cihazlar a,b] [--kaydet acilis.json] [--temel onceki.json]
+    python PyPIRT.py log show [--bas "2026-10-19 14:00" | --satir 120000] [-n 50]
+    python PyPIRT.py log search <metin> [--bas ...] [--bit ...] [--regex] [--limit 100]
+"""
+import argparse
+import datetime
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import pypirt_core
+from pypirt_core import ADBClient, append_log, resolve_hedef
+
+
+def _make_logger(verbose: bool):
+    def on_log(text: str):
+        append_log(text)
+        if verbose:
+            print(text, file=sys.stderr)
+    return on_log
+
+
+def _cmd_call(adb: ADBClient, args) -> bool:
+    ad, numara = resolve_hedef(args.hedef)
+    if args.dialer:
+        ok = adb.call_dialer(numara)
+        print(f"Telefon uygulaması {'açıldı' if ok else 'açılamadı'}: {ad}")
+    else:
+        ok = adb.call_immediate(numara)
+        print(f"Arama {'başlatıldı' if ok else 'başlatılamadı'}: {ad}")
+    return ok
+
+
+def _cmd_sms(adb: ADBClient, args) -> bool:
+    ad, numara = resolve_hedef(args.hedef)
+    ok = adb.open_sms(numara, " ".join(args.mesaj))
+    print(f"SMS ekranı {'açıldı' if ok else 'açılamadı'}: {ad}")
+    return ok
+
+
+def _cmd_launch(adb: ADBClient, args) -> bool:
+    ok = adb.launch_app(args.paket)
+    print(f"{args.paket} açma {'başarılı' if ok else 'başarısız'}")
+    return ok
+
+
+def _cmd_screenshot(adb: ADBClient, args) -> bool:
+    fp = args.dosya or datetime.datetime.now().strftime("PyPIRT_%Y%m%d_%H%M%S.png")
+    ok = adb.screenshot(fp)
+    print(f"Ekran görüntüsü {'alındı' if ok else 'alınamadı'}: {fp}")
+    return ok
+
+
+def _cmd_devices(adb: ADBClient, args) -> bool:
+    devs = adb.devices()
+    for dev in devs:
+        print(dev)
+    return bool(devs)
+
+
+def _cmd_info(adb: ADBClient, args) -> bool:
+    info = adb.get_device_info()
+    if info.error:
+        print(f"Cihaz bilgisi alınamadı: {info.error}")
+        return False
+    print(f"Model: {info.model or '?'}")
+    print(f"Marka: {info.brand or '?'}")
+    print(f"Android: {info.android_version or '?'}")
+    if info.battery_level is not None:
+        print(f"Pil: %{info.battery_level}" + (" (şarj oluyor)" if info.charging else ""))
+    if info.battery_temp is not None:
+        print(f"Pil sıcaklığı: {info.battery_temp:.1f} °C")
+    return True
+
+
+def _cmd_serve(adb: ADBClient, args) -> bool:
+    import asyncio
+    from pypirt_server import DialServer, new_token
+    token = args.token
+    if not token:
+        # Arayüzle aynı token: istemciler her başlatmada yeniden ayarlanmak zorunda kalmaz
+        settings = pypirt_core.load_settings()
+        token = settings.get("http_token")
+        if not token:
+            token = settings["http_token"] = new_token()
+            pypirt_core.save_settings(settings)
+    server = DialServer(adb, port=args.port, token=token)
+    print(f"Tıkla-ara servisi: http://127.0.0.1:{args.port} (durdurmak için Ctrl+C)")
+    print(f"X-PyPIRT-Token: {token}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return True
+
+
+def _cmd_bulk_sms(adb: ADBClient, args) -> bool:
+    from pypirt_core import read_rehber
+    from pypirt_dispatch import SmsDispatcher, expand_jobs
+
+    jobs = expand_jobs(read_rehber(), args.sablon, etiket=args.etiket, secim=args.kisi)
+    if not jobs:
+        print("Seçime uyan kişi yok.", file=sys.stderr)
+        return False
+    devices = args.cihazlar.split(",") if args.cihazlar else ([adb.serial] if adb.serial else adb.devices())
+    print(f"{len(jobs)} mesaj, {len(devices)} cihaz, cihaz başına dakikada {args.hiz:g} mesaj")
+
+    def progress(st):
+        tamam = f"gönderildi {st.sent}" if args.gonder else f"açıldı {st.opened}"
+        print(f"\r{st.sent + st.opened + st.failed + st.skipped}/{st.total} ({tamam}, başarısız {st.failed})",
+              end="", flush=True)
+
+    dispatcher = SmsDispatcher(adb, devices, rate_per_min=args.hiz, burst=args.burst,
+                               max_retries=args.tekrar, gonder=args.gonder, on_progress=progress)
+    stats = dispatcher.run(jobs, checkpoint_path=Path(args.checkpoint) if args.checkpoint else None)
+    print()
+    print(json.dumps(stats.to_dict(), ensure_ascii=False))
+    return stats.failed == 0
+
+
+def _cmd_autodial(adb: ADBClient, args) -> bool:
+    from pypirt_core import read_rehber
+    from pypirt_autodial import AutoDialer
+
+    etiket = (args.etiket or "").lower()
+    secilen = {k.lower() for k in args.kisi} if args.kisi else None
+    kisiler = [k for k in read_rehber()
+               if (not etiket or etiket in [t.lower() for t in k.etiketler])
+               and (secilen is None or k.ad.lower() in secilen or k.numara in secilen)]
+    if not kisiler:
+        print("Seçime uyan kişi yok.", file=sys.stderr)
+        return False
+    devices = args.cihazlar.split(",") if args.cihazlar else ([adb.serial] if adb.serial else adb.devices())
+    print(f"{len(kisiler)} kişi, {len(devices)} cihaz")
+
+    def on_record(rec):
+        setup = f"{rec.setup_ms:.0f} ms" if rec.setup_ms is not None else "-"
+        sure = f"{rec.duration_s:.1f} s" if rec.duration_s is not None else "-"
+        hata = f" ({rec.error})" if rec.error else ""
+        print(f"[{rec.device}] {rec.ad} ({rec.numara}): {rec.result}{hata}, kurulum {setup}, süre {sure}")
+
+    dialer = AutoDialer(adb, devices, max_call_s=args.sure, connect_timeout_s=args.bekle_baglanti,
+                        gap_s=args.ara, on_record=on_record)
+    records = dialer.run(kisiler)
+    if args.rapor:
+        Path(args.rapor).write_text(json.dumps([r.to_dict() for r in records], ensure_ascii=False, indent=2), encoding="utf-8")
+    return all(r.ok for r in records)
+
+
+def _cmd_telemetry(adb: ADBClient, args) -> bool:
+    import time
+    from pypirt_telemetry import METRICS, TelemetrySampler
+
+    devices = args.cihazlar.split(",") if args.cihazlar else ([adb.serial] if adb.serial else adb.devices())
+    sampler = TelemetrySampler(adb, devices, interval=args.aralik)
+    sampler.start()
+    print(f"{len(devices)} cihaz örnekleniyor (durdurmak için Ctrl+C)")
+    t_end = time.monotonic() + args.sure if args.sure else None
+    try:
+        while t_end is None or time.monotonic() < t_end:
+            time.sleep(args.aralik)
+            for d in devices:
+                vals = {m: sampler.latest(d, m) for m in METRICS}
+                print(d, " ".join(f"{m}={v:g}" for m, v in vals.items() if v is not None))
+    except KeyboardInterrupt:
+        pass
+    sampler.stop()
+    rows = sampler.export_csv(Path(args.csv))
+    print(f"{rows} satır yazıldı: {args.csv}")
+    return True
+
+
+def _cmd_record(adb: ADBClient, args) -> bool:
+    import time
+    from pypirt_record import ScreenRecorder, default_path, record_many
+
+    opts = dict(bit_rate_mbps=args.bitrate, size=args.boyut, segment_s=args.parca, max_s=args.sure)
+    if args.cihazlar:
+        recorders = record_many(adb, args.cihazlar.split(","), **opts)
+    else:
+        rec = ScreenRecorder(adb, Path(args.dosya) if args.dosya else default_path(adb.serial or ""), **opts)
+        rec.start()
+        recorders = {adb.serial or "": rec}
+    print(f"{len(recorders)} cihaz kaydediliyor (durdurmak için Ctrl+C)")
+    try:
+        while any(r.running for r in recorders.values()):
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        for r in recorders.values():
+            r.stop()
+    ok = True
+    for r in recorders.values():
+        st = r.wait()
+        print(json.dumps(st.to_dict(), ensure_ascii=False))
+        ok = ok and st.segments > 0 and not st.error
+    return ok
+
+
+def _cmd_macro(adb: ADBClient, args) -> bool:
+    import time
+    from pypirt_macro import Macro, MacroRecorder, play_many
+
+    if args.islem == "record":
+        rec = MacroRecorder(adb)
+        rec.start()
+        print("Cihazda dokunma/tuş olayları kaydediliyor (bitirmek için Ctrl+C)")
+        try:
+            t_end = time.monotonic() + args.sure if args.sure else None
+            while t_end is None or time.monotonic() < t_end:
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            pass
+        macro = rec.stop()
+        macro.save(Path(args.dosya))
+        print(f"{len(macro.steps)} olay, {macro.duration:.2f} sn kaydedildi: {args.dosya}")
+        return bool(macro.steps)
+
+    if args.hiz <= 0:
+        print("--hiz pozitif olmalı.", file=sys.stderr)
+        return False
+    macro = Macro.load(Path(args.dosya))
+    devices = args.cihazlar.split(",") if args.cihazlar else [adb.serial or ""]
+    results = play_many(adb, devices, macro, speed=args.hiz, repeat=args.tekrar)
+    for r in results:
+        print(json.dumps(r.to_dict(), ensure_ascii=False))
+    return all(r.ok for r in results)
+
+
+def _cmd_apk(adb: ADBClient, args) -> bool:
+    from pypirt_apk import ApkStore, backup, restore
+
+    store = ApkStore(Path(args.depo) if args.depo else None)
+    if args.islem == "list":
+        for pkg in store.packages():
+            bk = store.latest(pkg)
+            size = sum(p.size for p in bk.parts) if bk else 0
+            print(f"{pkg}\tversionCode={bk.version_code if bk else '?'}\t{len(bk.parts) if bk else 0} parça\t"
+                  f"{size / 2 ** 20:.1f} MB")
+        return True
+
+    if args.islem == "backup":
+        pkgs = args.paketler or ([p["package"] for p in adb.list_packages()] if args.hepsi else [])
+        if not pkgs:
+            print("Paket verin veya --hepsi kullanın", file=sys.stderr)
+            return False
+        results = backup(adb, pkgs, store, workers=args.paralel,
+                         on_result=lambda r: print(json.dumps(r.to_dict(), ensure_ascii=False)))
+        return all(r.ok for r in results)
+
+    pkgs = args.paketler or (store.packages() if args.hepsi else [])
+    if not pkgs:
+        print("Paket verin veya --hepsi kullanın", file=sys.stderr)
+        return False
+    devices = args.cihazlar.split(",") if args.cihazlar else ([adb.serial] if adb.serial else adb.devices())
+    results = restore(adb, devices, pkgs, store, max_parallel=args.paralel,
+                      on_progress=lambda prog, r: print(f"{prog.device} {prog.done}/{prog.total} {r.package}: "
+                                                        f"{'kuruldu' if r.ok else r.error} ({r.ms:.0f} ms)"))
+    for prog in results:
+        print(json.dumps({"device": prog.device, "total": prog.total, "failed": prog.failed, "ms": prog.ms},
+                         ensure_ascii=False))
+    return all(prog.failed == 0 for prog in results)
+
+
+def _cmd_vdiff(adb: ADBClient, args) -> bool:
+    from pypirt_vdiff import compare_device, compare_dirs, compare_files, compare_fleet, write_report
+
+    out = Path(args.cikti) if args.cikti else None
+    opts = dict(threshold=args.esik, block=args.blok, tolerance=args.tolerans)
+    if args.islem in ("files", "dirs"):
+        if len(args.yollar) != 2:
+            print("İki yol verin: referans ve karşılaştırılacak", file=sys.stderr)
+            return False
+        a, b = (Path(y) for y in args.yollar)
+        if args.islem == "files":
+            results = [compare_files(a, b, out, **opts)]
+        else:
+            results = compare_dirs(a, b, out, workers=args.paralel, **opts)
+    else:
+        devices = args.cihazlar.split(",") if args.cihazlar else ([adb.serial] if adb.serial else adb.devices())
+        if args.islem == "device":
+            if len(args.yollar) != 1:
+                print("Referans görüntüyü verin", file=sys.stderr)
+                return False
+            results = [compare_device(adb.for_device(d), Path(args.yollar[0]), out, **opts) for d in devices]
+        else:
+            if len(devices) < 2:
+                print("Filo karşılaştırması için en az iki cihaz gerekli", file=sys.stderr)
+                return False
+            results = compare_fleet(adb, devices, args.referans, out, **opts)
+    for r in results:
+        print(json.dumps(r.to_dict(), ensure_ascii=False))
+    if out is not None:
+        out.mkdir(parents=True, exist_ok=True)
+        write_report(results, out / "rapor.json")
+    return not any(r.different for r in results)
+
+
+def _cmd_discover(adb: ADBClient, args) -> bool:
+    from pypirt_discover import connect_all, discover
+
+    ports = [int(p) for p in args.port.split(",")]
+    found = discover(adb, network=args.ag, ports=ports, timeout=args.zaman_asimi, mdns_timeout=args.mdns_sure,
+                     use_mdns=not args.mdns_yok, use_sweep=not args.tarama_yok)
+    if args.baglan:
+        found = connect_all(adb, found)
+    for f in found:
+        print(json.dumps(f.to_dict(), ensure_ascii=False))
+    if not found:
+        print("Cihaz bulunamadı", file=sys.stderr)
+    return bool(found) and (not args.baglan or any(f.connected for f in found))
+
+
+def _cmd_transfer(adb: ADBClient, args) -> bool:
+    from pypirt_verify import transfer
+
+    if len(args.yollar) < 2:
+        print("Kaynak(lar) ve hedef verin", file=sys.stderr)
+        return False
+    *sources, dest = args.yollar
+    if len(sources) > 1 and args.komut == "pull" and not Path(dest).is_dir():
+        print(f"Birden çok dosya için hedef klasör olmalı: {dest}", file=sys.stderr)
+        return False
+    if len(sources) > 1 and args.komut == "push" and not dest.endswith("/"):
+        dest += "/"
+    checks = transfer(adb, args.komut, [(src, dest) for src in sources], verify=args.dogrula,
+                      on_result=lambda c: print(json.dumps(c.to_dict(), ensure_ascii=False)))
+    return all(c.ok for c in checks)
+
+
+def _cmd_history(adb: ADBClient, args) -> bool:
+    from pypirt_history import HistoryStore, sync
+
+    store = HistoryStore(Path(args.db) if args.db else None)
+    try:
+        if args.islem == "sync":
+            kinds = args.tur.split(",") if args.tur else ("sms", "arama")
+            devices = args.cihazlar.split(",") if args.cihazlar else ([adb.serial] if adb.serial else adb.devices())
+            ok = True
+            for d in devices:
+                try:
+                    added = sync(adb.for_device(d), store, kinds)
+                    print(json.dumps({"device": d, "yeni": added}, ensure_ascii=False))
+                except Exception as e:
+                    print(f"{d}: {e}", file=sys.stderr)
+                    ok = False
+            return ok and bool(devices)
+        if args.islem == "stats":
+            for row in store.stats():
+                print(json.dumps(row, ensure_ascii=False))
+            return True
+        since = int((datetime.datetime.now() - datetime.timedelta(days=args.gun)).timestamp() * 1000) if args.gun else None
+        records = store.search(" ".join(args.sorgu), pypirt_core.read_rehber(), kind=args.tur, since_ms=since,
+                               limit=args.limit)
+        for r in records:
+            print(json.dumps(r.to_dict(), ensure_ascii=False))
+        return bool(records)
+    finally:
+        store.close()
+
+
+def _cmd_log(adb: ADBClient, args) -> bool:
+    from pypirt_logview import LogIndex, parse_time
+
+    index = LogIndex(Path(args.dosya) if args.dosya else None)
+    try:
+        index.refresh()
+        since = parse_time(args.bas) if args.bas else None
+        until = parse_time(args.bit) if args.bit else None
+        if args.islem == "search":
+            hits = 0
+            for hit in index.search(" ".join(args.metin), since, until, regex=args.regex, limit=args.limit):
+                print(f"{hit.line}: {hit.text}")
+                hits += 1
+            return hits > 0
+        if args.satir:
+            start = index.offset_for_line(args.satir)
+        elif since is not None:
+            start = index.offset_for_time(since)
+        else:
+            start = index.back(index.size, args.n)  # varsayılan: son satırlar
+        first = index.line_at(start) if index.size else 0
+        for i, (_, text) in enumerate(index.lines(start, args.n)):
+            print(f"{first + i}: {text}")
+        return True
+    finally:
+        index.close()
+
+
+def _cmd_transport(adb: ADBClient, args) -> bool:
+    from pypirt_transport import probe_all, router, summary
+
+    transports = probe_all(adb, args.seriler or None)
+    for row in summary(router.groups()):
+        print(json.dumps(row, ensure_ascii=False))
+    for t in transports:
+        if not t.alive:
+            print(f"{t.serial}: {t.error or 'yanıt yok'}", file=sys.stderr)
+    return any(t.alive for t in transports)
+
+
+def _cmd_bench(adb: ADBClient, args) -> bool:
+    from pypirt_launch import MODES, benchmark, compare, load_summary, save_summary, summarize
+
+    modes = args.kip.split(",")
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        print(f"Bilinmeyen kip: {', '.join(unknown)} (seçenekler: {', '.join(MODES)})", file=sys.stderr)
+        return False
+    devices = args.cihazlar.split(",") if args.cihazlar else ([adb.serial] if adb.serial else adb.devices())
+
+    def progress(r):
+        took = f"{r.total_ms} ms" if r.ok else r.error
+        print(f"{r.device} {r.package} {r.mode} #{r.run}: {took}", file=sys.stderr)
+
+    rows = summarize(benchmark(adb, devices, args.paketler, runs=args.n, modes=modes, on_result=progress))
+    for row in rows:
+        print(json.dumps(row, ensure_ascii=False))
+    if args.kaydet:
+        save_summary(rows, Path(args.kaydet))
+    ok = any("p50" in row for row in rows)
+    if args.temel:
+        for reg in compare(rows, load_summary(Path(args.temel)), args.tolerans):
+            change = f"%{reg['change_pct']:+g}" if reg["change_pct"] is not None else "açılamadı"
+            print(f"Gerileme: {reg['device']} {reg['package']} {reg['mode']}: "
+                  f"p50 {reg.get('p50', '-')} ms (önce {reg['baseline_p50']} ms, {change})", file=sys.stderr)
+            ok = False
+    return ok
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="PyPIRT.py", description="PyPIRT komut satırı (arayüzsüz ADB işlemleri)")
+    parser.add_argument("-s", "--serial", help="Hedef cihaz (adb -s)")
+    parser.add_argument("--connect", metavar="IP:PORT", help="Komuttan önce Wi-Fi ADB bağlantısı kur")
+    parser.add_argument("--rehber", metavar="JSON", help="Kullanılacak rehber dosyası (varsayılan: rehber.json)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="adb komutlarını ve çıktılarını stderr'e yaz")
+    sub = parser.add_subparsers(dest="komut", required=True)
+
+    p = sub.add_parser("call", help="Kişiyi veya numarayı ara")
+    p.add_argument("hedef", help="Rehberdeki isim veya telefon numarası")
+    p.add_argument("--dialer", action="store_true", help="Hemen aramak yerine telefon uygulamasında aç")
+    p.set_defaults(func=_cmd_call)
+
+    p = sub.add_parser("sms", help="SMS ekranını önceden yazılmış mesajla aç")
+    p.add_argument("hedef", help="Rehberdeki isim veya telefon numarası")
+    p.add_argument("mesaj", nargs="*", help="SMS metni")
+    p.set_defaults(func=_cmd_sms)
+
+    p = sub.add_parser("launch", help="Uygulama başlat")
+    p.add_argument("paket", help="Paket adı (örn: com.whatsapp)")
+    p.set_defaults(func=_cmd_launch)
+
+    p = sub.add_parser("screenshot", help="Ekran görüntüsü al")
+    p.add_argument("dosya", nargs="?", help="Kaydedilecek PNG dosyası")
+    p.set_defaults(func=_cmd_screenshot)
+
+    p = sub.add_parser("devices", help="Bağlı cihazları listele")
+    p.set_defaults(func=_cmd_devices)
+
+    p = sub.add_parser("info", help="Cihaz bilgilerini göster")
+    p.set_defaults(func=_cmd_info)
+
+    p = sub.add_parser("serve", help="Yerel tıkla-ara HTTP servisini başlat")
+    p.add_argument("--port", type=int, default=8765, help="Dinlenecek port (varsayılan: 8765)")
+    p.add_argument("--token", help="İsteklerde beklenen X-PyPIRT-Token başlığı (varsayılan: ayarlardaki http_token, yoksa üretilir)")
+    p.set_defaults(func=_cmd_serve)
+
+    p = sub.add_parser("bulk-sms", help="Etiket veya seçime şablonlu SMS'i cihazlara dağıtarak gönder")
+    p.add_argument("--etiket", help="Bu etikete sahip kişiler")
+    p.add_argument("--kisi", action="append", help="İsim veya numara (birden çok kez verilebilir)")
+    p.add_argument("--sablon", required=True, help="Mesaj şablonu; {ad}, {numara}, {etiketler} kullanılabilir")
+    p.add_argument("--cihazlar", help="Virgülle ayrılmış cihaz listesi (varsayılan: tüm bağlı cihazlar)")
+    p.add_argument("--hiz", type=float, default=6.0, help="Cihaz başına dakikada mesaj (varsayılan: 6)")
+    p.add_argument("--burst", type=int, default=1, help="Token bucket kapasitesi (varsayılan: 1)")
+    p.add_argument("--tekrar", type=int, default=2, help="Başarısız iş için tekrar deneme sayısı")
+    p.add_argument("--checkpoint", help="İlerleme dosyası (JSONL); aynı dosyayla yeniden çalıştırınca devam eder")
+    p.add_argument("--gonder", action="store_true", help="Ekranı açmakla kalmayıp gönder tuşuna da bas")
+    p.set_defaults(func=_cmd_bulk_sms)
+
+    p = sub.add_parser("autodial", help="Kişileri sırayla ara, her arama bir öncekinin bitmesini bekler")
+    p.add_argument("--etiket", help="Bu etikete sahip kişiler")
+    p.add_argument("--kisi", action="append", help="İsim veya numara (birden çok kez verilebilir)")
+    p.add_argument("--cihazlar", help="Virgülle ayrılmış cihaz listesi (varsayılan: tüm bağlı cihazlar)")
+    p.add_argument("--sure", type=float, default=600, help="En uzun görüşme süresi, saniye (sonra kapatılır)")
+    p.add_argument("--bekle-baglanti", type=float, default=20, help="Aramanın başlaması için beklenecek süre, saniye")
+    p.add_argument("--ara", type=float, default=2, help="Aramalar arası bekleme, saniye")
+    p.add_argument("--rapor", help="Arama başına zamanlamaların yazılacağı JSON dosyası")
+    p.set_defaults(func=_cmd_autodial)
+
+    p = sub.add_parser("telemetry", help="Pil, CPU, bellek ve Wi-Fi telemetrisini örnekle ve CSV'ye yaz")
+    p.add_argument("--csv", required=True, help="Çıkış CSV dosyası")
+    p.add_argument("--cihazlar", help="Virgülle ayrılmış cihaz listesi (varsayılan: tüm bağlı cihazlar)")
+    p.add_argument("--aralik", type=float, default=5, help="Örnekleme aralığı, saniye (varsayılan: 5)")
+    p.add_argument("--sure", type=float, help="Toplam süre, saniye (verilmezse Ctrl+C'ye kadar)")
+    p.set_defaults(func=_cmd_telemetry)
+
+    p = sub.add_parser("record", help="Ekranı cihazda dosya oluşturmadan yerel H.264 dosyasına kaydet")
+    p.add_argument("dosya", nargs="?", help="Çıkış dosyası (tek cihaz; varsayılan: kayit_<cihaz>_<zaman>.h264)")
+    p.add_argument("--cihazlar", help="Virgülle ayrılmış cihaz listesi; her cihaz kendi dosyasına kaydedilir")
+    p.add_argument("--sure", type=float, help="Toplam süre, saniye (verilmezse Ctrl+C'ye kadar)")
+    p.add_argument("--bitrate", type=float, help="Video bit hızı, Mbps (varsayılan: cihazınki)")
+    p.add_argument("--boyut", help="Çözünürlük, GENxYÜK (örn: 1280x720)")
+    p.add_argument("--parca", type=int, default=180, help="Parça süresi, saniye (cihaz sınırı 180)")
+    p.set_defaults(func=_cmd_record)
+
+    p = sub.add_parser("macro", help="Giriş makrosu kaydet veya tek kabuk oturumunda oynat")
+    p.add_argument("islem", choices=["record", "play"], help="record: cihazdan kaydet, play: oynat")
+    p.add_argument("dosya", help="Makro dosyası (JSON)")
+    p.add_argument("--sure", type=float, help="record: kayıt süresi, saniye (verilmezse Ctrl+C'ye kadar)")
+    p.add_argument("--cihazlar", help="play: virgülle ayrılmış cihaz listesi, paralel oynatılır")
+    p.add_argument("--hiz", type=float, default=1.0, help="play: oynatma hızı çarpanı (varsayılan: 1)")
+    p.add_argument("--tekrar", type=int, default=1, help="play: tekrar sayısı")
+    p.set_defaults(func=_cmd_macro)
+
+    p = sub.add_parser("apk", help="APK'ları içerik özetli depoya yedekle veya cihazlara geri yükle")
+    p.add_argument("islem", choices=["backup", "restore", "list"])
+    p.add_argument("paketler", nargs="*", help="Paket adları")
+    p.add_argument("--hepsi", action="store_true", help="backup: tüm kullanıcı uygulamaları, restore: depodaki tüm paketler")
+    p.add_argument("--depo", help="Yedek deposu klasörü (varsayılan: apk_yedek)")
+    p.add_argument("--cihazlar", help="restore: virgülle ayrılmış cihaz listesi (varsayılan: tüm bağlı cihazlar)")
+    p.add_argument("--paralel", type=int, default=4, help="Aynı anda çekilen paket / kurulum yapılan cihaz sayısı")
+    p.set_defaults(func=_cmd_apk)
+
+    p = sub.add_parser("vdiff", help="Ekran görüntülerini karşılaştır; fark varsa çıkış kodu 1")
+    p.add_argument("islem", choices=["files", "dirs", "device", "fleet"],
+                   help="files/dirs: iki dosya/klasör, device: cihaz ekranı ile referans, fleet: cihazlar arası")
+    p.add_argument("yollar", nargs="*", help="files/dirs: referans ve yeni; device: referans görüntü")
+    p.add_argument("--cikti", help="Vurgulu fark PNG'leri ve rapor.json için klasör")
+    p.add_argument("--esik", type=int, default=24, help="Piksel değişti sayılacak kanal farkı, 0-255 (varsayılan: 24)")
+    p.add_argument("--blok", type=int, default=16, help="Bölge kutuları için hücre boyu, piksel (varsayılan: 16)")
+    p.add_argument("--tolerans", type=float, default=0.001, help="Farklı sayılmak için değişen piksel oranı")
+    p.add_argument("--cihazlar", help="device/fleet: virgülle ayrılmış cihaz listesi (varsayılan: tüm bağlı cihazlar)")
+    p.add_argument("--referans", help="fleet: referans cihaz (varsayılan: listedeki ilk cihaz)")
+    p.add_argument("--paralel", type=int, default=4, help="dirs: aynı anda karşılaştırılan dosya sayısı")
+    p.set_defaults(func=_cmd_vdiff)
+
+    p = sub.add_parser("discover", help="Ağdaki kablosuz hata ayıklama cihazlarını mDNS ve alt ağ taramasıyla bul")
+    p.add_argument("--ag", help="Taranacak ağ, CIDR (varsayılan: yerel adresin /24'ü)")
+    p.add_argument("--port", default="5555", help="Taramada yoklanacak portlar, virgülle (varsayılan: 5555)")
+    p.add_argument("--zaman-asimi", type=float, default=0.5, help="Adres başına zaman aşımı, saniye (varsayılan: 0.5)")
+    p.add_argument("--mdns-sure", type=float, default=2.0, help="mDNS yanıtlarının bekleneceği süre, saniye")
+    p.add_argument("--mdns-yok", action="store_true", help="mDNS sorgusu yapma")
+    p.add_argument("--tarama-yok", action="store_true", help="Alt ağ taraması yapma")
+    p.add_argument("--baglan", action="store_true", help="Bulunan cihazlara paralel adb connect yap")
+    p.set_defaults(func=_cmd_discover)
+
+    p = sub.add_parser("push", help="Dosyaları cihaza gönder; --dogrula ile özetleri karşılaştır")
+    p.add_argument("yollar", nargs="+", help="Yerel dosya(lar) ve en sonda cihazdaki hedef yol/klasör")
+    p.add_argument("--dogrula", action="store_true", help="Cihazda ve bilgisayarda sha256 (yoksa md5) özetlerini karşılaştır")
+    p.set_defaults(func=_cmd_transfer)
+
+    p = sub.add_parser("pull", help="Dosyaları cihazdan al; --dogrula ile özetleri karşılaştır")
+    p.add_argument("yollar", nargs="+", help="Cihazdaki dosya(lar) ve en sonda yerel hedef yol/klasör")
+    p.add_argument("--dogrula", action="store_true", help="Cihazda ve bilgisayarda sha256 (yoksa md5) özetlerini karşılaştır")
+    p.set_defaults(func=_cmd_transfer)
+
+    p = sub.add_parser("history", help="SMS ve arama geçmişini yerel veritabanına eşitle ve ara")
+    p.add_argument("islem", choices=["sync", "search", "stats"])
+    p.add_argument("sorgu", nargs="*", help="search: metin, kişi adı veya numara (boşsa en yeniler)")
+    p.add_argument("--tur", help="sync: virgülle sms,arama; search: sms veya arama")
+    p.add_argument("--cihazlar", help="sync: virgülle ayrılmış cihaz listesi (varsayılan: tüm bağlı cihazlar)")
+    p.add_argument("--gun", type=int, help="search: yalnızca son N gün")
+    p.add_argument("--limit", type=int, default=50, help="search: en fazla sonuç (varsayılan: 50)")
+    p.add_argument("--db", help="Veritabanı dosyası (varsayılan: gecmis.db)")
+    p.set_defaults(func=_cmd_history)
+
+    p = sub.add_parser("log", help="Büyük PyPIRT.log dosyasında zamana/satıra git ve ara (dosyayı belleğe yüklemez)")
+    p.add_argument("islem", choices=["show", "search"])
+    p.add_argument("metin", nargs="*", help="search: aranacak metin")
+    p.add_argument("--bas", help="Başlangıç zamanı (2026-10-19 14:00, 2026-10-19 ya da 14:00)")
+    p.add_argument("--bit", help="search: bitiş zamanı")
+    p.add_argument("--satir", type=int, help="show: bu satırdan başla")
+    p.add_argument("-n", type=int, default=50, help="show: gösterilecek satır (varsayılan: 50)")
+    p.add_argument("--regex", action="store_true", help="search: metni düzenli ifade olarak kullan (bayt düzeyinde)")
+    p.add_argument("--limit", type=int, default=100, help="search: en fazla sonuç (varsayılan: 100)")
+    p.add_argument("--dosya", help="Log dosyası (varsayılan: PyPIRT.log)")
+    p.set_defaults(func=_cmd_log)
+
+    p = sub.add_parser("transport", help="Her cihazın USB/Wi-Fi yollarını ölç; komutlar en uygun yoldan gider")
+    p.add_argument("seriler", nargs="*", help="Ölçülecek adb seri numaraları (varsayılan: adb devices)")
+    p.set_defaults(func=_cmd_transport)
+
+    p = sub.add_parser("bench", help="Uygulama açılış sürelerini (am start -W) soğuk/sıcak ölç ve dağılımı yaz")
+    p.add_argument("paketler", nargs="+", help="Ölçülecek paketler")
+    p.add_argument("-n", type=int, default=5, help="Kip başına açılış sayısı (varsayılan: 5)")
+    p.add_argument("--kip", default="soguk,sicak", help="soguk, sicak ya da ikisi (varsayılan: soguk,sicak)")
+    p.add_argument("--cihazlar", help="Virgülle ayrılmış seri numaraları (varsayılan: tüm bağlı cihazlar)")
+    p.add_argument("--kaydet", help="Özeti JSON olarak bu dosyaya yaz (sonraki koşuda --temel olarak verilir)")
+    p.add_argument("--temel", help="Önceki özet; p50'si --tolerans'tan fazla artan açılışlar hata sayılır")
+    p.add_argument("--tolerans", type=float, default=15.0, help="İzin verilen p50 artışı, %% (varsayılan: 15)")
+    p.set_defaults(func=_cmd_bench)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.rehber:
+        pypirt_core.REHBER_PATH = Path(args.rehber)
+
+    adb = ADBClient(_make_logger(args.verbose), serial=args.serial)
+    try:
+        if args.connect and not adb.connect(args.connect):
+            print(f"Bağlantı kurulamadı: {args.connect}", file=sys.stderr)
+            return 1
+        return 0 if args.func(adb, args) else 1
+    except LookupError as e:
+        print(e, file=sys.stderr)
+        return 2
+    except Exception as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
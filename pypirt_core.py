@@ -0,0 +1,652 @@
+"""PyPIRT model ve ADB katmanı.
+
+Bu modül tkinter, customtkinter veya PIL içe aktarmaz; böylece arayüz,
+komut satırı (pypirt_cli) ve betikler aynı kişi deposunu ve ADB
+istemcisini paylaşabilir.
+"""
+import hashlib
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Callable, List, Optional, Dict, Tuple
+import re
+import datetime
+import os
+import shlex
+
+from pypirt_dumpsys import AppInfo, DeviceInfo, app_info as dumpsys_app_info, device_info as dumpsys_device_info
+from pypirt_health import OPEN as HEALTH_OPEN, command_kind, registry as health_registry
+from pypirt_transport import router as transport_router
+
+
+APP_NAME = "PyPIRT"
+DATA_DIR = Path(".")
+REHBER_PATH = DATA_DIR / "rehber.json"
+SETTINGS_PATH = DATA_DIR / "PyPIRT.settings.json"
+LOG_PATH = DATA_DIR / "PyPIRT.log"
+
+
+# ---------- Models ----------
+
+# Python 3.10+ üzerinde kişiler __dict__ taşımaz (büyük rehberlerde bellek)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class Kisi:
+    ad: str
+    numara: str
+    etiketler: List[str] = field(default_factory=list)
+    favori: bool = False
+    profil_foto: Optional[str] = None  # Yeni alan
+
+    def __post_init__(self):
+        # Aynı etiket metni binlerce kişide tek nesne olarak tutulur
+        self.etiketler = [sys.intern(t) for t in self.etiketler]
+
+
+# ---------- ADB Yardımcı ----------
+
+
+class ADBClient:
+    def __init__(self, on_log, serial: Optional[str] = None):
+        self.connected = False
+        self.target = ""  # ip:port
+        self.serial = serial  # adb -s; None ise adb'nin seçtiği cihaz
+        self.on_log = on_log
+
+    def for_device(self, serial: str) -> "ADBClient":
+        """Aynı log çıkışını kullanan, belirli bir cihaza bağlı istemci"""
+        client = ADBClient(self.on_log, serial=serial)
+        client.connected = True
+        client.target = serial
+        return client
+
+    def _adb(self, *args: str) -> List[str]:
+        """Cihaza yönelik adb komutu (serial varsa -s ile)"""
+        cmd = ["adb"]
+        if self.serial:
+            cmd += ["-s", self.serial]
+        return cmd + list(args)
+
+    def _run(self, args: List[str], timeout: Optional[int] = 15, quiet: bool = False) -> subprocess.CompletedProcess:
+        """adb komutunu çalıştır; quiet=True ise (sık yoklamalar için) loglama yapma.
+
+        Cihaza giden komutlarda zaman aşımı cihazın geçmiş sürelerine göre
+        kısalabilir; cihaz art arda zaman aşımına uğramışsa komut hiç
+        çalıştırılmadan DeviceUnavailable fırlatılır (bkz. pypirt_health).
+        Cihaz birden çok yoldan (USB/Wi-Fi) bağlıysa komut en uygun yola
+        gider; yol kaybolmuşsa bir sonrakinde yeniden denenir (bkz.
+        pypirt_transport).
+        """
+        on_log = (lambda text: None) if quiet else self.on_log
+        requested, requested_timeout = args, timeout
+        args = transport_router.reroute(args)
+        health = health_registry.for_command(args, self.serial or self.target or "")
+        kind = ""
+        if health is not None:
+            health.check(args)
+            kind = command_kind(args)
+            timeout = health.timeout_for(kind, timeout)
+        t0 = time.monotonic()
+        try:
+            on_log(f"$ {' '.join(args)}")
+            # Unicode sorununu çözmek için encoding parametresi ekle
+            cp = subprocess.run(
+                args, 
+                stdout=subprocess.PIPE, 
+                stderr=subprocess.STDOUT, 
+                timeout=timeout, 
+                text=True,
+                encoding='utf-8',
+                errors='replace'  # Decode edilemeyen karakterleri ? ile değiştir
+            )
+            if health is not None:
+                health.record(kind, time.monotonic() - t0, sample=cp.returncode == 0)
+            if cp.returncode != 0 and transport_router.lost(args, cp.stdout):
+                self.on_log(f"Bağlantı yolu kayboldu ({args[2]}); komut başka yoldan yeniden deneniyor.")
+                return self._run(requested, requested_timeout, quiet)
+            out = (cp.stdout or "").strip()
+            if out:
+                on_log(out)
+            return cp
+        except subprocess.TimeoutExpired:
+            self.on_log(f"Komut zaman aşımına uğradı ({timeout} sn).")
+            if health is not None:
+                health.timed_out()
+                if health.state == HEALTH_OPEN:
+                    self.on_log(f"Cihaz yanıt vermiyor ({health.device}); komutlar bağlantı dönene kadar beklemeden düşecek.")
+            raise
+        except FileNotFoundError:
+            self.on_log("Hata: 'adb' bulunamadı. Lütfen Android Platform Tools kurulu ve PATH'te olsun.")
+            raise
+        except UnicodeDecodeError as e:
+            self.on_log(f"Karakter kodlama hatası: {e}")
+            # Fallback: binary mode ile çalıştır
+            try:
+                cp = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=timeout)
+                out = cp.stdout.decode('utf-8', errors='replace').strip()
+                if out:
+                    on_log(out)
+                return cp
+            except Exception as fallback_e:
+                self.on_log(f"Fallback da başarısız: {fallback_e}")
+                raise
+
+    def popen(self, args: List[str], binary: bool = False) -> subprocess.Popen:
+        """Uzun süren/akış komutları için (logcat, screenrecord...) stdout'u borulu süreç başlat"""
+        args = transport_router.reroute(args)
+        health = health_registry.for_command(args, self.serial or self.target or "")
+        if health is not None:
+            health.check(args)
+        self.on_log(f"$ {' '.join(args)}")
+        if binary:
+            return subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+        return subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL,
+                                text=True, encoding="utf-8", errors="replace", bufsize=1)
+
+    def version(self) -> str:
+        cp = self._run(["adb", "version"])
+        return cp.stdout.strip()
+
+    def connect(self, target: str) -> bool:
+        self.target = target.strip()
+        if not self.target:
+            self.on_log("IP:Port boş olamaz.")
+            return False
+        cp = self._run(["adb", "connect", self.target])
+        ok = ("connected to" in cp.stdout) or ("already connected to" in cp.stdout)
+        self.connected = ok
+        return ok
+
+    def disconnect(self) -> None:
+        if self.target:
+            transport_router.forget(self.target)
+            self._run(["adb", "disconnect", self.target])
+        else:
+            self._run(["adb", "disconnect"])
+        self.connected = False
+
+    def devices(self) -> List[str]:
+        cp = self._run(["adb", "devices"])
+        lines = (cp.stdout or "").splitlines()
+        devs = []
+        for ln in lines[1:]:
+            if not ln.strip():
+                continue  # cihazId\tstatus
+            parts = ln.split("\t")
+            if len(parts) >= 2 and parts[1].strip() == "device":
+                devs.append(parts[0].strip())
+        return devs
+
+    def device_model(self) -> Optional[str]:
+        try:
+            cp = self._run(self._adb("shell", "getprop", "ro.product.model"))
+            model = (cp.stdout or "").strip().splitlines()[-1].strip()
+            return model if model else None
+        except Exception:
+            return None
+
+    def _shell_am(self, args: List[str]) -> bool:
+        # adb argümanları birleştirip cihaz kabuğunda yeniden böler: her argüman tırnaklanmazsa
+        # boşluklu bir SMS metni ayrı am argümanlarına bölünür, ; ve $(...) komut olarak çalışır
+        cp = self._run(self._adb("shell", "am " + " ".join(shlex.quote(str(a)) for a in args)))
+        return "Error" not in (cp.stdout or "")
+
+    def call_immediate(self, number: str) -> bool:
+        number = sanitize_number(number)
+        return self._shell_am(["start", "-a", "android.intent.action.CALL", "-d", f"tel:{number}"])
+
+    def call_dialer(self, number: str) -> bool:
+        number = sanitize_number(number)
+        return self._shell_am(["start", "-a", "android.intent.action.DIAL", "-d", f"tel:{number}"])
+
+    def open_sms(self, number: str, body: str = "") -> bool:
+        number = sanitize_number(number)
+        pieces = ["start", "-a", "android.intent.action.SENDTO", "-d", f"sms:{number}"]
+        if body:
+            pieces += ["--es", "sms_body", body]
+        return self._shell_am(pieces)
+
+    def end_call(self) -> bool:
+        cp = self._run(self._adb("shell", "input", "keyevent", "KEYCODE_ENDCALL"))
+        return "Error" not in (cp.stdout or "")
+
+    def call_state(self) -> Optional[int]:
+        """Anlık arama durumu (0=boşta, 1=çalıyor, 2=görüşmede).
+
+        dumpsys çıktısı cihazda süzülür, sadece ilk mCallState satırı aktarılır.
+        """
+        try:
+            cp = self._run(self._adb("shell", "dumpsys telephony.registry | grep -m 1 mCallState="), quiet=True)
+        except Exception:
+            return None
+        m = re.search(r"mCallState=(\d)", cp.stdout or "")
+        return int(m.group(1)) if m else None
+
+    def send_sms(self, number: str, body: str) -> bool:
+        """SMS ekranını açıp gönder tuşuna bas.
+
+        Varsayılan mesajlaşma uygulamalarının çoğunda odak metin kutusundayken
+        sağ ok + Enter gönder düğmesine denk gelir; cihaza göre değişebilir.
+        True yalnızca ekranın açıldığını ve tuşların iletildiğini söyler;
+        mesajın gönderildiği ya da teslim edildiği doğrulanmaz.
+        """
+        if not self.open_sms(number, body):
+            return False
+        time.sleep(1.0)  # Mesajlaşma ekranının açılmasını bekle
+        cp = self._run(self._adb("shell", "input keyevent 22 && input keyevent 66"))
+        return cp.returncode == 0
+
+    def list_packages(self, system_apps=False) -> List[Dict[str, str]]:
+        """Yüklü paketleri gerçek uygulama adlarıyla listele (adlar cihaz/sürüm başına önbellekte)"""
+        try:
+            flags = "-f --show-versioncode" + ("" if system_apps else " -3")  # -3: sadece kullanıcı uygulamaları
+            # Cihaz kimliği, dil ve paket listesi tek kabuk çağrısında
+            script = ("l=$(getprop persist.sys.locale); [ -z \"$l\" ] && l=$(getprop ro.product.locale); "
+                      f"echo \"@@ $(getprop ro.serialno) $l\"; pm list packages {flags} 2>/dev/null "
+                      f"|| pm list packages {flags.replace(' --show-versioncode', '')}")
+            cmd = self._adb("shell", script)
+            
+            # Sağlık/yol yönlendirmesi _run'dan geçer; uzun liste log'a dökülmesin diye quiet
+            try:
+                self.on_log(f"$ {' '.join(cmd)}")
+                cp = self._run(cmd, timeout=30, quiet=True)  # Timeout artır
+                if cp.stdout:
+                    self.on_log("Paket listesi alındı.")
+            except Exception as e:
+                self.on_log(f"Paket listesi hatası: {e}")
+                return []
+            
+            device_id, locale = "", ""
+            entries = []  # (paket, apk yolu, sürüm)
+            for line in cp.stdout.splitlines():
+                if line.startswith("@@"):
+                    parts = line[2:].split()
+                    device_id = parts[0] if parts else ""
+                    locale = parts[1] if len(parts) > 1 else ""
+                elif line.startswith("package:"):
+                    # package:/data/app/~~x==/com.ornek-y==/base.apk=com.ornek versionCode:42
+                    body, _, version = line[len("package:"):].strip().partition(" versionCode:")
+                    apk, _, pkg_name = body.rpartition("=")
+                    entries.append((pkg_name, apk, version or apk))  # sürüm yoksa yol her güncellemede değişir
+
+            labels = {}
+            try:
+                from pypirt_labels import label_packages
+                labels = label_packages(self, entries, device_id, locale)
+            except Exception as e:
+                self.on_log(f"Uygulama adları alınamadı: {e}")
+            packages = [{"package": pkg, "name": labels.get(pkg) or pkg} for pkg, _, _ in entries]
+            return sorted(packages, key=lambda x: x["name"].lower())
+        except Exception as e:
+            self.on_log(f"Paket listesi alınamadı: {e}")
+            return []
+
+    def get_device_info(self) -> DeviceInfo:
+        """Model, sürüm ve pil durumu tek akışta (bkz. pypirt_dumpsys)"""
+        return dumpsys_device_info(self)
+
+    def launch_app(self, package_name: str) -> bool:
+        """Başlatıcı etkinliğini `am start -W` ile aç ve açılış süresini logla (bkz. pypirt_launch).
+
+        Etkinlik çözülemezse (eski Android'de `cmd package` yok) monkey'e düşer.
+        """
+        from pypirt_launch import start
+        r = start(self, package_name)
+        if r.activity:
+            if r.ok:
+                state = f", {r.launch_state}" if r.launch_state else ""
+                self.on_log(f"{r.activity} açıldı: {r.total_ms} ms (bekleme {r.wait_ms} ms{state})")
+            else:
+                self.on_log(f"{r.activity} açılamadı: {r.error}")
+            return r.ok
+        cp = self._run(self._adb("shell", "monkey", "-p", package_name, "-c", "android.intent.category.LAUNCHER", "1"))
+        return "Events injected" in (cp.stdout or "")
+
+    def screenshot(self, save_path: str) -> bool:
+        try:
+            tmp_path = "/sdcard/PyPIRT_screenshot.png"
+            self._run(self._adb("shell", "screencap", "-p", tmp_path))
+            self._run(self._adb("pull", tmp_path, save_path))
+            self._run(self._adb("shell", "rm", tmp_path))
+            return Path(save_path).exists()
+        except Exception:
+            return False
+
+    def push_file(self, local_path: str, remote_path: str, verify: bool = False) -> bool:
+        """verify=True: iki taraftaki özetler de karşılaştırılır (bkz. pypirt_verify)"""
+        if verify:
+            from pypirt_verify import transfer
+            return transfer(self, "push", [(local_path, remote_path)])[0].ok
+        cp = self._run(self._adb("push", local_path, remote_path))
+        return "file" in (cp.stdout or "")
+
+    def pull_file(self, remote_path: str, local_path: str, verify: bool = False) -> bool:
+        """verify=True: iki taraftaki özetler de karşılaştırılır (bkz. pypirt_verify)"""
+        if verify:
+            from pypirt_verify import transfer
+            return transfer(self, "pull", [(remote_path, local_path)])[0].ok
+        cp = self._run(self._adb("pull", remote_path, local_path))
+        return Path(local_path).exists()
+
+    def get_app_info(self, package_name: str) -> AppInfo:
+        """Uygulamanın sürüm ve kurulum bilgileri; dumpsys gerekli alanlardan sonra kesilir"""
+        return dumpsys_app_info(self, package_name)
+
+    def get_app_icon(self, package_name: str) -> Optional[str]:
+        """Uygulamanın ikonunu al ve kaydet"""
+        try:
+            # Uygulama ikonunu çıkar
+            icon_path = f"./icons/{package_name}.png"
+            os.makedirs("./icons", exist_ok=True)
+            
+            # APK yolunu al
+            cp = self._run(self._adb("shell", "pm", "path", package_name))
+            if "package:" not in cp.stdout:
+                return None
+                
+            apk_path = cp.stdout.split("package:")[1].strip()
+            
+            # APK'yı geçici olarak çek
+            temp_apk = f"./temp_{package_name}.apk"
+            self._run(self._adb("pull", apk_path, temp_apk))
+            
+            if not Path(temp_apk).exists():
+                return None
+            
+            # AAPT ile ikon bilgisini al (basit yöntem)
+            # Bu kısım için alternatif yöntem kullanacağız
+            
+            # Geçici dosyayı temizle
+            try:
+                Path(temp_apk).unlink()
+            except:
+                pass
+                
+            return None  # Şimdilik ikon çıkarma devre dışı
+        except Exception:
+            return None
+
+# ---------- Yardımcılar ----------
+
+
+def sanitize_number(num: str) -> str:
+    num = (num or "").strip()
+    keep = re.sub(r"[^0-9+]", "", num)
+    if keep.startswith("0") and len(keep) >= 10:
+        keep = keep[1:]
+    if keep.startswith("90") and not keep.startswith("+"):
+        keep = "+" + keep
+    return keep
+
+
+_TR_CASE = str.maketrans({"I": "ı", "İ": "i"})
+_TR_ASCII = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+
+
+def tr_fold(text: str) -> str:
+    """Türkçe kurallarıyla küçük harfe çevir.
+
+    str.lower() 'I' harfini 'i', 'İ' harfini 'i̇' (noktalı birleşik) yapar;
+    burada I → ı ve İ → i olur.
+    """
+    return text.translate(_TR_CASE).lower()
+
+
+def ascii_fold(text: str) -> str:
+    """tr_fold sonrası Türkçe harfleri ASCII karşılıklarına indir (ş → s, ı → i...)"""
+    return tr_fold(text).translate(_TR_ASCII)
+
+
+# ---------- Kalıcı dosyalar ----------
+
+AUTOSAVE_DELAY = 1.0  # Son değişiklikten sonra yazmadan önce beklenen süre, saniye
+AUTOSAVE_MAX_DELAY = 5.0  # Değişiklikler hiç durmasa da en geç bu kadar sonra yazılır
+
+# Yol → (içerik özeti, mtime_ns, boyut): dosya bizim son okuduğumuz/yazdığımız haldeyse
+_disk_state: Dict[str, Tuple[bytes, int, int]] = {}
+_disk_lock = threading.Lock()
+_UMASK = os.umask(0)  # yalnızca okumak için; hemen geri konur
+os.umask(_UMASK)
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _remember(path: Path, data: bytes):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    with _disk_lock:
+        _disk_state[os.path.abspath(path)] = (_digest(data), st.st_mtime_ns, st.st_size)
+
+
+def _fsync_dir(directory: Path):
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(path: Path, text: str) -> bool:
+    """Metni aynı klasörde geçici dosyaya yaz, fsync et ve yerine koy (os.replace).
+
+    Yazım yarıda kesilirse eski dosya olduğu gibi kalır. İçerik, diskteki
+    dosyayla (son okuma/yazmadan beri dışarıdan değişmemişse) aynıysa hiç
+    yazılmaz. Yazıldıysa True.
+    """
+    path = Path(path)
+    data = text.encode("utf-8")
+    digest = _digest(data)
+    key = os.path.abspath(path)
+    with _disk_lock:
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is not None and _disk_state.get(key) == (digest, st.st_mtime_ns, st.st_size):
+            return False
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp 0600 açar: var olan dosyanın izinleri korunur, yeni dosya umask'e uyar
+            os.chmod(tmp, st.st_mode & 0o777 if st is not None else 0o666 & ~_UMASK)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        _fsync_dir(path.parent)
+        st = os.stat(path)
+        _disk_state[key] = (digest, st.st_mtime_ns, st.st_size)
+    return True
+
+
+class AutoSaver:
+    """Art arda gelen değişiklikleri tek yazıma indirger.
+
+    schedule() her değişiklikte çağrılır; save() son çağrıdan delay saniye
+    sonra (değişiklikler sürüyorsa en geç max_delay sonra) tek bir arka plan
+    iş parçacığında çalışır. flush() bekleyen yazımı hemen yapar. ready
+    verilirse ve False dönerse (ör. veri henüz yüklenmedi) schedule() yok
+    sayılır.
+    """
+
+    def __init__(self, save: Callable[[], object], delay: float = AUTOSAVE_DELAY,
+                 max_delay: float = AUTOSAVE_MAX_DELAY, on_error: Optional[Callable[[Exception], None]] = None,
+                 ready: Optional[Callable[[], bool]] = None):
+        self._save = save
+        self.ready = ready
+        self.delay = delay
+        self.max_delay = max_delay
+        self.on_error = on_error
+        self._cond = threading.Condition()
+        self._save_lock = threading.Lock()
+        self._due: Optional[float] = None
+        self._first: Optional[float] = None
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self):
+        if self.ready is not None and not self.ready():
+            return
+        with self._cond:
+            if self._closed:
+                return
+            now = time.monotonic()
+            if self._first is None:
+                self._first = now
+            self._due = min(now + self.delay, self._first + self.max_delay)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._due is None and not self._closed:
+                    self._cond.wait()
+                if self._due is None:
+                    return
+                wait = self._due - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                self._due = self._first = None
+            self._run()
+
+    def _run(self):
+        with self._save_lock:
+            try:
+                self._save()
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+
+    @property
+    def pending(self) -> bool:
+        return self._due is not None
+
+    def flush(self):
+        """Bekleyen değişiklik varsa şimdi (çağıran iş parçacığında) yaz"""
+        with self._cond:
+            pending = self._due is not None
+            self._due = self._first = None
+        if pending:
+            self._run()
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+
+def load_settings() -> Dict:
+    if SETTINGS_PATH.exists():
+        try:
+            data = SETTINGS_PATH.read_bytes()
+            st = json.loads(data.decode("utf-8"))
+            _remember(SETTINGS_PATH, data)
+            return st
+        except Exception:
+            pass
+    return {"son_hedef": "", "filtre_favori": False, "son_etiket": ""}
+
+
+def save_settings(st: Dict):
+    """Ayarları atomik yaz; içerik değişmediyse diske dokunmaz"""
+    try:
+        atomic_write_text(SETTINGS_PATH, json.dumps(st, ensure_ascii=False, indent=2))
+    except Exception:
+        pass
+
+
+def ensure_rehber() -> None:
+    if not REHBER_PATH.exists():
+        sample = [
+            {"ad": "Acil Servis", "numara": "112", "etiketler": ["acil"], "favori": True, "profil_foto": None},
+            {"ad": "mergenc.dev", "numara": "+904444444444", "etiketler": ["is"], "favori": True, "profil_foto": None}        ]
+        atomic_write_text(REHBER_PATH, json.dumps(sample, ensure_ascii=False, indent=2))
+
+
+def read_rehber() -> List[Kisi]:
+    """Rehberi diskten oku (hata durumunda exception fırlatır, UI'ye dokunmaz)"""
+    ensure_rehber()
+    data = REHBER_PATH.read_bytes()
+    raw = json.loads(data.decode("utf-8"))
+    _remember(REHBER_PATH, data)
+    return [Kisi(**k) for k in raw]
+
+
+def backup_rehber() -> Path:
+    """Okunamayan rehber.json'un zaman damgalı kopyası (üzerine yazılmadan önce); hata durumunda exception fırlatır"""
+    dest = REHBER_PATH.with_name(f"{REHBER_PATH.stem}.bozuk-{datetime.datetime.now():%Y%m%d-%H%M%S}{REHBER_PATH.suffix}")
+    dest.write_bytes(REHBER_PATH.read_bytes())
+    return dest
+
+
+def save_rehber(kisiler: List[Kisi]) -> bool:
+    """Rehberi atomik yaz (hata durumunda exception fırlatır); içerik değişmediyse yazmaz, False döner"""
+    raw = [asdict(k) for k in kisiler]
+    return atomic_write_text(REHBER_PATH, json.dumps(raw, ensure_ascii=False, indent=2))
+
+
+def find_kisi_index(kisiler: List[Kisi], isim: str) -> Optional[int]:
+    """İsmi (Türkçe büyük/küçük harf duyarsız) içeren ilk kişinin indeksi"""
+    isim = tr_fold(isim.strip())
+    for idx, k in enumerate(kisiler):
+        if isim in tr_fold(k.ad):
+            return idx
+    return None
+
+
+def resolve_hedef(hedef: str, kisiler: Optional[List[Kisi]] = None) -> Tuple[str, str]:
+    """İsim veya numarayı (görünen ad, numara) çiftine çevir.
+
+    Kişi listesi verilmezse rehber diskten okunur; bulunamazsa LookupError.
+    """
+    hedef = hedef.strip()
+    if re.fullmatch(r"[0-9+()\-\s]+", hedef):
+        return hedef, hedef
+    if kisiler is None:
+        kisiler = read_rehber()
+    idx = find_kisi_index(kisiler, hedef)
+    if idx is None:
+        raise LookupError(f"'{hedef}' adlı kişi rehberde bulunamadı.")
+    kisi = kisiler[idx]
+    return kisi.ad, kisi.numara
+
+
+def append_log(line: str):
+    try:
+        stamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with LOG_PATH.open("a", encoding="utf-8") as f:
+            f.write(f"[{stamp}] {line}\n")
+    except Exception:
+        pass
+
+
+# Basit toast (kayan küçük bildirim)
@@ -0,0 +1,286 @@
+"""PyPIRT kablosuz hata ayıklama cihazlarını bulma.
+
+İki kaynak aynı asyncio döngüsünde eşzamanlı çalışır:
+  * mDNS: `_adb-tls-connect._tcp` (Android 11+ kablosuz hata ayıklama) ve
+    `_adb._tcp` (adb tcpip) servisleri için tek bir multicast PTR sorgusu
+    gönderilir (yanıt tek noktaya istenir, 5353 portunu dinlemek gerekmez);
+    gelen PTR/SRV/A kayıtları çözülerek ip:port bulunur. adb'nin kendi
+    `adb mdns services` listesi de birleştirilir.
+  * Alt ağ taraması: /24'teki her adrese ADB portu(ları) için TCP bağlantısı
+    denenir; her bağlantı katı bir zaman aşımına ve ortak bir eşzamanlılık
+    sınırına tabidir, bir /24 birkaç saniyede biter. Açık portlara ADB CNXN
+    paketi gönderilir; yalnızca CNXN/AUTH/STLS ile yanıt verenler (yani
+    gerçekten adbd olanlar) cihaz sayılır. Bu yoklama cihazda izin penceresi
+    açmaz.
+
+Bulunan adreslere `adb connect` paralel yapılır ve model adları okunur.
+Grup adresleri ve portlar parametre olduğundan yerel sahte dinleyicilerle
+(127.0.0.x) denenebilir.
+"""
+import asyncio
+import ipaddress
+import socket
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pypirt_core import ADBClient
+
+
+MDNS_ADDR = ("224.0.0.251", 5353)
+SERVICES = ("_adb-tls-connect._tcp.local", "_adb._tcp.local")
+ADB_PORTS = (5555,)
+HOST_TIMEOUT = 0.5  # Tarama: adres başına bağlantı + el sıkışma üst sınırı, saniye
+CONCURRENCY = 256  # Tarama: aynı anda açık bağlantı sayısı
+
+_A_CNXN, _A_AUTH, _A_STLS = 0x4E584E43, 0x48545541, 0x534C5453
+_T_A, _T_PTR, _T_SRV = 1, 12, 33
+
+
+@dataclass
+class Found:
+    address: str  # ip:port
+    source: str  # mdns / adb-mdns / tarama
+    name: str = ""  # mDNS servis adı
+    tls: bool = False  # _adb-tls-connect: önceden eşleştirme gerekir
+    model: str = ""
+    connected: bool = False
+    error: str = ""
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+# ---- mDNS ----
+
+
+def _encode_name(name: str) -> bytes:
+    out = b""
+    for label in name.strip(".").split("."):
+        raw = label.encode("utf-8")
+        out += bytes([len(raw)]) + raw
+    return out + b"\x00"
+
+
+def build_query(services: Sequence[str] = SERVICES) -> bytes:
+    """Servisler için PTR sorgusu; QU biti ile yanıt tek noktaya istenir"""
+    packet = struct.pack("!6H", 0, 0, len(services), 0, 0, 0)
+    for s in services:
+        packet += _encode_name(s) + struct.pack("!2H", _T_PTR, 0x8001)
+    return packet
+
+
+def _read_name(data: bytes, pos: int) -> Tuple[str, int]:
+    """Sıkıştırmalı DNS adını oku; (ad, adın ardındaki konum)"""
+    labels = []
+    end = None
+    for _ in range(128):  # döngüsel işaretçilere karşı
+        n = data[pos]
+        if n == 0:
+            pos += 1
+            break
+        if n & 0xC0 == 0xC0:
+            if end is None:
+                end = pos + 2
+            pos = ((n & 0x3F) << 8) | data[pos + 1]
+            continue
+        labels.append(data[pos + 1:pos + 1 + n].decode("utf-8", "replace"))
+        pos += 1 + n
+    return ".".join(labels), (end if end is not None else pos)
+
+
+def parse_response(data: bytes, ptr: Dict, srv: Dict, addr: Dict):
+    """Yanıttaki PTR/SRV/A kayıtlarını sözlüklere ekle (bozuk paket sessizce atlanır)"""
+    try:
+        _, flags, qd, an, ns, ar = struct.unpack_from("!6H", data)
+        if not flags & 0x8000:
+            return  # sorgu, yanıt değil
+        pos = 12
+        for _ in range(qd):
+            _, pos = _read_name(data, pos)
+            pos += 4
+        for _ in range(an + ns + ar):
+            name, pos = _read_name(data, pos)
+            rtype, _, _, rdlen = struct.unpack_from("!HHIH", data, pos)
+            pos += 10
+            rdata = pos
+            pos += rdlen
+            key = name.lower()
+            if rtype == _T_PTR:
+                ptr.setdefault(key, set()).add(_read_name(data, rdata)[0])
+            elif rtype == _T_SRV:
+                port = struct.unpack_from("!H", data, rdata + 4)[0]
+                srv[key] = (_read_name(data, rdata + 6)[0].lower(), port)
+            elif rtype == _T_A and rdlen == 4:
+                addr[key] = socket.inet_ntoa(data[rdata:rdata + 4])
+    except (struct.error, IndexError):
+        pass
+
+
+class _Collector(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.packets: List[bytes] = []
+
+    def datagram_received(self, data, addr):
+        self.packets.append(data)
+
+
+async def mdns_browse(timeout: float = 2.0, target: Tuple[str, int] = MDNS_ADDR,
+                      services: Sequence[str] = SERVICES) -> List[Found]:
+    """Multicast sorgu gönder, timeout boyunca yanıtları topla"""
+    loop = asyncio.get_event_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 255)
+    sock.bind(("", 0))
+    transport, proto = await loop.create_datagram_endpoint(_Collector, sock=sock)
+    try:
+        query = build_query(services)
+        t0 = loop.time()
+        for at in (0.0, 0.25, 1.0):  # kayıp UDP için sorgu tekrarları (başlangıçtan itibaren saniye)
+            if at >= timeout:
+                break
+            await asyncio.sleep(max(0.0, t0 + at - loop.time()))
+            transport.sendto(query, target)
+        await asyncio.sleep(max(0.0, t0 + timeout - loop.time()))
+    finally:
+        transport.close()
+    ptr: Dict = {}
+    srv: Dict = {}
+    addr: Dict = {}
+    for packet in proto.packets:
+        parse_response(packet, ptr, srv, addr)
+    found = []
+    for service in services:
+        for instance in sorted(ptr.get(service.lower(), ())):
+            host_port = srv.get(instance.lower())
+            ip = addr.get(host_port[0]) if host_port else None
+            if ip:
+                found.append(Found(address=f"{ip}:{host_port[1]}", source="mdns", name=instance.split(".")[0],
+                                   tls=service.startswith("_adb-tls")))
+    return found
+
+
+def adb_mdns_services(adb: ADBClient) -> List[Found]:
+    """`adb mdns services` çıktısı (adb'nin kendi mDNS tarayıcısı)"""
+    try:
+        cp = adb._run(["adb", "mdns", "services"], timeout=5, quiet=True)
+    except Exception:
+        return []
+    found = []
+    for line in (cp.stdout or "").splitlines():
+        parts = line.split()
+        if len(parts) >= 3 and parts[1].startswith("_adb") and ":" in parts[-1]:
+            found.append(Found(address=parts[-1], source="adb-mdns", name=parts[0],
+                               tls=parts[1].startswith("_adb-tls")))
+    return found
+
+
+# ---- Alt ağ taraması ----
+
+
+def _cnxn_packet() -> bytes:
+    payload = b"host::\x00"
+    return struct.pack("<6I", _A_CNXN, 0x01000001, 256 * 1024, len(payload), sum(payload) & 0xFFFFFFFF,
+                       _A_CNXN ^ 0xFFFFFFFF) + payload
+
+
+async def probe(host: str, port: int, timeout: float = HOST_TIMEOUT, handshake: bool = True) -> bool:
+    """host:port adbd mi? Bağlantı ve el sıkışma birlikte timeout içinde bitmeli"""
+    async def attempt() -> bool:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            if not handshake:
+                return True
+            writer.write(_cnxn_packet())
+            await writer.drain()
+            head = await reader.readexactly(24)
+            cmd, magic = struct.unpack_from("<I", head)[0], struct.unpack_from("<I", head, 20)[0]
+            return cmd in (_A_CNXN, _A_AUTH, _A_STLS) and magic == cmd ^ 0xFFFFFFFF
+        finally:
+            writer.close()
+
+    try:
+        return await asyncio.wait_for(attempt(), timeout)
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+        return False
+
+
+def local_network() -> str:
+    """Varsayılan rotadaki yerel adresin /24'ü (paket gönderilmez)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect(("10.255.255.255", 1))
+        ip = s.getsockname()[0]
+    return str(ipaddress.ip_network(f"{ip}/24", strict=False))
+
+
+async def sweep(network: str, ports: Sequence[int] = ADB_PORTS, timeout: float = HOST_TIMEOUT,
+                concurrency: int = CONCURRENCY, handshake: bool = True) -> List[Found]:
+    """Ağdaki tüm adreslerde ADB portlarını eşzamanlı yokla"""
+    sem = asyncio.Semaphore(concurrency)
+    targets = [(str(h), p) for h in ipaddress.ip_network(network, strict=False).hosts() for p in ports]
+
+    async def one(host: str, port: int) -> Optional[Found]:
+        async with sem:
+            if await probe(host, port, timeout, handshake):
+                return Found(address=f"{host}:{port}", source="tarama")
+        return None
+
+    results = await asyncio.gather(*(one(h, p) for h, p in targets))
+    return [r for r in results if r is not None]
+
+
+# ---- Birleşik ----
+
+
+async def _discover(adb: Optional[ADBClient], network: Optional[str], ports: Sequence[int], timeout: float,
+                    mdns_timeout: float, use_mdns: bool, use_sweep: bool,
+                    mdns_target: Tuple[str, int]) -> List[Found]:
+    loop = asyncio.get_event_loop()
+    jobs = []
+    if use_mdns:
+        jobs.append(mdns_browse(mdns_timeout, mdns_target))
+        if adb is not None:
+            jobs.append(loop.run_in_executor(None, adb_mdns_services, adb))
+    if use_sweep:
+        jobs.append(sweep(network or local_network(), ports, timeout))
+    found: Dict[str, Found] = {}
+    for group in await asyncio.gather(*jobs, return_exceptions=True):
+        if isinstance(group, Exception):
+            if adb is not None:
+                adb.on_log(f"Cihaz bulma hatası: {group}")
+            continue
+        for f in group:
+            found.setdefault(f.address, f)  # mDNS sonucu (ad, tls) taramanınkinden önce gelir
+    return list(found.values())
+
+
+def discover(adb: Optional[ADBClient] = None, network: Optional[str] = None, ports: Sequence[int] = ADB_PORTS,
+             timeout: float = HOST_TIMEOUT, mdns_timeout: float = 2.0, use_mdns: bool = True,
+             use_sweep: bool = True, mdns_target: Tuple[str, int] = MDNS_ADDR) -> List[Found]:
+    """mDNS ve alt ağ taramasını birlikte çalıştır; adrese göre tekilleştirilmiş liste"""
+    t0 = time.perf_counter()
+    found = asyncio.run(_discover(adb, network, ports, timeout, mdns_timeout, use_mdns, use_sweep, mdns_target))
+    if adb is not None:
+        adb.on_log(f"Cihaz bulma: {len(found)} adres, {time.perf_counter() - t0:.1f} sn")
+    return found
+
+
+def connect_all(adb: ADBClient, found: List[Found], workers: int = 8) -> List[Found]:
+    """Bulunan adreslere paralel `adb connect`; bağlananların modelini oku"""
+    def one(f: Found) -> Found:
+        try:
+            f.connected = adb.for_device(f.address).connect(f.address)
+            if f.connected:
+                f.model = adb.for_device(f.address).device_model() or ""
+            elif f.tls:
+                f.error = "Eşleştirme gerekli (Kablosuz hata ayıklama > Cihazı eşle)"
+        except Exception as e:
+            f.error = str(e)
+        return f
+
+    if not found:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(found)))) as pool:
+        return list(pool.map(one, found))
@@ -0,0 +1,274 @@
+"""PyPIRT toplu SMS dağıtımı.
+
+Bir etiketi veya kişi seçimini şablonlu mesaj işlerine çevirir ve işleri
+bağlı cihazlara dağıtır. Her cihazın kendi token-bucket hız sınırı vardır;
+başarısız işler tekrar denenir (başka bir cihaz da alabilir). İlerleme
+satır satır bir JSONL kontrol noktası dosyasına yazılır, böylece yarıda
+kalan bir çalışma aynı dosyayla yeniden başlatıldığında kaldığı yerden
+devam eder. İşler numara + metin özetiyle tanınır: arada rehber düzenlense
+de gönderilmiş mesajlar atlanır, yalnızca gönderilmemiş ya da başarısız
+olanlar yeniden denenir. Süreç sert biçimde öldürülürse o an gönderilmekte
+olan işler kaydedilemeyeceği için yeniden başlatmada tekrar gönderilebilir.
+
+Durumlar: "sent" gönder tuşlarına basıldı demektir (teslim doğrulanmaz);
+gonder=False ile yalnızca SMS ekranı açılan işler "opened" kaydedilir ve
+atlanmaz, böylece aynı kontrol noktasıyla sonraki gönderimli çalışma
+onları gerçekten gönderir.
+"""
+import hashlib
+import heapq
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from pypirt_core import ADBClient, Kisi, sanitize_number
+
+
+class _SafeDict(dict):
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+@dataclass
+class SmsJob:
+    id: int
+    ad: str
+    numara: str
+    body: str
+    attempts: int = 0
+
+    @property
+    def key(self) -> str:
+        """Kontrol noktası anahtarı: aynı numaraya aynı metin aynı iştir (rehberdeki sırası önemsiz)"""
+        return hashlib.sha256(f"{self.numara}\x1f{self.body}".encode("utf-8")).hexdigest()[:16]
+
+
+def render_template(template: str, kisi: Kisi) -> str:
+    """Şablondaki {ad}, {numara}, {etiketler} alanlarını doldur"""
+    return template.format_map(_SafeDict(ad=kisi.ad, numara=kisi.numara, etiketler=", ".join(kisi.etiketler)))
+
+
+def expand_jobs(kisiler: Iterable[Kisi], template: str, etiket: Optional[str] = None,
+                secim: Optional[Iterable[str]] = None) -> List[SmsJob]:
+    """Etiket ve/veya isim seçimine uyan kişilerden iş listesi oluştur.
+
+    Aynı numaraya birden fazla iş üretilmez; sıra rehber sırasıdır.
+    """
+    etiket = (etiket or "").lower().strip()
+    secilen = {s.lower().strip() for s in secim} if secim else None
+    jobs: List[SmsJob] = []
+    seen: Set[str] = set()
+    for k in kisiler:
+        if etiket and etiket not in [t.lower() for t in k.etiketler]:
+            continue
+        if secilen is not None and k.ad.lower() not in secilen and k.numara not in secilen:
+            continue
+        numara = sanitize_number(k.numara)
+        if not numara or numara in seen:
+            continue
+        seen.add(numara)
+        jobs.append(SmsJob(id=len(jobs), ad=k.ad, numara=numara, body=render_template(template, k)))
+    return jobs
+
+
+class TokenBucket:
+    """Basit token bucket: dakikada `rate` iş, en fazla `burst` birikim"""
+
+    def __init__(self, rate_per_min: float, burst: int = 1):
+        self.rate = rate_per_min / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, stop: Optional[threading.Event] = None) -> bool:
+        """Bir token alana kadar bekle; stop set edilirse False döner"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate if self.rate > 0 else 1.0
+            if stop is not None:
+                if stop.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+class Checkpoint:
+    """Satır bazlı (JSONL) ilerleme kaydı; her satır yazıldıktan sonra flush edilir"""
+
+    def __init__(self, path: Path, total: int):
+        self.path = Path(path)
+        self.total = total
+        self.sent: Set[str] = set()  # gönderilmiş işlerin anahtarları; yeniden başlatmada atlanır
+        self._lock = threading.Lock()
+        self._load()
+        self._fh = self.path.open("a", encoding="utf-8")
+        if self.path.stat().st_size == 0:
+            self._write({"total": total, "started": time.time()})
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        for ln in lines:  # ilk satır başlıktır; status alanı olmadığından atlanır
+            try:
+                rec = json.loads(ln)
+            except ValueError:
+                continue  # Çökme sırasında yarım yazılmış son satır
+            if rec.get("status") == "sent" and rec.get("key"):
+                self.sent.add(rec["key"])
+
+    def _write(self, rec: Dict):
+        self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._fh.flush()
+
+    def record(self, job: SmsJob, status: str, device: str, error: str = ""):
+        with self._lock:
+            if status == "sent":
+                self.sent.add(job.key)
+            rec = {"key": job.key, "id": job.id, "status": status, "device": device, "attempts": job.attempts,
+                   "ts": time.time()}
+            if error:
+                rec["error"] = error
+            self._write(rec)
+
+    def close(self):
+        self._fh.close()
+
+
+@dataclass
+class DispatchStats:
+    total: int = 0
+    skipped: int = 0  # önceki çalışmada gönderilmiş
+    sent: int = 0  # gönder tuşlarına basıldı (teslim doğrulanmaz)
+    opened: int = 0  # gonder=False: yalnızca SMS ekranı açıldı
+    failed: int = 0
+    retries: int = 0
+    elapsed_s: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class SmsDispatcher:
+    """İşleri cihazlar arasında paylaştıran toplu SMS motoru.
+
+    Tüm cihazlar tek bir ortak kuyruktan iş çeker; hızlı cihaz daha çok iş
+    alır. Her cihaz kendi TokenBucket'ına uyar.
+    """
+
+    def __init__(self, adb: ADBClient, devices: List[str], rate_per_min: float = 6.0, burst: int = 1,
+                 max_retries: int = 2, retry_delay: float = 5.0, gonder: bool = False,
+                 on_progress: Optional[Callable[[DispatchStats], None]] = None):
+        if not devices:
+            raise ValueError("En az bir cihaz gerekli")
+        self.adb = adb
+        self.devices = devices
+        self.rate_per_min = rate_per_min
+        self.burst = burst
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.gonder = gonder
+        self.on_progress = on_progress
+        self.stop_event = threading.Event()
+        self.stats = DispatchStats()
+        self._stats_lock = threading.Lock()
+
+    def _send(self, client: ADBClient, job: SmsJob) -> bool:
+        if self.gonder:
+            return client.send_sms(job.numara, job.body)
+        return client.open_sms(job.numara, job.body)
+
+    def run(self, jobs: List[SmsJob], checkpoint_path: Optional[Path] = None) -> DispatchStats:
+        t0 = time.perf_counter()
+        cp = Checkpoint(checkpoint_path, len(jobs)) if checkpoint_path else None
+        self.stats = DispatchStats(total=len(jobs))
+        q: "queue.Queue[SmsJob]" = queue.Queue()
+        # Tekrar denemeyi bekleyen işler: (zaman, sıra, iş); süresi gelince çalışanlar ortak kuyruğa taşır
+        delayed: List[Tuple[float, int, SmsJob]] = []
+        for job in jobs:
+            if cp and job.key in cp.sent:
+                self.stats.skipped += 1
+            else:
+                q.put(job)
+        remaining = [q.qsize()]
+
+        def finish(job: SmsJob, status: str, device: str, error: str = ""):
+            with self._stats_lock:
+                if status == "sent":
+                    self.stats.sent += 1
+                elif status == "opened":
+                    self.stats.opened += 1
+                else:
+                    self.stats.failed += 1
+                remaining[0] -= 1
+            if cp:
+                cp.record(job, status, device, error)
+            if self.on_progress:
+                self.on_progress(self.stats)
+
+        def release_due():
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                q.put(heapq.heappop(delayed)[2])
+
+        def worker(serial: str):
+            client = self.adb.for_device(serial)
+            bucket = TokenBucket(self.rate_per_min, self.burst)
+            while not self.stop_event.is_set():
+                with self._stats_lock:
+                    if remaining[0] <= 0:
+                        return
+                    release_due()
+                try:
+                    job = q.get(timeout=0.5)
+                except queue.Empty:
+                    continue  # Tekrar denemede bekleyen işler olabilir
+                if not bucket.acquire(self.stop_event):
+                    return
+                job.attempts += 1
+                try:
+                    ok, error = self._send(client, job), ""
+                except Exception as e:
+                    ok, error = False, str(e)
+                if ok:
+                    finish(job, "sent" if self.gonder else "opened", serial)
+                elif job.attempts <= self.max_retries:
+                    with self._stats_lock:
+                        self.stats.retries += 1
+                        # Gecikmeli olarak kuyruğa geri döner; başka bir cihaz alabilir
+                        heapq.heappush(delayed, (time.monotonic() + self.retry_delay, job.id, job))
+                else:
+                    finish(job, "failed", serial, error)
+
+        threads = [threading.Thread(target=worker, args=(d,), daemon=True) for d in self.devices]
+        for th in threads:
+            th.start()
+        try:
+            while any(th.is_alive() for th in threads):
+                for th in threads:
+                    th.join(0.5)
+        except KeyboardInterrupt:
+            # Sürmekte olan işler bitip kaydedilsin, sonra çık
+            self.stop()
+            for th in threads:
+                th.join()
+        finally:
+            if cp:
+                cp.close()
+        self.stats.elapsed_s = round(time.perf_counter() - t0, 2)
+        return self.stats
+
+    def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,200 @@
+"""PyPIRT akışlı dumpsys ayrıştırıcıları.
+
+`dumpsys package <paket>` binlerce satır (etkinlik çözümleyici tabloları,
+izinler, kullanıcı durumları...) üretir; istenen birkaç alan ise paket
+bölümünün başındadır. Çıktı satır satır okunur, her satır yalnızca henüz
+bulunmamış alanların desenleriyle denenir; alanların hepsi bulunduğunda
+(ya da ilgili bölüm bittiğinde) adb süreci öldürülür. adb bağlantısı
+kapanınca cihazdaki dumpsys de sonlanır; yavaş Wi-Fi bağlantılarında
+çıktının kalanı hiç aktarılmaz ve bellekte tutulmaz.
+
+Cihaz bilgisi tek kabuk çağrısıyla alınır: getprop değerleri ve ardından
+`dumpsys battery`; pil seviyesi ve sıcaklığı okununca süreç kapanır.
+
+Sonuçlar tür bilgili dataclass'lardır (sayılar int/float, bilinmeyenler
+None).
+"""
+import re
+import threading
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Pattern, Sequence, Tuple
+
+STREAM_TIMEOUT = 15  # Akışın tamamı için üst sınır, saniye
+
+
+@dataclass
+class Field:
+    name: str
+    pattern: Pattern  # ilk grup değerdir
+    convert: Callable[[str], object] = str
+
+
+def _int(text: str) -> int:
+    return int(text)
+
+
+def _none_if_null(text: str) -> Optional[str]:
+    return None if text in ("null", "") else text
+
+
+class StreamParser:
+    """Satırları alanlara eşler; bütün alanlar bulununca ya da bitiş deseni gelince biter"""
+
+    def __init__(self, fields: Sequence[Field], start: Optional[Pattern] = None, stop: Optional[Pattern] = None):
+        self.fields = list(fields)
+        self.start = start  # verilirse alanlar bu satırdan sonra aranır
+        self.stop = stop  # başlangıçtan sonra eşleşirse okuma biter
+        self.values: Dict[str, object] = {}
+        self.lines = 0
+        self._started = start is None
+        self._pending = list(self.fields)
+
+    def feed(self, line: str) -> bool:
+        """Satırı işle; okumaya gerek kalmadıysa True"""
+        self.lines += 1
+        if not self._started:
+            self._started = bool(self.start.search(line))
+            return False
+        if self.stop is not None and self.stop.search(line):
+            return True
+        for f in self._pending:
+            m = f.pattern.search(line)
+            if m:
+                try:
+                    self.values[f.name] = f.convert(m.group(1))
+                except ValueError:
+                    continue
+                self._pending = [p for p in self._pending if p.name != f.name]
+        return not self._pending
+
+    @property
+    def complete(self) -> bool:
+        return not self._pending
+
+
+def stream(client, script: str, parser: StreamParser, timeout: float = STREAM_TIMEOUT) -> StreamParser:
+    """`adb shell script` çıktısını parser'a akıt; parser bitince süreci öldür"""
+    proc = client.popen(client._adb("shell", script))
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.daemon = True
+    watchdog.start()
+    try:
+        for line in proc.stdout:
+            if parser.feed(line):
+                break
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.kill()  # kalan çıktıyı bekleme; cihazdaki komut bağlantıyla birlikte kapanır
+        proc.stdout.close()
+        proc.wait()
+    return parser
+
+
+# ---- Uygulama bilgisi ----
+
+
+@dataclass
+class AppInfo:
+    package: str
+    found: bool = False
+    version_name: Optional[str] = None
+    version_code: Optional[int] = None
+    min_sdk: Optional[int] = None
+    target_sdk: Optional[int] = None
+    code_path: Optional[str] = None
+    data_dir: Optional[str] = None
+    first_install: Optional[str] = None
+    last_update: Optional[str] = None
+    installer: Optional[str] = None
+    lines_read: int = 0
+    error: str = ""
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+_APP_FIELDS = (
+    Field("version_code", re.compile(r"\bversionCode=(\d+)"), _int),
+    Field("min_sdk", re.compile(r"\bminSdk=(\d+)"), _int),
+    Field("target_sdk", re.compile(r"\btargetSdk=(\d+)"), _int),
+    Field("version_name", re.compile(r"\bversionName=(\S*)"), _none_if_null),
+    Field("code_path", re.compile(r"^\s*codePath=(\S+)")),
+    Field("data_dir", re.compile(r"^\s*dataDir=(\S+)")),
+    Field("first_install", re.compile(r"\bfirstInstallTime=(.+?)\s*$")),
+    Field("last_update", re.compile(r"\blastUpdateTime=(.+?)\s*$")),
+    Field("installer", re.compile(r"\binstallerPackageName=(\S+)"), _none_if_null),
+)
+_PACKAGES_START = re.compile(r"^Packages:")
+# Paket bölümünden sonraki üst düzey başlık (Hidden system packages:, Queries:, Dexopt state: ...)
+_SECTION_END = re.compile(r"^\S.*:\s*$")
+
+
+def app_info(client, package: str, timeout: float = STREAM_TIMEOUT) -> AppInfo:
+    """`dumpsys package` çıktısından paket bilgisi; alanlar tamamlanınca okuma kesilir"""
+    info = AppInfo(package=package)
+    parser = StreamParser(_APP_FIELDS, start=_PACKAGES_START, stop=_SECTION_END)
+    try:
+        stream(client, f"dumpsys package {package}", parser, timeout)
+    except Exception as e:
+        info.error = str(e)
+        return info
+    for k, v in parser.values.items():
+        setattr(info, k, v)
+    info.found = parser._started and bool(parser.values)
+    info.lines_read = parser.lines
+    return info
+
+
+# ---- Cihaz bilgisi ----
+
+
+@dataclass
+class DeviceInfo:
+    model: Optional[str] = None
+    brand: Optional[str] = None
+    android_version: Optional[str] = None
+    sdk: Optional[int] = None
+    battery_level: Optional[int] = None  # %
+    battery_temp: Optional[float] = None  # °C
+    battery_status: Optional[int] = None  # 2=şarj oluyor, 3=boşalıyor, 5=dolu
+    error: str = ""
+
+    @property
+    def charging(self) -> bool:
+        return self.battery_status in (2, 5)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+_PROPS: Tuple[Tuple[str, str], ...] = (
+    ("model", "ro.product.model"),
+    ("brand", "ro.product.brand"),
+    ("android_version", "ro.build.version.release"),
+    ("sdk", "ro.build.version.sdk"),
+)
+_DEVICE_FIELDS: List[Field] = [
+    Field(name, re.compile(rf"^@{name}=(.+?)\s*$"), _int if name == "sdk" else str) for name, _ in _PROPS
+] + [
+    Field("battery_status", re.compile(r"^\s+status:\s*(\d+)"), _int),
+    Field("battery_level", re.compile(r"^\s+level:\s*(\d+)"), _int),
+    Field("battery_temp", re.compile(r"^\s+temperature:\s*(-?\d+)"), lambda v: int(v) / 10),
+]
+
+
+def device_info(client, timeout: float = STREAM_TIMEOUT) -> DeviceInfo:
+    """getprop değerleri ve pil durumu tek akışta; pil alanları okununca süreç kapanır"""
+    info = DeviceInfo()
+    script = "; ".join(f"echo \"@{name}=$(getprop {prop})\"" for name, prop in _PROPS) + "; dumpsys battery"
+    parser = StreamParser(_DEVICE_FIELDS)
+    try:
+        stream(client, script, parser, timeout)
+    except Exception as e:
+        info.error = str(e)
+        return info
+    for k, v in parser.values.items():
+        setattr(info, k, v)
+    if not parser.values:
+        info.error = "Cihazdan yanıt alınamadı"
+    return info
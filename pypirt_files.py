@@ -0,0 +1,216 @@
+"""PyPIRT cihaz dosya gezgini.
+
+Bir klasör tek bir kabuk çağrısıyla listelenir: `find -maxdepth 1 -exec
+stat -L -c ... {} +` her giriş için tür, boyut, zaman ve izinleri tek
+satırda verir. Çıktı satır satır okunur ve sayfa sayfa (PAGE giriş)
+bildirilir; DCIM gibi on binlerce dosyalı klasörlerde ilk sayfa listenin
+tamamı beklenmeden gösterilir. Listeler klasör başına önbellekte tutulur.
+Önbellek süreyle (TTL) ve o klasöre dosya gönderildiğinde geçersiz olur.
+
+Arama `find` çıktısını akış olarak okur; eşleşmeler geldikçe bildirilir ve
+arama istenildiği an durdurulabilir. Seçilen girişler doğrudan
+ADBClient.push_file / pull_file'a verilir.
+"""
+import posixpath
+import shlex
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pypirt_core import ADBClient
+
+
+PAGE = 500  # Arayüze bir seferde verilen / gösterilen giriş sayısı
+CACHE_TTL = 30.0  # Klasör listesinin geçerli sayıldığı süre, saniye
+CACHE_DIRS = 64  # Önbellekte tutulan en fazla klasör
+FIND_LIMIT = 5000  # Aramada en fazla sonuç
+
+
+@dataclass
+class Entry:
+    name: str
+    path: str
+    is_dir: bool = False
+    size: int = 0
+    mtime: int = 0
+    mode: str = ""  # drwxrwx--x
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _sort_key(e: Entry):
+    return (not e.is_dir, e.name.lower())
+
+
+def parse_stat_line(line: str) -> Optional[Entry]:
+    """`%F\\t%s\\t%Y\\t%A\\t%n` satırı → Entry"""
+    parts = line.rstrip("\n").split("\t", 4)
+    if len(parts) != 5 or not parts[4]:
+        return None
+    kind, size, mtime, mode, path = parts
+    path = posixpath.normpath("/" + path.lstrip("/"))  # "find /sdcard/" bazı sürümlerde // üretir
+    try:
+        return Entry(name=posixpath.basename(path.rstrip("/")) or path, path=path, is_dir=kind == "directory",
+                     size=int(size), mtime=int(mtime), mode=mode)
+    except ValueError:
+        return None
+
+
+def _list_script(path: str) -> str:
+    # -L: /sdcard gibi bağlantılar hedefin türüyle gelir; kırık bağlantılar atlanır
+    q = shlex.quote(path if path == "/" else path + "/")
+    return f"find {q} -mindepth 1 -maxdepth 1 -exec stat -L -c '%F\t%s\t%Y\t%A\t%n' {{}} + 2>/dev/null"
+
+
+def normpath(path: str) -> str:
+    return posixpath.normpath("/" + path.strip().lstrip("/"))  # "//x" POSIX'te ayrı bir yol sayılır
+
+
+class DirCache:
+    """Klasör → (giriş listesi, zaman); en eski kullanılan klasör önce atılır"""
+
+    def __init__(self, ttl: float = CACHE_TTL, max_dirs: int = CACHE_DIRS):
+        self.ttl = ttl
+        self.max_dirs = max_dirs
+        self._data: "OrderedDict[str, Tuple[float, List[Entry]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Optional[List[Entry]]:
+        with self._lock:
+            item = self._data.get(path)
+            if item is None or time.monotonic() - item[0] > self.ttl:
+                return None
+            self._data.move_to_end(path)
+            return item[1]
+
+    def put(self, path: str, entries: List[Entry]):
+        with self._lock:
+            self._data[path] = (time.monotonic(), entries)
+            self._data.move_to_end(path)
+            while len(self._data) > self.max_dirs:
+                self._data.popitem(last=False)
+
+    def invalidate(self, path: Optional[str] = None):
+        """Tek klasörü (ya da path verilmezse hepsini) geçersiz kıl"""
+        with self._lock:
+            if path is None:
+                self._data.clear()
+            else:
+                self._data.pop(normpath(path), None)
+
+
+class FileBrowser:
+    """Bir cihazın dosya sistemini önbellekli ve akışlı gezer"""
+
+    def __init__(self, client: ADBClient, cache: Optional[DirCache] = None):
+        self.client = client
+        self.cache = cache or DirCache()
+        self._search_proc = None
+
+    def list(self, path: str, on_page: Optional[Callable[[List[Entry]], None]] = None,
+             refresh: bool = False) -> List[Entry]:
+        """Klasörü listele; on_page akış sırasında her PAGE girişte (sıralanmamış) çağrılır"""
+        path = normpath(path)
+        if not refresh:
+            cached = self.cache.get(path)
+            if cached is not None:
+                return cached
+        entries: List[Entry] = []
+        proc = self.client.popen(self.client._adb("shell", _list_script(path)))
+        try:
+            batch: List[Entry] = []
+            for line in proc.stdout:
+                e = parse_stat_line(line)
+                if e is None:
+                    continue
+                batch.append(e)
+                if len(batch) >= PAGE:
+                    entries += batch
+                    if on_page:
+                        on_page(batch)
+                    batch = []
+            entries += batch
+            if on_page and batch:
+                on_page(batch)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+        entries.sort(key=_sort_key)
+        self.cache.put(path, entries)
+        return entries
+
+    @staticmethod
+    def page(entries: List[Entry], number: int, size: int = PAGE) -> List[Entry]:
+        return entries[number * size:(number + 1) * size]
+
+    def search(self, root: str, pattern: str, on_match: Callable[[List[Entry]], None],
+               limit: int = FIND_LIMIT) -> int:
+        """`find -iname *desen*` akışı; eşleşmeler küçük gruplar halinde bildirilir.
+
+        Yalnızca yollar gelir (stat, find'ın argüman toplaması yüzünden akışı
+        geciktirirdi); tür ve boyut bilinmez.
+        """
+        self.stop_search()
+        root = normpath(root)
+        script = (f"find {shlex.quote(root if root == '/' else root + '/')} "
+                  f"-iname {shlex.quote('*' + pattern + '*')} 2>/dev/null")
+        self._search_proc = proc = self.client.popen(self.client._adb("shell", script))
+        count = 0
+        batch: List[Entry] = []
+        last = time.monotonic()
+        try:
+            for line in proc.stdout:
+                path = line.rstrip("\n")
+                if not path:
+                    continue
+                path = posixpath.normpath("/" + path.lstrip("/"))
+                batch.append(Entry(name=posixpath.basename(path), path=path))
+                count += 1
+                now = time.monotonic()
+                if len(batch) >= 50 or now - last > 0.1:
+                    on_match(batch)
+                    batch, last = [], now
+                if count >= limit:
+                    break
+            if batch:
+                on_match(batch)
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+            proc.stdout.close()
+            proc.wait()
+            if self._search_proc is proc:
+                self._search_proc = None
+        return count
+
+    def stop_search(self):
+        proc = self._search_proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+
+    def pull(self, entries: List[Entry], local_dir: Path, verify: bool = False) -> List[Tuple[Entry, bool]]:
+        """Seçilen dosya/klasörleri yerel klasöre çek; verify=True ise özetleri karşılaştır"""
+        if verify:
+            from pypirt_verify import transfer
+            checks = transfer(self.client, "pull", [(e.path, str(Path(local_dir) / e.name)) for e in entries])
+            return [(e, c.ok) for e, c in zip(entries, checks)]
+        out = []
+        for e in entries:
+            out.append((e, self.client.pull_file(e.path, str(Path(local_dir) / e.name))))
+        return out
+
+    def push(self, local_files: List[str], remote_dir: str, verify: bool = False) -> List[Tuple[str, bool]]:
+        """Yerel dosyaları cihaz klasörüne gönder; klasörün önbelleği geçersiz olur"""
+        remote_dir = normpath(remote_dir)
+        pairs = [(fp, posixpath.join(remote_dir, Path(fp).name)) for fp in local_files]
+        if verify:
+            from pypirt_verify import transfer
+            out = [(fp, c.ok) for (fp, _), c in zip(pairs, transfer(self.client, "push", pairs))]
+        else:
+            out = [(fp, self.client.push_file(fp, remote)) for fp, remote in pairs]
+        self.cache.invalidate(remote_dir)
+        return out
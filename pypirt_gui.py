@@ -0,0 +1,1909 @@
+"""PyPIRT masaüstü arayüzü (customtkinter)."""
+import time
+_T_START = time.perf_counter()  # PyPIRT.py dışından açılırsa başlangıç ölçümünün yedeği
+import json
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, List, Optional, Dict, Tuple
+import re
+import importlib.util
+# --------- UI ---------
+import tkinter as tk
+import customtkinter as ctk
+from tkinter import messagebox, filedialog
+import tkinter.simpledialog
+
+from pypirt_core import (
+    APP_NAME, Kisi, ADBClient, AutoSaver, load_settings, save_settings, read_rehber,
+    save_rehber, backup_rehber, append_log, find_kisi_index,
+)
+from pypirt_dumpsys import DeviceInfo
+from pypirt_health import DEGRADED as HEALTH_DEGRADED, OPEN as HEALTH_OPEN, registry as health_registry
+from pypirt_search import SearchIndex
+
+# Profil resmi için PIL - sadece varlığı kontrol edilir, ilk kullanımda içe aktarılır
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+if not PIL_AVAILABLE:
+    print("PIL/Pillow kütüphanesi bulunamadı. Profil resimleri devre dışı.")
+_pil_modules = None
+
+
+# Başlangıç hedefi: pencere bu süre içinde ilk kez çizilmiş olmalı
+STARTUP_TARGET_MS = 400
+# Kişi listesi her seferinde bu kadar satır çizilerek kademeli oluşturulur
+RENDER_CHUNK = 40
+# İş parçacıklarından gelen UI güncellemeleri bu aralıkla (≈ bir kare) işlenir
+UI_FRAME_MS = 16
+
+TAB_MAIN = "📞 Rehber"
+TAB_APPS = "📱 Uygulamalar"
+TAB_FILES = "📁 Dosyalar"
+
+
+# Tema
+ctk.set_appearance_mode("dark")
+ctk.set_default_color_theme("blue")
+
+
+def _pil():
+    """PIL modüllerini ilk kullanımda içe aktar: (Image, ImageTk)"""
+    global _pil_modules
+    if _pil_modules is None:
+        from PIL import Image, ImageTk
+        _pil_modules = (Image, ImageTk)
+    return _pil_modules
+
+
+def square_thumbnail(path: str, size: int):
+    """Resmi ortadan kare kırpıp size x size boyutuna getir"""
+    Image, _ = _pil()
+    img = Image.open(path)
+    width, height = img.size
+    side = min(width, height)
+    left = (width - side) // 2
+    top = (height - side) // 2
+    img = img.crop((left, top, left + side, top + side))
+    return img.resize((size, size), Image.Resampling.LANCZOS)
+
+
+class Toast(ctk.CTkToplevel):
+    def __init__(self, master, text: str, ms: int = 1800):
+        super().__init__(master)
+        self.overrideredirect(True)
+        self.attributes("-topmost", True)
+        self.config(bg="#000000")
+        self.label = ctk.CTkLabel(self, text=text, font=("Segoe UI", 14))
+        self.label.pack(padx=14, pady=10)
+        self.after(ms, self.destroy)
+        self.update_idletasks()
+        x = master.winfo_rootx() + master.winfo_width() - self.winfo_width() - 30
+        y = master.winfo_rooty() + master.winfo_height() - self.winfo_height() - 30
+        self.geometry(f"+{x}+{y}")
+
+
+def show_toast(master, text, ms=1800):
+    try:
+        Toast(master, text, ms)
+    except Exception:
+        pass
+
+
+class TelemetryWindow(ctk.CTkToplevel):
+    """Telemetri örnekleyicisini başlatır, metrikleri çizer ve CSV'ye aktarır"""
+
+    CHART_W, CHART_H = 420, 64
+
+    def __init__(self, app: "PyPIRTApp"):
+        super().__init__(app)
+        from pypirt_telemetry import METRICS, METRIC_LABELS
+        self.app = app
+        self.metrics = METRICS
+        self.labels = METRIC_LABELS
+        self.title("Telemetri")
+        self.geometry("480x560")
+
+        row = ctk.CTkFrame(self, fg_color="transparent")
+        row.pack(fill="x", padx=12, pady=(12, 6))
+        ctk.CTkLabel(row, text="Aralık (sn)").pack(side="left")
+        self.entry_interval = ctk.CTkEntry(row, width=60)
+        self.entry_interval.insert(0, str(app.settings.get("telemetri_aralik", 5)))
+        self.entry_interval.pack(side="left", padx=6)
+        self.btn_toggle = ctk.CTkButton(row, text="▶ Başlat", width=90, command=self._toggle)
+        self.btn_toggle.pack(side="left", padx=6)
+        ctk.CTkButton(row, text="💾 CSV", width=70, command=self._export).pack(side="left", padx=6)
+
+        self.canvases = {}
+        self.value_labels = {}
+        for metric in self.metrics:
+            name, unit = self.labels[metric]
+            lbl = ctk.CTkLabel(self, text=f"{name}: -", anchor="w")
+            lbl.pack(fill="x", padx=12)
+            cv = tk.Canvas(self, width=self.CHART_W, height=self.CHART_H, bg="#1e1e1e", highlightthickness=0)
+            cv.pack(padx=12, pady=(0, 6))
+            self.canvases[metric] = cv
+            self.value_labels[metric] = lbl
+        self._sync_button()
+        self._redraw()
+
+    def _sync_button(self):
+        running = self.app._telemetry is not None and self.app._telemetry.running
+        self.btn_toggle.configure(text="⏹ Durdur" if running else "▶ Başlat")
+
+    def _toggle(self):
+        from pypirt_telemetry import TelemetrySampler
+        tel = self.app._telemetry
+        if tel is not None and tel.running:
+            tel.stop()
+        else:
+            if not self.app.adb.connected:
+                messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.", parent=self)
+                return
+            try:
+                interval = max(1.0, float(self.entry_interval.get()))
+            except ValueError:
+                interval = 5.0
+            self.app.settings["telemetri_aralik"] = interval
+            self.app._settings_saver.schedule()
+            self.app._telemetry = TelemetrySampler(self.app.adb, [self.app.adb.serial or ""], interval=interval)
+            self.app._telemetry.start()
+        self.after(100, self._sync_button)
+
+    def _export(self):
+        if self.app._telemetry is None:
+            show_toast(self, "Önce örneklemeyi başlatın", 1400)
+            return
+        fp = filedialog.asksaveasfilename(parent=self, title="Telemetriyi dışa aktar", defaultextension=".csv", filetypes=[("CSV", "*.csv")])
+        if not fp:
+            return
+        tel = self.app._telemetry
+
+        def job():
+            rows = tel.export_csv(fp)
+            self.app._post(lambda: show_toast(self, f"💾 {rows} satır yazıldı", 1600))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _redraw(self):
+        if not self.winfo_exists():
+            return
+        tel = self.app._telemetry
+        if tel is not None:
+            device = tel.devices[0]
+            for metric in self.metrics:
+                self._draw(self.canvases[metric], tel.values(device, metric, last=self.CHART_W))
+                last = tel.latest(device, metric)
+                name, unit = self.labels[metric]
+                self.value_labels[metric].configure(text=f"{name}: {last:g} {unit}" if last is not None else f"{name}: -")
+            interval_ms = int(tel.interval * 1000)
+        else:
+            interval_ms = 1000
+        self.after(interval_ms, self._redraw)
+
+    def _draw(self, cv: tk.Canvas, values: List[float]):
+        cv.delete("all")
+        if len(values) < 2:
+            return
+        lo, hi = min(values), max(values)
+        span = (hi - lo) or 1.0
+        step = self.CHART_W / (len(values) - 1)
+        pts = []
+        for i, v in enumerate(values):
+            pts += [i * step, self.CHART_H - 4 - (v - lo) / span * (self.CHART_H - 8)]
+        cv.create_line(*pts, fill="#3b8ed0", width=2)
+        cv.create_text(4, 2, text=f"{hi:g}", anchor="nw", fill="#888888", font=("Segoe UI", 8))
+        cv.create_text(4, self.CHART_H - 2, text=f"{lo:g}", anchor="sw", fill="#888888", font=("Segoe UI", 8))
+
+
+class LogWindow(ctk.CTkToplevel):
+    """PyPIRT.log'u belleğe yüklemeden sayfa sayfa gösterir; zamana/satıra atlar ve arar"""
+
+    def __init__(self, app: "PyPIRTApp"):
+        super().__init__(app)
+        from pypirt_logview import LogIndex, PAGE
+        self.app = app
+        self.page = PAGE
+        self.index = LogIndex()
+        self.offset = 0
+        self._search_gen = 0
+        self.title("Log Görüntüleyici")
+        self.geometry("860x600")
+
+        row = ctk.CTkFrame(self, fg_color="transparent")
+        row.pack(fill="x", padx=12, pady=(12, 4))
+        self.entry_goto = ctk.CTkEntry(row, width=170, placeholder_text="2026-10-19 14:00 / #120000")
+        self.entry_goto.pack(side="left")
+        self.entry_goto.bind("<Return>", lambda e: self._goto())
+        ctk.CTkButton(row, text="Git", width=50, command=self._goto).pack(side="left", padx=4)
+        ctk.CTkButton(row, text="◀", width=36, command=self._prev).pack(side="left", padx=(12, 2))
+        ctk.CTkButton(row, text="▶", width=36, command=self._next).pack(side="left", padx=2)
+        ctk.CTkButton(row, text="⏬ Son", width=60, command=self._tail).pack(side="left", padx=(2, 12))
+        self.entry_search = ctk.CTkEntry(row, width=200, placeholder_text="Ara (bitiş: 'metin < 2026-10-19')")
+        self.entry_search.pack(side="left")
+        self.entry_search.bind("<Return>", lambda e: self._search())
+        ctk.CTkButton(row, text="🔍", width=40, command=self._search).pack(side="left", padx=4)
+
+        self.status = ctk.CTkLabel(self, text="", anchor="w")
+        self.status.pack(fill="x", padx=12)
+        self.text = ctk.CTkTextbox(self, wrap="none", font=("Consolas", 11))
+        self.text.pack(fill="both", expand=True, padx=12, pady=(4, 12))
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self._run(self._tail_offset)
+
+    def _run(self, find_offset: Callable[[], int]):
+        """Dizini tazele, konumu arka planda bul, sayfayı çiz"""
+        def job():
+            try:
+                self.index.refresh()
+                offset = find_offset()
+                rows = self.index.lines(offset, self.page)
+                first = self.index.line_at(offset) if rows else 0
+            except Exception as e:
+                msg = f"Log okunamadı: {e}"
+                self.app._post(lambda: self.status.configure(text=msg))
+                return
+            self.app._post(lambda: self._show(offset, first, [t for _, t in rows]), key="logview")
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _show(self, offset: int, first: int, rows: List[str]):
+        if not self.winfo_exists():
+            return
+        self.offset = offset
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.insert("1.0", "\n".join(rows))
+        self.text.configure(state="disabled")
+        total = self.index.line_count
+        last = first + len(rows) - 1 if rows else 0
+        self.status.configure(text=f"Satır {first:,}–{last:,} / {total:,}  ·  {self.index.size / 2 ** 20:.1f} MB")
+
+    def _tail_offset(self) -> int:
+        return self.index.back(self.index.size, self.page)
+
+    def _tail(self):
+        self._run(self._tail_offset)
+
+    def _prev(self):
+        offset = self.offset
+        self._run(lambda: self.index.back(offset, self.page))
+
+    def _next(self):
+        offset = self.offset
+
+        def nxt():
+            rows = self.index.lines(offset, self.page + 1)
+            return rows[-1][0] if len(rows) > self.page else offset
+        self._run(nxt)
+
+    def _goto(self):
+        from pypirt_logview import parse_time
+        q = self.entry_goto.get().strip().lstrip("#")
+        if not q:
+            return
+        if q.isdigit():
+            self._run(lambda: self.index.offset_for_line(int(q)))
+            return
+        ts = parse_time(q)
+        if ts is None:
+            show_toast(self, "Zaman anlaşılamadı", 1400)
+            return
+        self._run(lambda: self.index.offset_for_time(ts))
+
+    def _search(self):
+        """Metni ara; 'Git' kutusunda bir zaman varsa oradan, 'metin < zaman' ile bitişe kadar"""
+        from pypirt_logview import parse_time
+        q = self.entry_search.get().strip()
+        if not q:
+            return
+        until = None
+        if " < " in q:
+            q, _, end = q.rpartition(" < ")
+            until = parse_time(end.strip())
+        goto = self.entry_goto.get().strip()
+        since = parse_time(goto) if goto and not goto.lstrip("#").isdigit() else None
+        self._search_gen += 1
+        gen = self._search_gen
+        self.status.configure(text=f"Aranıyor: {q}…")
+
+        def job():
+            hits = []
+            try:
+                for hit in self.index.search(q, since, until, limit=self.page):
+                    if gen != self._search_gen:
+                        return
+                    hits.append(hit)
+            except Exception as e:
+                msg = f"Arama hatası: {e}"
+                self.app._post(lambda: self.status.configure(text=msg))
+                return
+            self.app._post(lambda: self._show_hits(q, hits), key="logview")
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _show_hits(self, q: str, hits: list):
+        if not self.winfo_exists():
+            return
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.insert("1.0", "\n".join(f"{h.line:>9}: {h.text}" for h in hits))
+        self.text.configure(state="disabled")
+        self.status.configure(text=f"'{q}': {len(hits)} eşleşme" + (" (ilk sayfa)" if len(hits) >= self.page else "")
+                              + "  ·  satıra gitmek için #numara")
+
+    def _close(self):
+        self._search_gen += 1
+        self.index.close()
+        self.destroy()
+
+
+# ---------- UI Uygulaması ----------
+
+
+class PyPIRTApp(ctk.CTk):
+    def __init__(self, t_start: Optional[float] = None):
+        """t_start: süreç başlangıcının perf_counter değeri (PyPIRT.py en başta alır)"""
+        super().__init__()
+        self._t_start = t_start if t_start is not None else _T_START
+        self._startup_reported = False
+        self.title(APP_NAME + " — Wi‑Fi ADB")
+        self.geometry("1120x700")
+        self.minsize(980, 600)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        # Notebook (Tab) widget ekle
+        self.notebook = ctk.CTkTabview(self, width=1120, height=700, command=self._on_tab_changed)
+        self.notebook.grid(row=0, column=0, columnspan=3, sticky="nsew", padx=14, pady=14)
+        
+        # Ana sekme (Rehber)
+        self.tab_main = self.notebook.add(TAB_MAIN)
+        self.tab_main.grid_rowconfigure(0, weight=1)
+        self.tab_main.grid_columnconfigure(1, weight=1)
+        
+        # Uygulamalar sekmesi (içeriği ilk açılışta oluşturulur)
+        self.tab_apps = self.notebook.add(TAB_APPS)
+        self.tab_apps.grid_rowconfigure(0, weight=1)
+        self.tab_apps.grid_columnconfigure(1, weight=1)
+        self._apps_tab_built = False
+
+        # Dosyalar sekmesi (içeriği ilk açılışta oluşturulur)
+        self.tab_files = self.notebook.add(TAB_FILES)
+        self.tab_files.grid_rowconfigure(1, weight=1)
+        self.tab_files.grid_columnconfigure(0, weight=1)
+        self._files_tab_built = False
+
+        self.settings = load_settings()
+        self.adb = ADBClient(self._on_log)
+
+        self.kisiler: List[Kisi] = []
+        self._search_index = SearchIndex()
+        self.selected_index: Optional[int] = None
+        self.profil_resim_img = None
+        self.all_apps = []
+        self.filtered_apps = []
+        self._thumb_cache: Dict[Tuple[str, float], ctk.CTkImage] = {}
+        self._telemetry = None
+        self._telemetry_win = None
+        self._logview_win = None
+        # Düzenlemeler birikip tek atomik yazımla kaydedilir (Ctrl+S beklemeden)
+        self._rehber_saver = AutoSaver(self._write_rehber, ready=lambda: self._rehber_loaded,
+                                       on_error=lambda e: self._log_ui(f"Rehber otomatik kaydedilemedi: {e}"))
+        self._settings_saver = AutoSaver(lambda: save_settings(dict(self.settings)))
+        self._recorder = None
+
+        # İş parçacıklarından gelen UI güncellemeleri (bkz. _post / _drain_ui)
+        self._ui_lock = threading.Lock()
+        self._ui_calls: List[Callable[[], None]] = []
+        self._ui_keyed: Dict[str, Callable[[], None]] = {}
+        self._log_pending: List[str] = []
+        self._render_gen = 0
+        self._rehber_loaded = False
+        self._rehber_locked = False  # okunamayan rehber.json yedeklenemediyse üzerine yazılmaz
+
+        # İsteğe bağlı takılma izleyicisi; işlemler widget'lar komutlarına bağlanmadan sarılmalı
+        self._ui_watch = None
+        if self.settings.get("izleme"):
+            from pypirt_uiprof import UiWatch
+            self._ui_watch = UiWatch(self, self.settings["izleme"], on_log=self._log_ui)
+
+        # Cihaz sağlığı (bkz. pypirt_health): yanıt vermeyen cihaz durum satırında gösterilir
+        self._status_label = "Durum: 🔴 Bağlı değil"
+        self._health_state = ""
+        health_registry.add_listener(self._on_health_change)
+
+        # Ana sekmeye sidebar, center, right ekle
+        self._create_main_tab()
+
+        # ...existing code (başlatma işlemleri)...
+        self._log_ui(f"{APP_NAME} başlatıldı.")
+
+        # Rehber arka planda okunur, pencere beklemeden çizilir
+        self._load_people_async()
+        self.bind("<Map>", self._on_first_map, add="+")
+        self.after(UI_FRAME_MS, self._drain_ui)
+        threading.Thread(target=self._adb_version_check, daemon=True).start()
+        
+        self.bind("<Control-s>", lambda e: self._save_people())
+        self.bind("<Control-f>", lambda e: (self.search.focus_set(), "break"))
+        self.bind("<Delete>", lambda e: self._delete_person())
+        
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        self._auto_status_thread = threading.Thread(target=self._auto_check_status, daemon=True)
+        self._auto_status_thread.start()
+
+        # Opsiyonel tıkla-ara HTTP servisi (ayarlarda "http_servisi": true)
+        self._http_server = None
+        if self.settings.get("http_servisi"):
+            self._start_http_server()
+
+    def _start_http_server(self):
+        """Rehberi ve ADB istemcisini paylaşan yerel HTTP servisini başlat"""
+        from pypirt_server import DialServer, DEFAULT_PORT, new_token
+        if not self.settings.get("http_token"):
+            self.settings["http_token"] = new_token()
+            self._settings_saver.schedule()
+        self._http_server = DialServer(
+            self.adb,
+            kisiler_provider=lambda: list(self.kisiler),
+            port=int(self.settings.get("http_port", DEFAULT_PORT)),
+            token=self.settings["http_token"],
+        )
+        self._http_server.run_in_thread()
+
+    def _create_main_tab(self):
+        """Ana rehber sekmesini oluştur"""
+        # Sidebar
+        self.sidebar = ctk.CTkFrame(self.tab_main, corner_radius=16)
+        self.sidebar.grid(row=0, column=0, sticky="nsw", padx=(0, 8), pady=0)
+        
+        # Row konfigürasyonu
+        for i in range(30):
+            self.sidebar.grid_rowconfigure(i, weight=0)
+        self.sidebar.grid_rowconfigure(20, weight=0)
+
+        # Title
+        self.lbl_title = ctk.CTkLabel(self.sidebar, text="PyPIRT", font=("Segoe UI", 28, "bold"))
+        self.lbl_title.grid(row=0, column=0, padx=16, pady=(16, 6), sticky="w")
+
+        # Connection bölümü
+        self.entry_ip = ctk.CTkEntry(self.sidebar, placeholder_text="Cihaz IP:Port", width=240)
+        self.entry_ip.insert(0, self.settings.get("son_hedef", ""))
+        self.entry_ip.grid(row=1, column=0, padx=16, pady=(4, 6), sticky="w")
+
+        row_conn = ctk.CTkFrame(self.sidebar, fg_color="transparent")
+        row_conn.grid(row=2, column=0, padx=12, pady=(0, 6), sticky="w")
+        self.btn_connect = ctk.CTkButton(row_conn, text="🔌 Bağlan", command=self._connect, width=90)
+        self.btn_connect.pack(side="left", padx=3)
+        self.btn_disconnect = ctk.CTkButton(row_conn, text="⛔ Kes", command=self._disconnect, width=80)
+        self.btn_disconnect.pack(side="left", padx=3)
+        self.btn_test = ctk.CTkButton(row_conn, text="📡 Test", command=self._test_connection, width=80)
+        self.btn_test.pack(side="left", padx=3)
+
+        self.lbl_status = ctk.CTkLabel(self.sidebar, text="Durum: 🔴 Bağlı değil", text_color="#bbbbbb")
+        self.lbl_status.grid(row=3, column=0, padx=16, pady=(0, 8), sticky="w")
+
+        self.devices_combo_var = tk.StringVar(value="Cihaz: (bilinmiyor)")
+        self.devices_combo = ctk.CTkComboBox(self.sidebar, variable=self.devices_combo_var, values=["Cihaz: (yok)"], width=240, state="readonly")
+        self.devices_combo.grid(row=4, column=0, padx=16, pady=(0, 6), sticky="w")
+        row_dev = ctk.CTkFrame(self.sidebar, fg_color="transparent")
+        row_dev.grid(row=5, column=0, padx=12, pady=(0, 10), sticky="w")
+        self.btn_refresh_dev = ctk.CTkButton(row_dev, text="🔄 Cihazları Yenile", command=self._refresh_devices, width=134)
+        self.btn_refresh_dev.pack(side="left", padx=3)
+        self.btn_discover = ctk.CTkButton(row_dev, text="📶 Ağda Bul", command=self._discover_devices, width=100)
+        self.btn_discover.pack(side="left", padx=3)
+
+        # Filters
+        ctk.CTkLabel(self.sidebar, text="Filtreler", font=("Segoe UI", 16, "bold")).grid(row=6, column=0, padx=16, pady=(12, 2), sticky="w")
+        self.search = ctk.CTkEntry(self.sidebar, placeholder_text="İsim / numara / etiket ara", width=240)
+        self.search.grid(row=7, column=0, padx=16, pady=(6, 6), sticky="w")
+        self.search.bind("<KeyRelease>", lambda e: self._refresh_list())
+
+        self.chk_fav_var = tk.BooleanVar(value=self.settings.get("filtre_favori", False))
+        self.chk_fav = ctk.CTkCheckBox(self.sidebar, text="Sadece favoriler", variable=self.chk_fav_var, command=self._refresh_list)
+        self.chk_fav.grid(row=8, column=0, padx=16, pady=(0, 6), sticky="w")
+
+        self.entry_tag = ctk.CTkEntry(self.sidebar, placeholder_text="Etikete göre filtre (virgülle ayır)", width=240)
+        self.entry_tag.insert(0, self.settings.get("son_etiket", ""))
+        self.entry_tag.grid(row=9, column=0, padx=16, pady=(0, 12), sticky="w")
+        self.entry_tag.bind("<KeyRelease>", lambda e: self._refresh_list())
+
+        # Import/Export
+        self.btn_import = ctk.CTkButton(self.sidebar, text="📥 Rehber Yükle", command=self._import_json, width=240)
+        self.btn_import.grid(row=10, column=0, padx=16, pady=(4, 4), sticky="w")
+        self.btn_export = ctk.CTkButton(self.sidebar, text="📤 Rehber Dışa Aktar", command=self._export_json, width=240)
+        self.btn_export.grid(row=11, column=0, padx=16, pady=(4, 8), sticky="w")
+
+        # Device info
+        self.device_info_box = ctk.CTkTextbox(self.sidebar, height=80, width=240)
+        self.device_info_box.grid(row=20, column=0, padx=16, pady=(0, 10), sticky="ew")
+        self.device_info_box.insert("end", "Cihaz bilgisi yok.\n")
+        self.device_info_box.configure(state="disabled")
+
+        # Quick tools
+        ctk.CTkLabel(self.sidebar, text="Hızlı Araçlar", font=("Segoe UI", 14)).grid(row=21, column=0, padx=16, pady=(0, 2), sticky="w")
+        self.entry_package = ctk.CTkEntry(self.sidebar, placeholder_text="com.whatsapp", width=240)
+        self.entry_package.grid(row=22, column=0, padx=16, pady=(0, 4), sticky="w")
+        self.btn_launch_app = ctk.CTkButton(self.sidebar, text="📱 Uygulama Aç", command=self._launch_app, width=240)
+        self.btn_launch_app.grid(row=23, column=0, padx=16, pady=(0, 6), sticky="w")
+
+        self.btn_screenshot = ctk.CTkButton(self.sidebar, text="📸 Ekran Görüntüsü", command=self._take_screenshot, width=240)
+        self.btn_screenshot.grid(row=24, column=0, padx=16, pady=(0, 10), sticky="w")
+
+        self.btn_telemetry = ctk.CTkButton(self.sidebar, text="📈 Telemetri", command=self._open_telemetry, width=240)
+        self.btn_telemetry.grid(row=25, column=0, padx=16, pady=(0, 10), sticky="w")
+
+        self.btn_record = ctk.CTkButton(self.sidebar, text="🎥 Ekran Kaydı", command=self._toggle_recording, width=240)
+        self.btn_record.grid(row=26, column=0, padx=16, pady=(0, 10), sticky="w")
+
+        self.btn_logview = ctk.CTkButton(self.sidebar, text="📜 Log Görüntüleyici", command=self._open_logview, width=240)
+        self.btn_logview.grid(row=27, column=0, padx=16, pady=(0, 10), sticky="w")
+
+        # Center (Contact list)
+        self.center = ctk.CTkFrame(self.tab_main, corner_radius=16)
+        self.center.grid(row=0, column=1, sticky="nsew", padx=(8, 8), pady=0)
+        self.center.grid_rowconfigure(1, weight=1)
+        self.center.grid_columnconfigure(0, weight=1)
+
+        topbar = ctk.CTkFrame(self.center, fg_color="transparent")
+        topbar.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+        self.lbl_list = ctk.CTkLabel(topbar, text="Rehber", font=("Segoe UI", 20, "bold"))
+        self.lbl_list.pack(side="left")
+
+        self.btn_add = ctk.CTkButton(topbar, text="➕ Kişi", width=90, command=self._add_person)
+        self.btn_add.pack(side="right", padx=(6, 0))
+        self.btn_save = ctk.CTkButton(topbar, text="💾 Kaydet", width=90, command=self._save_people)
+        self.btn_save.pack(side="right", padx=(6, 0))
+        self.btn_reload = ctk.CTkButton(topbar, text="🔁 Yenile", width=90, command=self._reload_people)
+        self.btn_reload.pack(side="right", padx=(6, 0))
+
+        self.list_frame = ctk.CTkScrollableFrame(self.center, label_text="Kişiler", corner_radius=14)
+        self.list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+
+        # Right (Contact details)
+        self.right = ctk.CTkFrame(self.tab_main, corner_radius=16)
+        self.right.grid(row=0, column=2, sticky="nsne", padx=(8, 0), pady=0)
+        for i in range(12):
+            self.right.grid_rowconfigure(i, weight=0)
+        self.right.grid_rowconfigure(12, weight=1)
+
+        self.lbl_detail = ctk.CTkLabel(self.right, text="Seçilen Kişi", font=("Segoe UI", 20, "bold"))
+        self.lbl_detail.grid(row=0, column=0, padx=16, pady=(16, 6), sticky="w")
+
+        self.detail_name = ctk.CTkEntry(self.right, placeholder_text="Ad")
+        self.detail_name.grid(row=1, column=0, padx=16, pady=6, sticky="ew")
+
+        self.detail_number = ctk.CTkEntry(self.right, placeholder_text="Numara")
+        self.detail_number.grid(row=2, column=0, padx=16, pady=6, sticky="ew")
+
+        self.detail_tags = ctk.CTkEntry(self.right, placeholder_text="Etiketler (virgülle)")
+        self.detail_tags.grid(row=3, column=0, padx=16, pady=6, sticky="ew")
+
+        self.fav_var = tk.BooleanVar(value=False)
+        self.detail_fav = ctk.CTkCheckBox(self.right, text="Favori", variable=self.fav_var)
+        self.detail_fav.grid(row=4, column=0, padx=16, pady=(0, 10), sticky="w")
+
+        self.profil_resim_label = ctk.CTkLabel(self.right, text="Profil Resmi Yok", width=120, height=120, corner_radius=60, fg_color="#444444", justify="center")
+        self.profil_resim_label.grid(row=5, column=0, padx=16, pady=10, sticky="n")
+
+        self.btn_profil_sec = ctk.CTkButton(self.right, text="📁 Profil Resmi Seç", command=self._select_profile_image)
+        self.btn_profil_sec.grid(row=6, column=0, padx=16, pady=(0, 10), sticky="ew")
+
+        self.btn_call_now = ctk.CTkButton(self.right, text="📞 Hemen Ara", command=self._call_now)
+        self.btn_call_now.grid(row=7, column=0, padx=16, pady=6, sticky="ew")
+
+        self.btn_call_dialer = ctk.CTkButton(self.right, text="📲 Telefon Uygulaması", command=self._call_dialer)
+        self.btn_call_dialer.grid(row=8, column=0, padx=16, pady=6, sticky="ew")
+
+        self.sms_entry = ctk.CTkEntry(self.right, placeholder_text="SMS metni")
+        self.sms_entry.grid(row=9, column=0, padx=16, pady=(6, 4), sticky="ew")
+        self.btn_sms = ctk.CTkButton(self.right, text="✉️ SMS Gönder", command=self._open_sms)
+        self.btn_sms.grid(row=10, column=0, padx=16, pady=(4, 10), sticky="ew")
+
+        self.btn_delete = ctk.CTkButton(self.right, text="🗑️ Kişiyi Sil", fg_color="#8b1e1e", hover_color="#691515", command=self._delete_person)
+        self.btn_delete.grid(row=11, column=0, padx=16, pady=(2, 10), sticky="ew")
+
+        self.logbox = ctk.CTkTextbox(self.right, height=180)
+        self.logbox.grid(row=12, column=0, padx=16, pady=(6, 16), sticky="nsew")
+        self.logbox.bind("<Return>", self._log_command_entered)
+
+    def _on_first_map(self, event):
+        # Pencere ekrana eşlendi; bekleyen çizimler bittiğinde (after_idle) ilk çerçeve görünür
+        if event.widget is self and not self._startup_reported:
+            self._startup_reported = True
+            self.after_idle(self._report_startup)
+
+    def _report_startup(self):
+        """İlk çerçeve çizildiğinde başlangıç süresini (süreç başlangıcından) ölç ve logla"""
+        elapsed_ms = (time.perf_counter() - self._t_start) * 1000
+        durum = "hedef içinde" if elapsed_ms <= STARTUP_TARGET_MS else "HEDEF AŞILDI"
+        self._log_ui(f"İlk çerçeve: {elapsed_ms:.0f} ms (hedef {STARTUP_TARGET_MS} ms, {durum})")
+
+    def _on_tab_changed(self):
+        if self.notebook.get() == TAB_APPS:
+            self._ensure_apps_tab()
+        elif self.notebook.get() == TAB_FILES:
+            self._ensure_files_tab()
+
+    def _ensure_apps_tab(self):
+        """Uygulamalar sekmesini ilk kullanımda oluştur"""
+        if self._apps_tab_built:
+            return
+        self._apps_tab_built = True
+        self._create_apps_tab()
+
+    def _create_apps_tab(self):
+        """Uygulamalar sekmesini oluştur"""
+        # Sol panel - Uygulama kontrolleri
+        apps_left = ctk.CTkFrame(self.tab_apps, corner_radius=16)
+        apps_left.grid(row=0, column=0, sticky="nsw", padx=(0, 8), pady=0)
+        
+        ctk.CTkLabel(apps_left, text="Uygulama Yönetimi", font=("Segoe UI", 20, "bold")).grid(row=0, column=0, padx=16, pady=(16, 10), sticky="w")
+        
+        # ADB durumu (sekme geç oluşturulduğu için ana sekmedeki durumu devral)
+        status_text = self.lbl_status.cget("text") if self.adb.connected else "Durum: Bağlantı gerekli"
+        self.apps_status = ctk.CTkLabel(apps_left, text=status_text, text_color="#bbbbbb")
+        self.apps_status.grid(row=1, column=0, padx=16, pady=(0, 10), sticky="w")
+        
+        # Sistem uygulamaları seçeneği
+        self.include_system_var = tk.BooleanVar(value=False)
+        self.chk_system = ctk.CTkCheckBox(apps_left, text="Sistem uygulamaları dahil", variable=self.include_system_var)
+        self.chk_system.grid(row=2, column=0, padx=16, pady=(0, 10), sticky="w")
+        
+        # Listele butonu
+        self.btn_list_apps = ctk.CTkButton(apps_left, text="📱 Uygulamaları Listele", command=self._list_apps, width=240, height=40)
+        self.btn_list_apps.grid(row=3, column=0, padx=16, pady=(0, 15), sticky="w")
+        
+        # Arama kutusu
+        ctk.CTkLabel(apps_left, text="Arama", font=("Segoe UI", 14, "bold")).grid(row=4, column=0, padx=16, pady=(0, 5), sticky="w")
+        self.app_search = ctk.CTkEntry(apps_left, placeholder_text="Uygulama ara...", width=240)
+        self.app_search.grid(row=5, column=0, padx=16, pady=(0, 15), sticky="w")
+        self.app_search.bind("<KeyRelease>", self._filter_apps)
+        
+        # Hızlı işlemler
+        ctk.CTkLabel(apps_left, text="Hızlı İşlemler", font=("Segoe UI", 14, "bold")).grid(row=6, column=0, padx=16, pady=(0, 5), sticky="w")
+        
+        self.apps_package_entry = ctk.CTkEntry(apps_left, placeholder_text="Paket adı", width=240)
+        self.apps_package_entry.grid(row=7, column=0, padx=16, pady=(0, 5), sticky="w")
+        
+        self.apps_launch_btn = ctk.CTkButton(apps_left, text="🚀 Uygulamayı Aç", command=self._launch_app, width=240)
+        self.apps_launch_btn.grid(row=8, column=0, padx=16, pady=(0, 10), sticky="w")
+        
+        # Dosya işlemleri
+        ctk.CTkLabel(apps_left, text="Dosya İşlemleri", font=("Segoe UI", 14, "bold")).grid(row=9, column=0, padx=16, pady=(10, 5), sticky="w")
+        
+        self.btn_push_file = ctk.CTkButton(apps_left, text="📤 Dosya Gönder", command=self._push_file, width=240)
+        self.btn_push_file.grid(row=10, column=0, padx=16, pady=(0, 5), sticky="w")
+        
+        self.btn_pull_file = ctk.CTkButton(apps_left, text="📥 Dosya Al", command=self._pull_file, width=240)
+        self.btn_pull_file.grid(row=11, column=0, padx=16, pady=(0, 5), sticky="w")
+
+        # APK yedekleme (paket adı kutusundaki uygulama)
+        ctk.CTkLabel(apps_left, text="APK Yedek", font=("Segoe UI", 14, "bold")).grid(row=12, column=0, padx=16, pady=(10, 5), sticky="w")
+        self.btn_apk_backup = ctk.CTkButton(apps_left, text="💾 APK Yedekle", command=self._backup_apk, width=240)
+        self.btn_apk_backup.grid(row=13, column=0, padx=16, pady=(0, 5), sticky="w")
+        self.btn_apk_restore = ctk.CTkButton(apps_left, text="♻️ Tüm Cihazlara Kur", command=self._restore_apk, width=240)
+        self.btn_apk_restore.grid(row=14, column=0, padx=16, pady=(0, 5), sticky="w")
+
+        # Ana uygulama listesi
+        apps_main = ctk.CTkFrame(self.tab_apps, corner_radius=16)
+        apps_main.grid(row=0, column=1, sticky="nsew", padx=(8, 0), pady=0)
+        apps_main.grid_rowconfigure(1, weight=1)
+        apps_main.grid_columnconfigure(0, weight=1)
+        
+        # Başlık
+        apps_topbar = ctk.CTkFrame(apps_main, fg_color="transparent")
+        apps_topbar.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+        
+        self.apps_title = ctk.CTkLabel(apps_topbar, text="Yüklü Uygulamalar", font=("Segoe UI", 20, "bold"))
+        self.apps_title.pack(side="left")
+        
+        self.apps_count = ctk.CTkLabel(apps_topbar, text="(0 uygulama)", font=("Segoe UI", 14))
+        self.apps_count.pack(side="left", padx=(10, 0))
+        
+        # Uygulama listesi
+        self.apps_frame = ctk.CTkScrollableFrame(apps_main, label_text="Uygulamalar")
+        self.apps_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+
+    def _update_apps_list(self):
+        """Uygulama listesi UI'sini güncelle"""
+        # Mevcut widget'ları temizle
+        for widget in self.apps_frame.winfo_children():
+            widget.destroy()
+            
+        if not self.filtered_apps:
+            lbl = ctk.CTkLabel(self.apps_frame, text="❌ Uygulama bulunamadı\n\n'📱 Uygulamaları Listele' butonuna basın", 
+                             font=("Segoe UI", 14), justify="center")
+            lbl.pack(pady=50)
+            self.apps_count.configure(text="(0 uygulama)")
+            return
+            
+        self.apps_count.configure(text=f"({len(self.filtered_apps)} uygulama)")
+            
+        for app in self.filtered_apps:
+            app_frame = ctk.CTkFrame(self.apps_frame, height=60)
+            app_frame.pack(fill="x", padx=5, pady=3)
+            app_frame.grid_propagate(False)
+            
+            # İkon alanı (şimdilik placeholder)
+            icon_frame = ctk.CTkFrame(app_frame, width=48, height=48, corner_radius=8)
+            icon_frame.grid(row=0, column=0, padx=10, pady=6, sticky="w")
+            icon_frame.grid_propagate(False)
+            
+            # Android ikonu emoji
+            icon_lbl = ctk.CTkLabel(icon_frame, text="📱", font=("Segoe UI", 20))
+            icon_lbl.pack(expand=True)
+            
+            # Uygulama bilgileri
+            info_frame = ctk.CTkFrame(app_frame, fg_color="transparent")
+            info_frame.grid(row=0, column=1, padx=10, pady=6, sticky="ew")
+            app_frame.grid_columnconfigure(1, weight=1)
+            
+            # Uygulama adı
+            app_name = app["name"][:40] + "..." if len(app["name"]) > 40 else app["name"]
+            name_lbl = ctk.CTkLabel(info_frame, text=app_name, font=("Segoe UI", 14, "bold"), anchor="w")
+            name_lbl.pack(fill="x", pady=(2, 0))
+            
+            # Paket adı
+            package_lbl = ctk.CTkLabel(info_frame, text=app["package"], font=("Segoe UI", 11), 
+                                     text_color="#888888", anchor="w")
+            package_lbl.pack(fill="x")
+            
+            # Butonlar
+            btn_frame = ctk.CTkFrame(app_frame, fg_color="transparent")
+            btn_frame.grid(row=0, column=2, padx=10, pady=6, sticky="e")
+            
+            # Aç butonu
+            btn_open = ctk.CTkButton(btn_frame, text="🚀 Aç", width=70, height=28,
+                                   command=lambda pkg=app["package"]: self._launch_app_from_list(pkg))
+            btn_open.pack(side="top", pady=2)
+            
+            # Kopyala butonu
+            btn_copy = ctk.CTkButton(btn_frame, text="📋 Kopyala", width=70, height=28,
+                                   command=lambda pkg=app["package"]: self._copy_package_name(pkg))
+            btn_copy.pack(side="top", pady=2)
+
+    def _copy_package_name(self, package_name: str):
+        """Paket adını panoya kopyala"""
+        try:
+            self.clipboard_clear()
+            self.clipboard_append(package_name)
+            self.update()
+            show_toast(self, f"📋 Kopyalandı: {package_name[:30]}...", 1500)
+            
+            # Entry'lere de yaz
+            self.entry_package.delete(0, "end")
+            self.entry_package.insert(0, package_name)
+            
+            self.apps_package_entry.delete(0, "end")
+            self.apps_package_entry.insert(0, package_name)
+            
+        except Exception:
+            show_toast(self, "Kopyalama başarısız", 1400)
+
+    def _launch_app(self):
+        """Uygulama aç (her iki entry'den de çalışır)"""
+        pkg = self.entry_package.get().strip()
+        if not pkg and self._apps_tab_built:
+            pkg = self.apps_package_entry.get().strip()
+        if not pkg:
+            show_toast(self, "Paket adı girin", 1400)
+            return
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        def job():
+            ok = self.adb.launch_app(pkg)
+            self._log_ui(f"{pkg} açma {'başarılı' if ok else 'başarısız'}")
+            self._toast("📱 Uygulama açıldı" if ok else "⚠️ Açma başarısız")
+        threading.Thread(target=job, daemon=True).start()
+
+    def _take_screenshot(self):
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        fp = filedialog.asksaveasfilename(title="Ekran görüntüsü kaydet", defaultextension=".png", filetypes=[("PNG", "*.png")])
+        if not fp:
+            return
+        def job():
+            ok = self.adb.screenshot(fp)
+            self._log_ui(f"Ekran görüntüsü {'alındı' if ok else 'alınamadı'}: {fp}")
+            self._toast("📸 Görüntü alındı" if ok else "⚠️ Alınamadı")
+        threading.Thread(target=job, daemon=True).start()
+
+    def _push_file(self):
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        fp = filedialog.askopenfilename(title="Gönderilecek dosyayı seç")
+        if not fp:
+            return
+        remote_fp = tk.simpledialog.askstring("Telefona yol", "Telefonda kaydedilecek yol (örn: /sdcard/Download/)")
+        if not remote_fp:
+            return
+        def job():
+            ok = self.adb.push_file(fp, remote_fp, verify=bool(self.settings.get("aktarim_dogrula")))
+            self._log_ui(f"Dosya gönderme {'başarılı' if ok else 'başarısız'}: {fp} → {remote_fp}")
+            self._toast("📤 Dosya gönderildi" if ok else "⚠️ Gönderilemedi")
+        threading.Thread(target=job, daemon=True).start()
+
+    def _pull_file(self):
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        remote_fp = tk.simpledialog.askstring("Telefondan yol", "Telefondan alınacak dosya yolu (örn: /sdcard/Download/test.txt)")
+        if not remote_fp:
+            return
+        fp = filedialog.asksaveasfilename(title="Bilgisayara kaydet", defaultextension="", filetypes=[("Tüm Dosyalar", "*.*")])
+        if not fp:
+            return
+        def job():
+            ok = self.adb.pull_file(remote_fp, fp, verify=bool(self.settings.get("aktarim_dogrula")))
+            self._log_ui(f"Dosya alma {'başarılı' if ok else 'başarısız'}: {remote_fp} → {fp}")
+            self._toast("📥 Dosya alındı" if ok else "⚠️ Alınamadı")
+        threading.Thread(target=job, daemon=True).start()
+
+    # ---- Dosya gezgini ----
+
+    def _ensure_files_tab(self):
+        """Dosyalar sekmesini ilk kullanımda oluştur ve /sdcard'ı listele"""
+        if self._files_tab_built:
+            return
+        self._files_tab_built = True
+        from pypirt_files import FileBrowser
+
+        self._fb = FileBrowser(self.adb)
+        self._fb_path = "/sdcard"
+        self._fb_entries = []  # klasör listesi ya da arama sonuçları (tamamı)
+        self._fb_page = 0
+        self._fb_mode = "dir"  # dir / search
+        self._fb_gen = 0  # eski iş parçacıklarından gelen sonuçları ayıklamak için
+
+        bar = ctk.CTkFrame(self.tab_files, fg_color="transparent")
+        bar.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 6))
+        bar.grid_columnconfigure(2, weight=1)
+        ctk.CTkButton(bar, text="⬆ Üst", width=70, command=self._fb_up).grid(row=0, column=0, padx=3)
+        ctk.CTkButton(bar, text="🔄", width=40, command=lambda: self._fb_open(self._fb_path, refresh=True)).grid(row=0, column=1, padx=3)
+        self.fb_path_entry = ctk.CTkEntry(bar, placeholder_text="/sdcard")
+        self.fb_path_entry.grid(row=0, column=2, padx=3, sticky="ew")
+        self.fb_path_entry.bind("<Return>", lambda e: self._fb_open(self.fb_path_entry.get()))
+        self.fb_search_entry = ctk.CTkEntry(bar, placeholder_text="Bu klasörde ara (alt klasörler dahil)", width=240)
+        self.fb_search_entry.grid(row=0, column=3, padx=3)
+        self.fb_search_entry.bind("<Return>", lambda e: self._fb_search())
+        ctk.CTkButton(bar, text="🔍 Ara", width=70, command=self._fb_search).grid(row=0, column=4, padx=3)
+        ctk.CTkButton(bar, text="⏹", width=40, command=lambda: self._fb.stop_search()).grid(row=0, column=5, padx=3)
+
+        # Büyük klasörlerde binlerce satır için widget başına satır yerine tek Listbox
+        box = ctk.CTkFrame(self.tab_files, corner_radius=12)
+        box.grid(row=1, column=0, sticky="nsew", padx=10, pady=0)
+        box.grid_rowconfigure(0, weight=1)
+        box.grid_columnconfigure(0, weight=1)
+        self.fb_list = tk.Listbox(box, selectmode="extended", activestyle="none", font=("Segoe UI", 12),
+                                  bg="#2b2b2b", fg="#dddddd", selectbackground="#1f6aa5",
+                                  highlightthickness=0, borderwidth=0)
+        self.fb_list.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=8)
+        scroll = ctk.CTkScrollbar(box, command=self.fb_list.yview)
+        scroll.grid(row=0, column=1, sticky="ns", pady=8)
+        self.fb_list.configure(yscrollcommand=scroll.set)
+        self.fb_list.bind("<Double-Button-1>", self._fb_activate)
+        self.fb_list.bind("<Return>", self._fb_activate)
+
+        foot = ctk.CTkFrame(self.tab_files, fg_color="transparent")
+        foot.grid(row=2, column=0, sticky="ew", padx=10, pady=(6, 10))
+        ctk.CTkButton(foot, text="◀", width=40, command=lambda: self._fb_turn(-1)).pack(side="left", padx=3)
+        self.fb_page_lbl = ctk.CTkLabel(foot, text="", width=260)
+        self.fb_page_lbl.pack(side="left", padx=6)
+        ctk.CTkButton(foot, text="▶", width=40, command=lambda: self._fb_turn(1)).pack(side="left", padx=3)
+        ctk.CTkButton(foot, text="📤 Buraya Gönder", width=150, command=self._fb_push).pack(side="right", padx=3)
+        ctk.CTkButton(foot, text="📥 Seçilenleri Al", width=150, command=self._fb_pull).pack(side="right", padx=3)
+
+        self._fb_open(self._fb_path)
+
+    def _fb_open(self, path: str, refresh: bool = False):
+        """Klasörü arka planda listele; ilk sayfa akış sırasında gösterilir"""
+        from pypirt_files import normpath
+
+        if not self.adb.connected:
+            self.fb_page_lbl.configure(text="Önce ADB bağlantısını kurun.")
+            return
+        path = normpath(path or "/")
+        self._fb.stop_search()
+        self._fb_gen += 1
+        gen = self._fb_gen
+        self._fb_path, self._fb_mode, self._fb_page, self._fb_entries = path, "dir", 0, []
+        self.fb_path_entry.delete(0, "end")
+        self.fb_path_entry.insert(0, path)
+        self.fb_list.delete(0, "end")
+        self.fb_page_lbl.configure(text="Yükleniyor...")
+
+        def job():
+            try:
+                entries = self._fb.list(path, refresh=refresh,
+                                        on_page=lambda batch: self._post(lambda: self._fb_stream(gen, batch)))
+                self._post(lambda: self._fb_loaded(gen, entries))
+            except Exception as e:
+                self._post(lambda e=e: self.fb_page_lbl.configure(text=f"Listelenemedi: {e}"))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _fb_stream(self, gen: int, batch):
+        """Liste tamamlanmadan gelen girişler: ilk sayfa dolana kadar olduğu gibi göster"""
+        if gen != self._fb_gen:
+            return
+        self._fb_entries.extend(batch)
+        room = self._page_size() - self.fb_list.size()
+        for e in batch[:max(0, room)]:
+            self.fb_list.insert("end", self._fb_row(e))
+        self.fb_page_lbl.configure(text=f"Yükleniyor... {len(self._fb_entries)} öğe")
+
+    def _fb_loaded(self, gen: int, entries):
+        if gen != self._fb_gen:
+            return
+        self._fb_entries = entries
+        self._fb_render()
+
+    @staticmethod
+    def _page_size() -> int:
+        from pypirt_files import PAGE
+        return PAGE
+
+    @staticmethod
+    def _fb_row(e) -> str:
+        if e.is_dir:
+            return f"📁  {e.name}"
+        if not e.mode:  # arama sonucu: tür bilinmiyor, tam yol gösterilir
+            return f"🔎  {e.path}"
+        size = e.size
+        for unit in ("B", "KB", "MB", "GB"):
+            if size < 1024 or unit == "GB":
+                break
+            size /= 1024
+        return f"📄  {e.name}    ({size:.0f} {unit})" if unit == "B" else f"📄  {e.name}    ({size:.1f} {unit})"
+
+    def _fb_view(self):
+        from pypirt_files import FileBrowser
+        return FileBrowser.page(self._fb_entries, self._fb_page, self._page_size())
+
+    def _fb_render(self):
+        self.fb_list.delete(0, "end")
+        self.fb_list.insert("end", *[self._fb_row(e) for e in self._fb_view()])
+        pages = max(1, -(-len(self._fb_entries) // self._page_size()))
+        what = "sonuç" if self._fb_mode == "search" else "öğe"
+        self.fb_page_lbl.configure(text=f"Sayfa {self._fb_page + 1}/{pages} — {len(self._fb_entries)} {what}")
+
+    def _fb_turn(self, step: int):
+        pages = max(1, -(-len(self._fb_entries) // self._page_size()))
+        page = min(max(0, self._fb_page + step), pages - 1)
+        if page != self._fb_page:
+            self._fb_page = page
+            self._fb_render()
+
+    def _fb_up(self):
+        import posixpath
+        self._fb_open(posixpath.dirname(self._fb_path) or "/")
+
+    def _fb_activate(self, event=None):
+        import posixpath
+        sel = self.fb_list.curselection()
+        view = self._fb_view()
+        if not sel or sel[0] >= len(view):
+            return
+        e = view[sel[0]]
+        if e.is_dir:
+            self._fb_open(e.path)
+        elif self._fb_mode == "search":
+            self._fb_open(posixpath.dirname(e.path))  # sonucun bulunduğu klasöre git
+
+    def _fb_search(self):
+        pattern = self.fb_search_entry.get().strip()
+        if not pattern:
+            self._fb_open(self._fb_path)
+            return
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        self._fb_gen += 1
+        gen = self._fb_gen
+        self._fb_mode, self._fb_page, self._fb_entries = "search", 0, []
+        self.fb_list.delete(0, "end")
+        self.fb_page_lbl.configure(text=f"Aranıyor: {pattern}")
+        root = self._fb_path
+
+        def job():
+            n = self._fb.search(root, pattern, lambda batch: self._post(lambda: self._fb_stream(gen, batch)))
+            self._post(lambda: self._fb_loaded(gen, self._fb_entries) if gen == self._fb_gen else None)
+            self._toast(f"🔍 {n} sonuç")
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _fb_pull(self):
+        view = self._fb_view()
+        chosen = [view[i] for i in self.fb_list.curselection() if i < len(view)]
+        if not chosen:
+            show_toast(self, "Önce dosya seçin", 1400)
+            return
+        local_dir = filedialog.askdirectory(title="Bilgisayarda kaydedilecek klasör")
+        if not local_dir:
+            return
+
+        def job():
+            results = self._fb.pull(chosen, Path(local_dir), verify=bool(self.settings.get("aktarim_dogrula")))
+            ok = sum(1 for _, r in results if r)
+            self._log_ui(f"Dosya alma: {ok}/{len(results)} öğe → {local_dir}")
+            self._toast(f"📥 {ok}/{len(results)} öğe alındı")
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _fb_push(self):
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        files = filedialog.askopenfilenames(title="Gönderilecek dosyaları seç")
+        if not files:
+            return
+        remote_dir = self._fb_path
+
+        def job():
+            results = self._fb.push(list(files), remote_dir, verify=bool(self.settings.get("aktarim_dogrula")))
+            ok = sum(1 for _, r in results if r)
+            self._log_ui(f"Dosya gönderme: {ok}/{len(results)} dosya → {remote_dir}")
+            self._toast(f"📤 {ok}/{len(results)} dosya gönderildi")
+            self._post(lambda: self._fb_open(remote_dir) if self._fb_path == remote_dir else None)
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _backup_apk(self):
+        pkg = self.apps_package_entry.get().strip()
+        if not pkg:
+            messagebox.showwarning(APP_NAME, "Paket adı girin.")
+            return
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        def job():
+            from pypirt_apk import backup
+            res = backup(self.adb, [pkg])[0]
+            self._toast(f"💾 {pkg} yedeklendi ({res.pulled} parça çekildi)" if res.ok else f"⚠️ Yedeklenemedi: {res.error}")
+        threading.Thread(target=job, daemon=True).start()
+
+    def _restore_apk(self):
+        pkg = self.apps_package_entry.get().strip()
+        if not pkg:
+            messagebox.showwarning(APP_NAME, "Paket adı girin.")
+            return
+        def job():
+            from pypirt_apk import restore
+            try:
+                results = restore(self.adb, self.adb.devices(), [pkg],
+                                  on_progress=lambda prog, r: self._toast(f"♻️ {prog.device}: {'kuruldu' if r.ok else 'başarısız'}"))
+            except LookupError as e:
+                self._toast(f"⚠️ {e}")
+                return
+            failed = sum(prog.failed for prog in results)
+            self._log_ui(f"{pkg} {len(results)} cihaza kuruldu, {failed} başarısız")
+        threading.Thread(target=job, daemon=True).start()
+
+    def _toggle_recording(self):
+        if self._recorder is not None and self._recorder.running:
+            self._recorder.stop()
+            return
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        fp = filedialog.asksaveasfilename(title="Ekran kaydını kaydet", defaultextension=".h264", filetypes=[("H.264", "*.h264")])
+        if not fp:
+            return
+        from pypirt_record import ScreenRecorder
+        self._recorder = ScreenRecorder(self.adb, Path(fp),
+                                        on_done=lambda st: self._post(lambda: self._on_recording_done(st)))
+        self._recorder.start()
+        self.btn_record.configure(text="⏹ Kaydı Durdur")
+        self._toast("🎥 Kayıt başladı")
+
+    def _on_recording_done(self, st):
+        self.btn_record.configure(text="🎥 Ekran Kaydı")
+        if st.error:
+            self._log_ui(f"Ekran kaydı hatası: {st.error}")
+        self._toast(f"🎥 Kayıt bitti: {st.bytes / 2 ** 20:.1f} MB, {st.bitrate_kbps:.0f} kbps" if st.segments else "⚠️ Kayıt alınamadı")
+
+    def _open_telemetry(self):
+        if self._telemetry_win is not None and self._telemetry_win.winfo_exists():
+            self._telemetry_win.focus()
+            return
+        self._telemetry_win = TelemetryWindow(self)
+
+    def _open_logview(self):
+        if self._logview_win is not None and self._logview_win.winfo_exists():
+            self._logview_win.focus()
+            return
+        self._logview_win = LogWindow(self)
+
+    def _list_apps(self):
+        """Telefondaki uygulamaları listele"""
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+            
+        include_system = self.include_system_var.get()
+
+        def job():
+            self._log_ui("Uygulamalar listeleniyor...")
+            self._toast("📱 Uygulamalar yükleniyor...", 2000)
+            
+            apps = self.adb.list_packages(system_apps=include_system)
+            
+            self._log_ui(f"{len(apps)} uygulama bulundu.")
+            
+            # UI'yi güncelle
+            self._post(lambda: self._on_apps_listed(apps), key="apps")
+            
+        threading.Thread(target=job, daemon=True).start()
+
+    def _on_apps_listed(self, apps: List[Dict[str, str]]):
+        self.all_apps = apps
+        self._filter_apps()
+
+    def _filter_apps(self, event=None):
+        """Uygulama listesini filtrele"""
+        search_term = self.app_search.get().lower().strip()
+        
+        if not search_term:
+            self.filtered_apps = self.all_apps.copy()
+        else:
+            self.filtered_apps = [
+                app for app in self.all_apps 
+                if search_term in app["name"].lower() or search_term in app["package"].lower()
+            ]
+            
+        self._update_apps_list()
+
+    def _launch_app_from_list(self, package_name: str):
+        """Listeden seçilen uygulamayı aç"""
+        if not self.adb.connected:
+            show_toast(self, "ADB bağlı değil!", 1400)
+            return
+            
+        def job():
+            ok = self.adb.launch_app(package_name)
+            self._log_ui(f"{package_name} açma {'başarılı' if ok else 'başarısız'}")
+            self._toast("📱 Uygulama açıldı" if ok else "⚠️ Açma başarısız")
+            
+        threading.Thread(target=job, daemon=True).start()
+
+    def _post(self, fn: Callable[[], None], key: Optional[str] = None):
+        """Herhangi bir iş parçacığından UI güncellemesi iste.
+
+        Ana döngü kuyruğu her karede bir kez boşaltır; aynı key ile gelen
+        güncellemelerden sadece en sonuncusu çalışır.
+        """
+        with self._ui_lock:
+            if key is None:
+                self._ui_calls.append(fn)
+            else:
+                self._ui_keyed[key] = fn
+
+    def _toast(self, text: str, ms: int = 1800):
+        self._post(lambda: show_toast(self, text, ms))
+
+    def _drain_ui(self):
+        with self._ui_lock:
+            calls, self._ui_calls = self._ui_calls, []
+            keyed, self._ui_keyed = self._ui_keyed, {}
+            logs, self._log_pending = self._log_pending, []
+        if logs:
+            try:
+                self.logbox.configure(state="normal")
+                self.logbox.insert("end", "\n".join(logs) + "\n")
+                self.logbox.see("end")
+                self.logbox.configure(state="disabled")
+            except Exception:
+                pass
+        for fn in calls + list(keyed.values()):
+            try:
+                fn()
+            except Exception as e:
+                append_log(f"UI güncelleme hatası: {e}")
+        self.after(UI_FRAME_MS, self._drain_ui)
+
+    def _log_ui(self, text: str):
+        """Log satırı ekle (her iş parçacığından güvenli; bir sonraki karede yazılır)"""
+        append_log(text)
+        with self._ui_lock:
+            self._log_pending.append(text)
+
+    def _on_log(self, text: str):
+        self._log_ui(text)
+
+    def _health_suffix(self) -> str:
+        return {HEALTH_OPEN: " — ⚠️ yanıt yok", HEALTH_DEGRADED: " — 🐢 yavaş"}.get(self._health_state, "")
+
+    def _on_health_change(self, health):
+        """Bir cihazın sağlık durumu değişti (herhangi bir iş parçacığından çağrılır)"""
+        name = health.device or "Cihaz"
+        if health.state == HEALTH_OPEN:
+            self._log_ui(f"{name} yanıt vermiyor; bağlantı dönene kadar komutlar beklemeden düşecek.")
+            self._toast(f"⚠️ {name} yanıt vermiyor", 3000)
+        elif health.state == HEALTH_DEGRADED:
+            self._log_ui(f"{name} yavaş yanıt veriyor (zaman aşımı: {health.timeouts}).")
+        else:
+            self._log_ui(f"{name} yeniden yanıt veriyor.")
+        if health.device == (self.adb.serial or self.adb.target or ""):
+            self._post(lambda: self._show_health(health.state), key="saglik")
+
+    def _show_health(self, state: str):
+        self._health_state = state
+        label = self._status_label + self._health_suffix()
+        self.lbl_status.configure(text=label)
+        if self._apps_tab_built:
+            self.apps_status.configure(text=label)
+
+    def _publish_status(self, ok: bool, model: Optional[str] = None):
+        """İş parçacığında cihaz bilgisini topla, durumu UI'ye gönder.
+
+        Art arda gelen durum güncellemeleri tek bir çizime indirgenir.
+        """
+        info = self.adb.get_device_info() if ok else None
+        self._post(lambda: self._set_status(ok, model, info), key="status")
+
+    def _set_devices(self, devs: List[str]):
+        self.devices_combo.configure(values=devs)
+        self.devices_combo_var.set(devs[0])
+
+    def _set_status(self, ok: bool, model: Optional[str] = None, info: Optional[DeviceInfo] = None):
+        """Durum güncelle (hem ana hem apps sekmesi için); ADB çağrısı yapmaz"""
+        if ok:
+            label = f"Durum: 🟢 Bağlı"
+            if model:
+                label += f" — {model}"
+        else:
+            label = "Durum: 🔴 Bağlı değil"
+        self._status_label = label
+        label += self._health_suffix()
+
+        self.lbl_status.configure(text=label)
+        if self._apps_tab_built:
+            self.apps_status.configure(text=label)
+        
+        self.btn_connect.configure(state=("disabled" if ok else "normal"))
+        self.btn_disconnect.configure(state=("normal" if ok else "disabled"))
+
+        if ok and info is not None:
+            self.device_info_box.configure(state="normal")
+            self.device_info_box.delete("1.0", "end")
+            self.device_info_box.insert("end", f"Model: {info.model or '?'}\nMarka: {info.brand or '?'}\nAndroid: {info.android_version or '?'}\n")
+            level = info.battery_level
+            if self._telemetry is not None:
+                latest = self._telemetry.latest(self._telemetry.devices[0], "battery_level")
+                if latest is not None:
+                    level = f"{latest:.0f}"
+            if level:
+                self.device_info_box.insert("end", f"Pil: %{level}\n")
+            self.device_info_box.configure(state="disabled")
+        else:
+            self.device_info_box.configure(state="normal")
+            self.device_info_box.delete("1.0", "end")
+            self.device_info_box.insert("end", "Cihaz bilgisi yok.\n")
+            self.device_info_box.configure(state="disabled")
+
+    def _connect(self):
+        target = self.entry_ip.get().strip()
+        self.settings["son_hedef"] = target
+        self._settings_saver.schedule()
+
+        def job():
+            ok = self.adb.connect(target)
+            model = None
+            if ok:
+                model = self.adb.device_model()
+            self._publish_status(ok, model)
+            if ok:
+                self._toast(f"✅ Bağlandı: {target}")
+                self._probe_transports()
+            else:
+                self._post(lambda: messagebox.showwarning(APP_NAME, "Bağlantı kurulamadı. IP:Port ve ağ durumunu kontrol edin."))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _probe_transports(self, serials: Optional[List[str]] = None):
+        """Cihazların tüm bağlantı yollarını ölç; birden çok yolu olanları logla"""
+        from pypirt_transport import probe_all, router, summary
+        try:
+            probe_all(self.adb, serials)
+        except Exception as e:
+            self._log_ui(f"Bağlantı yolları ölçülemedi: {e}")
+            return
+        for row in summary(router.groups()):
+            if len(row["yollar"]) > 1:
+                paths = ", ".join(f"{t['serial']} {t['rtt_ms']:g} ms / {t['mbps']:g} MB/sn" for t in row["yollar"])
+                self._log_ui(f"{row['device']}: {paths} → komutlar {row['gecikme']}, aktarımlar {row['aktarim']}")
+
+    def _disconnect(self):
+        def job():
+            self.adb.disconnect()
+            self._publish_status(False)
+            self._toast("🔌 Bağlantı kesildi", 1400)
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _test_connection(self):
+        def job():
+            try:
+                devs = self.adb.devices()
+                if not devs:
+                    self._post(lambda: messagebox.showerror(APP_NAME, "❌ Telefon bulunamadı."))
+                    self._publish_status(False)
+                    return
+                model = self.adb.device_model()
+                self._publish_status(True, model)
+                self._post(lambda: messagebox.showinfo(APP_NAME, f"✅ Telefon bağlı!\nCihaz: {devs[0]}{(' — ' + model) if model else ''}"))
+            except Exception as e:
+                self._post(lambda e=e: messagebox.showerror(APP_NAME, f"Bağlantı testi başarısız:\n{e}"))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _refresh_devices(self):
+        def job():
+            try:
+                devs = self.adb.devices()
+                if not devs:
+                    self._post(lambda: self._set_devices(["(cihaz yok)"]), key="devices")
+                    self._publish_status(False)
+                    self._toast("Cihaz bulunamadı")
+                else:
+                    self._post(lambda: self._set_devices(devs), key="devices")
+                    if len(devs) > 1:
+                        self._probe_transports(devs)  # tek telefon USB + Wi-Fi ise -s olmadan da yol seçilir
+                    self._publish_status(True, self.adb.device_model())
+                    self._toast(f"{len(devs)} cihaz")
+            except Exception as e:
+                self._post(lambda e=e: messagebox.showerror(APP_NAME, f"Cihazlar listelenemedi:\n{e}"))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _discover_devices(self):
+        """mDNS + alt ağ taramasıyla kablosuz cihazları bul, paralel bağlan, listeye modelleriyle ekle"""
+        from pypirt_discover import connect_all, discover
+
+        self.btn_discover.configure(state="disabled")
+        self._toast("📶 Ağda cihaz aranıyor...")
+
+        def job():
+            try:
+                found = connect_all(self.adb, discover(self.adb))
+                models = {f.address: f.model for f in found if f.connected}
+                devs = self.adb.devices()
+                labels = [f"{d} — {models[d]}" if models.get(d) else d for d in devs] or ["(cihaz yok)"]
+                self._post(lambda: self._set_devices(labels), key="devices")
+                if models and not self.adb.connected:
+                    target = next(iter(models))
+                    self.adb.target = target
+                    self.adb.connected = True
+                    self._publish_status(True, models[target])
+                waiting = [f.address for f in found if not f.connected]
+                msg = f"📶 {len(found)} cihaz bulundu, {len(models)} bağlandı"
+                if waiting:
+                    msg += f" ({len(waiting)} eşleştirme bekliyor)"
+                self._toast(msg)
+            except Exception as e:
+                self._post(lambda e=e: messagebox.showerror(APP_NAME, f"Cihaz bulma başarısız:\n{e}"))
+            finally:
+                self._post(lambda: self.btn_discover.configure(state="normal"))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _adb_version_check(self):
+        try:
+            ver = self.adb.version().splitlines()[0]
+            self._log_ui(ver)
+        except Exception:
+            pass
+
+    def _auto_check_status(self):
+        """Bağlantı durumunu otomatik kontrol et"""
+        while True:
+            try:
+                time.sleep(10)  # 10 saniyede bir kontrol et
+                if hasattr(self, 'adb') and self.adb:
+                    devs = self.adb.devices()
+                    if not devs:
+                        self._publish_status(False)
+                    else:
+                        model = self.adb.device_model()
+                        self._publish_status(True, model)
+                else:
+                    break
+            except Exception:
+                self._publish_status(False)
+
+    # ...existing code (rehber metodları)...
+
+    def _load_people_async(self):
+        """Rehberi arka planda oku, bitince listeyi kademeli olarak çiz"""
+        # Yüklenirken yapılan düzenlemeler yeni liste gelince kaybolurdu: önce bekleyenler yazılır,
+        # yükleme bitene kadar ekleme/içe aktarma/kaydetme kapalı kalır
+        if self._rehber_loaded:
+            self._rehber_saver.flush()
+        self._rehber_loaded = False
+        self.selected_index = None
+        self._set_rehber_busy(True)
+        self._refresh_list()
+
+        def job():
+            try:
+                kisiler = read_rehber()
+                err = None
+            except Exception as e:
+                kisiler, err = [], e
+            index = SearchIndex(kisiler)  # Arama dizini de UI dışında kurulur
+            self._post(lambda: self._on_people_loaded(kisiler, err, index))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _on_people_loaded(self, kisiler: List[Kisi], err: Optional[Exception], index: SearchIndex):
+        self.kisiler = kisiler
+        self._search_index = index
+        self.selected_index = None
+        self._rehber_loaded = True
+        self._set_rehber_busy(False)
+        self._refresh_list()
+        if err is not None:
+            # Boş listeyle yapılacak ilk kayıt okunamayan dosyanın üzerine yazar: önce yedeklenir,
+            # yedeklenemezse rehber yeniden okunana kadar kayıt kapalı kalır
+            try:
+                backup = backup_rehber()
+                self._rehber_locked = False
+                note = f"Okunamayan dosya yedeklendi: {backup}"
+            except Exception as e:
+                self._rehber_locked = True
+                note = f"Dosya yedeklenemedi ({e}); rehber yeniden okunana kadar kayıt kapalı."
+            self._log_ui(f"Rehber okunamadı: {err}. {note}")
+            messagebox.showerror(APP_NAME, f"Rehber okunamadı: {err}\n\n{note}")
+        else:
+            self._rehber_locked = False
+            self._log_ui(f"Rehber yüklendi: {len(kisiler)} kişi")
+
+    def _refresh_list(self):
+        query = self.search.get().strip()
+        tags = [t for t in self.entry_tag.get().split(",") if t.strip()]
+        favonly = self.chk_fav_var.get()
+
+        # Yarım kalmış eski çizimleri geçersiz kıl
+        self._render_gen += 1
+        gen = self._render_gen
+
+        for widget in self.list_frame.winfo_children():
+            widget.destroy()
+
+        if not self._rehber_loaded:
+            ctk.CTkLabel(self.list_frame, text="Rehber yükleniyor...").pack(pady=20)
+            return
+
+        # Sorgu varsa dizin sıralı sonuç verir (tam eşleşme ve favoriler önce);
+        # favori/etiket süzgeçleri dizindeki bit maskeleriyle uygulanır
+        if query:
+            indices = self._search_index.search(query, favori=favonly, etiketler=tags)
+        else:
+            indices = self._search_index.filter(favori=favonly, etiketler=tags)
+        self._render_rows(gen, indices, 0)
+
+    def _render_rows(self, gen: int, indices: List[int], start: int):
+        """Satırları RENDER_CHUNK'lık parçalar halinde çiz, arada UI'ye nefes aldır"""
+        if gen != self._render_gen:
+            return
+        for idx in indices[start:start + RENDER_CHUNK]:
+            self._render_row(idx)
+        nxt = start + RENDER_CHUNK
+        if nxt < len(indices):
+            self.after(1, lambda: self._render_rows(gen, indices, nxt))
+
+    def _thumbnail(self, path: str) -> Optional[ctk.CTkImage]:
+        """32x32 liste küçük resmi (dosya değişmedikçe önbellekten)"""
+        try:
+            key = (path, Path(path).stat().st_mtime)
+        except OSError:
+            return None
+        img_ctk = self._thumb_cache.get(key)
+        if img_ctk is None:
+            img = square_thumbnail(path, 32)
+            img_ctk = ctk.CTkImage(light_image=img, dark_image=img, size=(32, 32))
+            self._thumb_cache[key] = img_ctk
+        return img_ctk
+
+    def _render_row(self, idx: int):
+        kisi = self.kisiler[idx]
+        row = ctk.CTkFrame(self.list_frame)
+        row.pack(fill="x", padx=8, pady=6)
+
+        # Profil fotoğrafı küçük gösterimi (CTkImage kullanarak)
+        if PIL_AVAILABLE and kisi.profil_foto:
+            try:
+                img_ctk = self._thumbnail(kisi.profil_foto)
+                if img_ctk is not None:
+                    lbl_img = ctk.CTkLabel(row, image=img_ctk, text="", width=32, height=32)
+                    lbl_img.pack(side="left", padx=(0, 8))
+            except Exception:
+                pass
+
+        star = "★" if kisi.favori else "☆"
+        btn = ctk.CTkButton(row, text=f"{star} {kisi.ad} — {kisi.numara}", fg_color="transparent", hover_color="#222222", text_color="white", anchor="w", command=lambda i=idx: self._select(i))
+        btn.pack(side="left", fill="x", expand=True)
+        fav_btn = ctk.CTkButton(row, text="Fav", width=44, command=lambda i=idx: self._toggle_fav(i))
+        fav_btn.pack(side="right", padx=(6, 0))
+        call_btn = ctk.CTkButton(row, text="Ara", width=44, command=lambda i=idx: self._quick_call(i))
+        call_btn.pack(side="right", padx=(6, 0))
+
+    def _toggle_fav(self, idx: int):
+        self.kisiler[idx].favori = not self.kisiler[idx].favori
+        self._search_index.update(idx, self.kisiler[idx])
+        self._refresh_list()
+        self._rehber_saver.schedule()
+
+    def _quick_call(self, idx: int):
+        self.selected_index = idx
+        self._call_now()
+
+    def _select(self, idx: int):
+        self.selected_index = idx
+        kisi = self.kisiler[idx]
+        self.detail_name.delete(0, "end")
+        self.detail_name.insert(0, kisi.ad)
+        self.detail_number.delete(0, "end")
+        self.detail_number.insert(0, kisi.numara)
+        self.detail_tags.delete(0, "end")
+        self.detail_tags.insert(0, ", ".join(kisi.etiketler))
+        self.fav_var.set(kisi.favori)
+        self._load_profile_image(kisi.profil_foto)
+
+    def _load_profile_image(self, image_path: Optional[str]):
+        # Eğer PIL mevcut değilse profil resimlerini devre dışı bırak
+        if not PIL_AVAILABLE:
+            self.profil_resim_label.configure(text="PIL gerekli")
+            return
+
+        if image_path and Path(image_path).exists():
+            try:
+                # Resim dosyasını aç, kare kırp ve 100x100 boyutuna getir
+                img = square_thumbnail(image_path, 100)
+                
+                # CTkImage kullan (HighDPI uyarısını önlemek için)
+                try:
+                    self.profil_resim_img = ctk.CTkImage(light_image=img, dark_image=img, size=(100, 100))
+                    self.profil_resim_label.configure(image=self.profil_resim_img, text="")
+                except:
+                    # Fallback: PhotoImage kullan
+                    _, ImageTk = _pil()
+                    self.profil_resim_img = ImageTk.PhotoImage(img)
+                    self.profil_resim_label.configure(image=self.profil_resim_img, text="")
+                
+            except Exception as ex:
+                self.profil_resim_img = None
+                self.profil_resim_label.configure(image="", text="Resim hatası")
+                self._log_ui(f"Profil resmi yükleme hatası: {ex}")
+        else:
+            self.profil_resim_img = None
+            self.profil_resim_label.configure(image="", text="Profil Resmi Yok")
+
+    def _select_profile_image(self):
+        if not PIL_AVAILABLE:
+            show_toast(self, "PIL/Pillow kütüphanesi gerekli", 2000)
+            return
+            
+        if self.selected_index is None:
+            show_toast(self, "Önce bir kişi seçin", 1400)
+            return
+            
+        fp = filedialog.askopenfilename(
+            title="Profil Resmi Seç", 
+            filetypes=[
+                ("Tüm Resim Dosyaları", "*.png *.jpg *.jpeg *.gif *.bmp"),
+                ("PNG Dosyaları", "*.png"),
+                ("JPEG Dosyaları", "*.jpg *.jpeg"),
+                ("Tüm Dosyalar", "*.*")
+            ]
+        )
+        if not fp:
+            return
+            
+        # Dosyanın gerçekten var olduğunu kontrol et
+        if not Path(fp).exists():
+            show_toast(self, "Seçilen dosya bulunamadı", 2000)
+            return
+            
+        self.kisiler[self.selected_index].profil_foto = fp
+        self._rehber_saver.schedule()
+        self._load_profile_image(fp)
+        show_toast(self, "Profil resmi seçildi")
+
+    def _read_detail_into_model(self) -> Optional[Kisi]:
+        if self.selected_index is None:
+            messagebox.showwarning(APP_NAME, "Önce listeden bir kişi seçin.")
+            return None
+        ad = self.detail_name.get().strip()
+        num = self.detail_number.get().strip()
+        tags = [t.strip() for t in self.detail_tags.get().split(",") if t.strip()]
+        fav = self.fav_var.get()
+        profil_foto = self.kisiler[self.selected_index].profil_foto
+        if not ad or not num:
+            messagebox.showwarning(APP_NAME, "Ad ve numara zorunludur.")
+            return None
+        self.kisiler[self.selected_index] = Kisi(ad=ad, numara=num, etiketler=tags, favori=fav, profil_foto=profil_foto)
+        self._search_index.update(self.selected_index, self.kisiler[self.selected_index])
+        self._refresh_list()
+        self._rehber_saver.schedule()  # içerik değişmediyse yazım atlanır
+        return self.kisiler[self.selected_index]
+
+    def _call_now(self):
+        kisi = self._read_detail_into_model()
+        if not kisi:
+            return
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+
+        def job():
+            ok = self.adb.call_immediate(kisi.numara)
+            self._log_ui(f"Arama başlatma {'başarılı' if ok else 'başarısız'}: {kisi.ad}")
+            self._toast("📞 Arama başlatıldı" if ok else "⚠️ Arama başlatılamadı")
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _call_dialer(self):
+        kisi = self._read_detail_into_model()
+        if not kisi:
+            return
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+
+        def job():
+            ok = self.adb.call_dialer(kisi.numara)
+            self._log_ui(f"Telefon uygulaması {'açıldı' if ok else 'açılamadı'}: {kisi.ad}")
+            self._toast("📲 Telefon uygulaması açıldı" if ok else "⚠️ Açılamadı")
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _open_sms(self):
+        kisi = self._read_detail_into_model()
+        if not kisi:
+            return
+        if not self.adb.connected:
+            messagebox.showwarning(APP_NAME, "Önce ADB bağlantısını kurun.")
+            return
+        body = self.sms_entry.get().strip()
+
+        def job():
+            ok = self.adb.open_sms(kisi.numara, body)
+            self._log_ui(f"SMS ekranı {'açıldı' if ok else 'açılamadı'}: {kisi.ad}")
+            self._toast("✉️ SMS ekranı açıldı" if ok else "⚠️ Açılamadı")
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _set_rehber_busy(self, busy: bool):
+        """Rehber yüklenirken listeyi değiştiren düğmeleri kapat"""
+        state = "disabled" if busy else "normal"
+        for btn in (self.btn_add, self.btn_import, self.btn_save):
+            btn.configure(state=state)
+
+    def _add_person(self):
+        if not self._rehber_loaded:
+            show_toast(self, "Rehber yükleniyor...", 1400)
+            return
+        dlg = ctk.CTkToplevel(self)
+        dlg.title("Yeni Kişi")
+        dlg.geometry("420x280")
+        
+        ctk.CTkLabel(dlg, text="Ad").pack(padx=12, pady=(14, 4))
+        e_ad = ctk.CTkEntry(dlg)
+        e_ad.pack(padx=12, pady=4, fill="x")
+        
+        ctk.CTkLabel(dlg, text="Numara").pack(padx=12, pady=4)
+        e_num = ctk.CTkEntry(dlg)
+        e_num.pack(padx=12, pady=4, fill="x")
+        
+        ctk.CTkLabel(dlg, text="Etiketler (virgülle)").pack(padx=12, pady=4)
+        e_tags = ctk.CTkEntry(dlg)
+        e_tags.pack(padx=12, pady=4, fill="x")
+        
+        var_fav = tk.BooleanVar(value=False)
+        ctk.CTkCheckBox(dlg, text="Favori", variable=var_fav).pack(padx=12, pady=6)
+
+        profil_resim_path = [None]
+
+        def on_profile_select():
+            if not PIL_AVAILABLE:
+                show_toast(dlg, "PIL/Pillow kütüphanesi gerekli", 2000)
+                return
+                
+            fp = filedialog.askopenfilename(
+                title="Profil Resmi Seç", 
+                filetypes=[
+                    ("Tüm Resim Dosyaları", "*.png *.jpg *.jpeg *.gif *.bmp"),
+                    ("PNG Dosyaları", "*.png"),
+                    ("JPEG Dosyaları", "*.jpg *.jpeg"),
+                    ("Tüm Dosyalar", "*.*")
+                ]
+            )
+            if fp and Path(fp).exists():
+                profil_resim_path[0] = fp
+                show_toast(dlg, "Resim seçildi")
+            elif fp:
+                show_toast(dlg, "Seçilen dosya bulunamadı", 2000)
+
+        ctk.CTkButton(dlg, text="📁 Profil Resmi Seç", command=on_profile_select).pack(padx=12, pady=6, fill="x")
+
+        def on_add_ok():
+            ad = e_ad.get().strip()
+            num = e_num.get().strip()
+            tags = [t.strip() for t in e_tags.get().split(",") if t.strip()]
+            fav = var_fav.get()
+            if not ad or not num:
+                messagebox.showwarning(APP_NAME, "Ad ve numara zorunlu.")
+                return
+            if not self._rehber_loaded:  # pencere açıkken yenileme başladı
+                messagebox.showwarning(APP_NAME, "Rehber yeniden yükleniyor; bitince tekrar deneyin.", parent=dlg)
+                return
+            self.kisiler.append(Kisi(ad=ad, numara=num, etiketler=tags, favori=fav, profil_foto=profil_resim_path[0]))
+            self._search_index.add(len(self.kisiler) - 1, self.kisiler[-1])
+            self._refresh_list()
+            self._rehber_saver.schedule()
+            show_toast(self, "Kişi eklendi")
+            dlg.destroy()
+
+        row = ctk.CTkFrame(dlg, fg_color="transparent")
+        row.pack(padx=12, pady=12, fill="x")
+        ctk.CTkButton(row, text="Ekle", command=on_add_ok).pack(side="left", expand=True, fill="x", padx=6)
+        ctk.CTkButton(row, text="İptal", command=dlg.destroy).pack(side="left", expand=True, fill="x", padx=6)
+
+        dlg.grab_set()
+
+    def _delete_person(self):
+        if self.selected_index is None:
+            show_toast(self, "Önce bir kişi seçin", 1400)
+            return
+        kisi = self.kisiler[self.selected_index]
+        if messagebox.askyesno(APP_NAME, f"'{kisi.ad}' kişisini silmek istediğine emin misin?"):
+            del self.kisiler[self.selected_index]
+            self._search_index.delete(self.selected_index)  # Sonraki sıralar kayar; dizin yeniden kurulmaz
+            self.selected_index = None
+            self.detail_name.delete(0, "end")
+            self.detail_number.delete(0, "end")
+            self.detail_tags.delete(0, "end")
+            self.fav_var.set(False)
+            self._load_profile_image(None)
+            self._refresh_list()
+            self._rehber_saver.schedule()
+            show_toast(self, "Kişi silindi")
+
+    def _write_rehber(self) -> bool:
+        """Rehberi kaydet (otomatik kayıt ve Ctrl+S); okunamayan dosya yedeklenmediyse yazmaz"""
+        if not self._rehber_loaded:
+            raise RuntimeError("Rehber henüz yüklenmedi; boş liste rehber.json'un üzerine yazılmıyor")
+        if self._rehber_locked:
+            raise RuntimeError("rehber.json okunamadığı ve yedeklenemediği için üzerine yazılmıyor")
+        return save_rehber(list(self.kisiler))
+
+    def _save_people(self):
+        if not self._rehber_loaded:
+            show_toast(self, "Rehber yükleniyor...", 1400)
+            return
+        if self.selected_index is not None:
+            self._read_detail_into_model()
+        try:
+            self._rehber_saver.flush()
+            self._write_rehber()  # bekleyen yazım yoksa ve içerik aynıysa diske dokunmaz
+        except Exception as e:
+            messagebox.showerror(APP_NAME, f"Rehber kaydedilemedi: {e}")
+            return
+        show_toast(self, "💾 Rehber kaydedildi", 1600)
+
+    def _reload_people(self):
+        self._load_people_async()
+        show_toast(self, "🔁 Rehber yenileniyor", 1400)
+
+    def _import_json(self):
+        if not self._rehber_loaded:
+            show_toast(self, "Rehber yükleniyor...", 1400)
+            return
+        fp = filedialog.askopenfilename(title="Rehber JSON seç", filetypes=[("JSON", "*.json")])
+        if not fp or not self._rehber_loaded:
+            return
+        # Okuma ve dizin kurma (büyük rehberlerde saniyeler) UI dışında; bitene kadar rehber kilitli
+        self._rehber_saver.flush()
+        self._rehber_loaded = False
+        self.selected_index = None
+        self._set_rehber_busy(True)
+        self._refresh_list()
+
+        def job():
+            try:
+                raw = json.loads(Path(fp).read_text(encoding="utf-8"))
+                kisiler = [Kisi(**k) for k in raw]
+                index, err = SearchIndex(kisiler), None
+            except Exception as e:
+                kisiler, index, err = None, None, e
+            self._post(lambda: self._on_import_done(kisiler, index, err))
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _on_import_done(self, kisiler: Optional[List[Kisi]], index: Optional[SearchIndex], err: Optional[Exception]):
+        if kisiler is not None:
+            self.kisiler = kisiler
+            self._search_index = index
+        self._rehber_loaded = True
+        self._set_rehber_busy(False)
+        self._refresh_list()
+        if err is not None:
+            messagebox.showerror(APP_NAME, f"JSON okunamadı: {err}")
+            return
+        self._rehber_saver.schedule()
+        messagebox.showinfo(APP_NAME, "Rehber içe aktarıldı; rehber.json'a otomatik kaydedilecek.")
+
+    def _export_json(self):
+        fp = filedialog.asksaveasfilename(title="Rehberi dışa aktar", defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not fp:
+            return
+        try:
+            Path(fp).write_text(json.dumps([asdict(k) for k in self.kisiler], ensure_ascii=False, indent=2), encoding="utf-8")
+            messagebox.showinfo(APP_NAME, "Rehber dışa aktarıldı.")
+        except Exception as e:
+            messagebox.showerror(APP_NAME, f"Yazılamadı: {e}")
+
+    def _on_close(self):
+        self.settings["filtre_favori"] = self.chk_fav_var.get()
+        self.settings["son_etiket"] = self.entry_tag.get()
+        self._settings_saver.close()
+        save_settings(self.settings)
+        self._rehber_saver.close()  # kapanıştan önceki son düzenlemeler
+        if self._http_server is not None:
+            self._http_server.stop()
+        if self._telemetry is not None:
+            self._telemetry.stop()
+        if self._recorder is not None:
+            self._recorder.stop()
+            self._recorder.wait(2)  # Kuyruktaki son parçalar diske yazılsın
+        if self._ui_watch is not None:
+            self._ui_watch.close()
+        health_registry.remove_listener(self._on_health_change)
+        self.destroy()
+
+    def _log_command_entered(self, event):
+        content = self.logbox.get("1.0", "end-1c")
+        lines = content.splitlines()
+        if not lines:
+            return "break"
+        last_line = lines[-1].strip()
+        cmd = last_line.lower()
+        m = re.match(r"(.+?)['']?i?[ ]?ara$", cmd)
+        if m:
+            isim = m.group(1).strip()
+            if not isim:
+                self._log_ui("Komut algılanamadı: isim bulunamadı.")
+            else:
+                self._call_person_by_name(isim)
+        else:
+            self._log_ui(f"Tanınmayan komut: {last_line}")
+        self.logbox.configure(state="normal")
+        self.logbox.insert("end", "\n")
+        self.logbox.see("end")
+        self.logbox.configure(state="disabled")
+        return "break"
+
+    def _call_person_by_name(self, isim: str):
+        idx = find_kisi_index(self.kisiler, isim)
+        if idx is None:
+            self._log_ui(f"'{isim}' adlı kişi bulunamadı.")
+            show_toast(self, f"'{isim}' bulunamadı.")
+            return
+        kisi = self.kisiler[idx]
+        self.selected_index = idx
+        self._select(idx)
+        if not self.adb.connected:
+            self._log_ui("ADB bağlı değil, önce bağlanın.")
+            show_toast(self, "ADB bağlı değil!")
+            return
+        def job():
+            ok = self.adb.call_immediate(kisi.numara)
+            self._log_ui(f"Komutla arama {'başarılı' if ok else 'başarısız'}: {kisi.ad}")
+            self._toast(f"📞 {kisi.ad} aranıyor..." if ok else "⚠️ Arama başarısız")
+        threading.Thread(target=job, daemon=True).start()
@@ -0,0 +1,219 @@
+"""PyPIRT cihaz sağlığı: uyarlanır zaman aşımları ve devre kesici.
+
+Her cihaz için ADBClient._run çağrılarının süreleri komut türüne göre
+("shell getprop", "shell dumpsys", "pull"...) tutulur. Yeterli örnek
+biriktiğinde zaman aşımı, istenen süreyi aşmamak kaydıyla, gözlenen p99
+sürenin birkaç katına indirilir: Wi-Fi'ı kopan bir cihazda 100 ms'de
+biten bir getprop 15 sn beklemez.
+
+Art arda OPEN_AFTER zaman aşımından sonra cihazın devresi açılır: o cihaza
+giden komutlar adb'yi hiç çalıştırmadan DeviceUnavailable (TimeoutExpired
+alt sınıfı; mevcut `except TimeoutExpired` blokları olduğu gibi çalışır)
+ile hemen düşer. Arka planda bir iş parçacığı artan aralıklarla hafif bir
+yoklama (`adb shell true`; Wi-Fi cihazlarda önce `adb connect`) yapar;
+yoklama başarılı olunca devre kapanır. Durum değişiklikleri (sağlıklı /
+yavaş / kopuk) dinleyicilere bildirilir; arayüz bunu "cihaz yanıt
+vermiyor" uyarısı olarak gösterir.
+
+Bu modül pypirt_core'u içe aktarmaz; çekirdek her komutta buraya danışır.
+Kayıt süreç genelindedir: for_device() ile açılan istemciler aynı cihazın
+sağlık bilgisini paylaşır.
+"""
+import itertools
+import re
+import subprocess
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Optional
+
+OK, DEGRADED, OPEN = "saglikli", "yavas", "kopuk"
+
+OPEN_AFTER = 3  # Devreyi açan art arda zaman aşımı
+MIN_SAMPLES = 8  # Uyarlanır zaman aşımı için gereken örnek
+SAMPLES = 64  # Komut türü başına tutulan son süreler
+MAX_KINDS = 64  # Cihaz başına izlenen komut türü
+FACTOR = 4.0  # Zaman aşımı = p99 * FACTOR + SLACK
+SLACK = 1.0
+MIN_TIMEOUT = 3.0  # Uyarlanan zaman aşımı en az
+ADAPT_UP_TO = 30  # Bundan uzun istenen zaman aşımları (aktarım, kurulum) uyarlanmaz
+PROBE_TIMEOUT = 3
+PROBE_INTERVALS = (1, 2, 4, 8, 15, 30)  # Devre açıkken yoklama aralıkları, saniye
+
+# Cihaza yönelik alt komutlar (-s verilmediğinde de tek cihaza gider)
+DEVICE_VERBS = {"shell", "exec-out", "push", "pull", "install", "install-multiple", "uninstall", "logcat",
+                 "get-state", "reboot", "forward", "reverse", "bugreport"}
+_TOKEN = re.compile(r"[\w.-]+")
+
+
+class DeviceUnavailable(subprocess.TimeoutExpired):
+    """Devre açık: komut çalıştırılmadan düşürüldü"""
+
+    def __init__(self, cmd, device: str):
+        super().__init__(cmd, 0)
+        self.device = device
+
+    def __str__(self):
+        return f"Cihaz yanıt vermiyor ({self.device}); yeniden bağlanması bekleniyor"
+
+
+def _pct(values, q: float) -> float:
+    s = sorted(values)
+    return s[min(len(s) - 1, int(q * len(s)))]
+
+
+def command_kind(args: List[str]) -> str:
+    """["adb", "-s", x, "shell", "dumpsys battery"] → "shell dumpsys" """
+    rest = args[3:] if args[1:2] == ["-s"] else args[1:]
+    if not rest:
+        return ""
+    kind = rest[0]
+    if kind in ("shell", "exec-out") and len(rest) > 1:
+        m = _TOKEN.match(rest[1].lstrip())
+        if m:
+            kind += " " + m.group(0)
+    return kind
+
+
+class DeviceHealth:
+    """Tek cihazın gecikme geçmişi ve devre durumu"""
+
+    def __init__(self, device: str, registry: "HealthRegistry"):
+        self.device = device
+        self.state = OK
+        self.timeouts = 0  # art arda
+        self.total_timeouts = 0
+        self.opened_at = 0.0
+        self.last_ok = 0.0
+        self._lat: "OrderedDict[str, deque]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._registry = registry
+
+    def check(self, args: List[str]):
+        """Devre açıksa komutu çalıştırmadan düşür"""
+        if self.state == OPEN:
+            raise DeviceUnavailable(args, self.device)
+
+    def timeout_for(self, kind: str, requested: Optional[float]) -> Optional[float]:
+        """İstenen zaman aşımı ya da (yeterli örnek varsa) gözlenen p99'dan türetilen daha kısası"""
+        if requested is None or requested > ADAPT_UP_TO:
+            return requested
+        with self._lock:
+            lat = self._lat.get(kind)
+            if lat is None or len(lat) < MIN_SAMPLES:
+                return requested
+            adaptive = _pct(lat, 0.99) * FACTOR + SLACK
+        return min(requested, max(MIN_TIMEOUT, adaptive))
+
+    def record(self, kind: str, seconds: float, sample: bool = True):
+        """Komut süresinde yanıt verdi; sample=False ise (hata çıkışı) süre örneklere girmez"""
+        with self._lock:
+            if sample:
+                lat = self._lat.get(kind)
+                if lat is None:
+                    lat = self._lat[kind] = deque(maxlen=SAMPLES)
+                    if len(self._lat) > MAX_KINDS:
+                        self._lat.popitem(last=False)
+                lat.append(seconds)
+            self.last_ok = time.time()
+            changed = self.state != OK
+            self.timeouts = 0
+            self.state = OK
+        if changed:
+            self._registry.notify(self)
+
+    def timed_out(self):
+        with self._lock:
+            self.timeouts += 1
+            self.total_timeouts += 1
+            before = self.state
+            if self.timeouts >= OPEN_AFTER:
+                self.state = OPEN
+                self.opened_at = time.time()
+            else:
+                self.state = DEGRADED
+            after = self.state
+        if after != before:
+            self._registry.notify(self)
+        if after == OPEN and before != OPEN:
+            threading.Thread(target=self._probe_loop, daemon=True).start()
+
+    def _probe_cmd(self) -> List[List[str]]:
+        base = ["adb", "-s", self.device] if self.device else ["adb"]
+        cmds = [base + ["shell", "true"]]
+        if ":" in self.device:  # Wi-Fi cihaz: kopmuşsa yeniden bağlan
+            cmds.insert(0, ["adb", "connect", self.device])
+        return cmds
+
+    def _probe_loop(self):
+        for i in itertools.count():
+            time.sleep(PROBE_INTERVALS[min(i, len(PROBE_INTERVALS) - 1)])
+            if self.state != OPEN:
+                return
+            try:
+                cp = None
+                for cmd in self._probe_cmd():
+                    cp = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                        stdin=subprocess.DEVNULL, timeout=PROBE_TIMEOUT)
+                if cp is not None and cp.returncode == 0:
+                    with self._lock:
+                        self.state, self.timeouts = OK, 0
+                        self.last_ok = time.time()
+                    self._registry.notify(self)
+                    return
+            except (subprocess.TimeoutExpired, OSError):
+                pass
+
+    def summary(self) -> Dict:
+        with self._lock:
+            kinds = {k: {"n": len(v), "p50_ms": round(_pct(v, 0.5) * 1000, 1),
+                         "p99_ms": round(_pct(v, 0.99) * 1000, 1)} for k, v in self._lat.items() if v}
+        return {"device": self.device, "state": self.state, "timeouts": self.timeouts,
+                "total_timeouts": self.total_timeouts, "last_ok": self.last_ok, "commands": kinds}
+
+
+class HealthRegistry:
+    """Cihaz → DeviceHealth; durum değişikliklerini dinleyicilere iletir"""
+
+    def __init__(self):
+        self._devices: Dict[str, DeviceHealth] = {}
+        self._listeners: List[Callable[[DeviceHealth], None]] = []
+        self._lock = threading.Lock()
+
+    def for_command(self, args: List[str], default_device: str = "") -> Optional[DeviceHealth]:
+        """Komut bir cihaza gidiyorsa o cihazın kaydı; adb devices/connect gibi komutlar için None"""
+        if args[1:2] == ["-s"] and len(args) > 2:
+            device = args[2]
+        elif len(args) > 1 and args[1] in DEVICE_VERBS:
+            device = default_device
+        else:
+            return None
+        return self.get(device)
+
+    def get(self, device: str) -> DeviceHealth:
+        with self._lock:
+            h = self._devices.get(device)
+            if h is None:
+                h = self._devices[device] = DeviceHealth(device, self)
+            return h
+
+    def all(self) -> List[DeviceHealth]:
+        with self._lock:
+            return list(self._devices.values())
+
+    def add_listener(self, fn: Callable[[DeviceHealth], None]):
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[DeviceHealth], None]):
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def notify(self, health: DeviceHealth):
+        for fn in list(self._listeners):
+            try:
+                fn(health)
+            except Exception:
+                pass
+
+
+registry = HealthRegistry()
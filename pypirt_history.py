@@ -0,0 +1,351 @@
+"""PyPIRT SMS ve arama geçmişi aynası.
+
+Cihazdaki SMS'ler (`content://sms`, gelen ve giden tüm klasörler) ve arama
+kaydı (`content://call_log/calls`) `content query` ile okunur ve yerel bir
+SQLite veritabanında (gecmis.db) tutulur. Çıktı satır satır okunur;
+çok satırlı mesaj gövdeleri bir sonraki "Row:" satırına kadar birleştirilir
+ve kayıtlar toplu halde yazılır, çıktının tamamı bellekte tutulmaz.
+
+Her cihaz (ro.serialno) ve kaynak için son görülen `_id` ve tarih saklanır;
+sonraki eşitlemeler yalnızca `_id > son OR date > son` satırlarını ister.
+(Cihaz sıfırlanıp kimlikler baştan başlasa bile yeni tarihli satırlar
+gelir; aynı kayıt (cihaz, kaynak, _id, tarih) ile bir kez tutulur.)
+
+Numaralar rakamlara indirilip son 10 hanesiyle anahtarlanır; aynı anahtar
+rehberdeki kişilerin numaralarından da üretildiğinden "+90 555..." ile
+"0555..." aynı kişiye bağlanır. Metin araması Türkçe harfleri ASCII'ye
+indirgenmiş bir sütun üzerindeki FTS5 dizinini kullanır (SQLite'ta FTS5
+yoksa LIKE'a düşer); isim sorguları kişi dizininden numara anahtarlarına
+çevrilir. Aylarca geçmişte arama milisaniyeler sürer.
+"""
+import re
+import shlex
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import pypirt_core
+from pypirt_core import ADBClient, Kisi, ascii_fold
+
+
+BATCH = 500  # Tek işlemde yazılan satır
+SOURCES = {
+    # tür: (uri, projeksiyon) — çok satırlı olabilen alan en sonda
+    "sms": ("content://sms", ("_id", "address", "date", "type", "body")),
+    "arama": ("content://call_log/calls", ("_id", "number", "date", "duration", "type", "name")),
+}
+SMS_TYPES = {1: "gelen", 2: "giden", 3: "taslak", 4: "giden kutusu", 5: "başarısız", 6: "sırada"}
+CALL_TYPES = {1: "gelen", 2: "giden", 3: "cevapsız", 4: "sesli mesaj", 5: "reddedilen", 6: "engellenen"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kayit (
+    id INTEGER PRIMARY KEY,
+    device TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    rid INTEGER NOT NULL,
+    date INTEGER NOT NULL,
+    number TEXT NOT NULL DEFAULT '',
+    num_key TEXT NOT NULL DEFAULT '',
+    type INTEGER NOT NULL DEFAULT 0,
+    duration INTEGER NOT NULL DEFAULT 0,
+    body TEXT NOT NULL DEFAULT '',
+    name TEXT NOT NULL DEFAULT '',
+    ara TEXT NOT NULL DEFAULT '',
+    UNIQUE (device, kind, rid, date)
+);
+CREATE INDEX IF NOT EXISTS kayit_tarih ON kayit (date);
+CREATE INDEX IF NOT EXISTS kayit_numara ON kayit (num_key, date);
+CREATE TABLE IF NOT EXISTS imlec (
+    device TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    last_id INTEGER NOT NULL DEFAULT 0,
+    last_date INTEGER NOT NULL DEFAULT 0,
+    synced REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (device, kind)
+);
+"""
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS kayit_fts USING fts5(ara, content='kayit', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS kayit_fts_ekle AFTER INSERT ON kayit BEGIN
+    INSERT INTO kayit_fts (rowid, ara) VALUES (new.id, new.ara);
+END;
+"""
+_WORD = re.compile(r"\w+")
+
+
+def default_db() -> Path:
+    return pypirt_core.DATA_DIR / "gecmis.db"
+
+
+def _fold(text: str) -> str:
+    # ASCII metinde translate tablosu gereksiz (ilk eşitlemede yüz binlerce satır)
+    return text.lower() if text.isascii() else ascii_fold(text)
+
+
+def number_key(numara: str) -> str:
+    """Numaranın karşılaştırma anahtarı: rakamlar, en çok son 10 hane (ülke/alan öneki farkı yok sayılır)"""
+    digits = re.sub(r"\D", "", numara or "").lstrip("0")
+    return digits[-10:]
+
+
+@dataclass
+class Record:
+    device: str
+    kind: str  # sms / arama
+    rid: int
+    date: int  # ms
+    number: str = ""
+    type: int = 0
+    duration: int = 0  # arama: saniye
+    body: str = ""
+    name: str = ""  # arama kaydındaki önbellek adı
+    kisi: str = ""  # rehberde eşleşen kişi
+
+    @property
+    def type_name(self) -> str:
+        return (SMS_TYPES if self.kind == "sms" else CALL_TYPES).get(self.type, str(self.type))
+
+    def to_dict(self) -> Dict:
+        d = asdict(self)
+        d["type_name"] = self.type_name
+        return d
+
+
+# ---- content query çıktısı ----
+
+
+def _split_row(text: str, keys: Sequence[str]) -> Optional[Dict[str, str]]:
+    """`Row: 3 _id=5, address=..., body=a, b` → alanlar; değerler sıradaki anahtara kadar sürer"""
+    head = text.find(" ", 5)
+    if head < 0:
+        return None
+    rest = text[head + 1:]
+    row: Dict[str, str] = {}
+    pos = 0
+    for i, key in enumerate(keys):
+        if not rest.startswith(key + "=", pos):
+            return None
+        start = pos + len(key) + 1
+        if i + 1 < len(keys):
+            end = rest.find(f", {keys[i + 1]}=", start)
+            if end < 0:
+                return None
+            pos = end + 2
+        else:
+            end = len(rest)
+        value = rest[start:end]
+        row[key] = "" if value == "NULL" else value
+    return row
+
+
+def parse_rows(lines: Iterable[str], keys: Sequence[str]) -> Iterator[Dict[str, str]]:
+    """Satır akışından kayıtlar; "Row:" ile başlamayan satırlar önceki kaydın devamıdır"""
+    cur: Optional[str] = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line.startswith("Row: "):
+            if cur is not None:
+                row = _split_row(cur, keys)
+                if row is not None:
+                    yield row
+            cur = line
+        elif cur is not None:
+            cur += "\n" + line
+    if cur is not None:
+        row = _split_row(cur, keys)
+        if row is not None:
+            yield row
+
+
+def _query_script(kind: str, last_id: int, last_date: int) -> str:
+    uri, keys = SOURCES[kind]
+    where = f"_id>{int(last_id)} OR date>{int(last_date)}"
+    return (f"content query --uri {uri} --projection {':'.join(keys)} "
+            f"--where {shlex.quote(where)} --sort {shlex.quote('_id ASC')}")
+
+
+def _int(value: str) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def device_id(client: ADBClient) -> str:
+    """Cihazın kalıcı kimliği (ro.serialno); Wi-Fi adresi değişse de aynı kalır"""
+    try:
+        out = (client._run(client._adb("shell", "getprop ro.serialno"), quiet=True).stdout or "").strip()
+    except Exception:
+        out = ""
+    return out.splitlines()[-1].strip() if out else (client.serial or client.target or "cihaz")
+
+
+# ---- Yerel depo ----
+
+
+class HistoryStore:
+    """Yerel SMS/arama veritabanı; eşitleme ve arama aynı bağlantıyı kilitle paylaşır"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else default_db()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+        self._index = None  # (kişi listesi kimliği, uzunluğu, SearchIndex)
+        with self._lock, self._db:
+            self._db.executescript(_SCHEMA)
+            try:
+                self._db.executescript(_FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:  # FTS5'siz SQLite derlemesi
+                self.fts = False
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def cursor(self, device: str, kind: str) -> tuple:
+        with self._lock:
+            row = self._db.execute("SELECT last_id, last_date FROM imlec WHERE device=? AND kind=?",
+                                   (device, kind)).fetchone()
+        return row or (0, 0)
+
+    def add(self, device: str, kind: str, rows: List[Dict[str, str]], cursor: tuple) -> int:
+        """Satırları ve ilerleyen imleci tek işlemde yaz; eklenen (yeni) satır sayısı"""
+        values = []
+        for r in rows:
+            number = r.get("address") or r.get("number") or ""
+            body, name = r.get("body", ""), r.get("name", "")
+            values.append((device, kind, _int(r["_id"]), _int(r["date"]), number, number_key(number),
+                           _int(r.get("type")), _int(r.get("duration")), body, name,
+                           _fold(" ".join((body, name, number)))))
+        with self._lock, self._db:
+            cur = self._db.executemany(
+                "INSERT OR IGNORE INTO kayit (device, kind, rid, date, number, num_key, type, duration, body, "
+                "name, ara) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            added = max(cur.rowcount, 0)  # yok sayılan (zaten olan) satırlar sayılmaz
+            self._db.execute("INSERT OR REPLACE INTO imlec (device, kind, last_id, last_date, synced) "
+                             "VALUES (?, ?, ?, ?, ?)", (device, kind, cursor[0], cursor[1], time.time()))
+        return added
+
+    def stats(self) -> List[Dict]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT k.device, k.kind, COUNT(*), MIN(k.date), MAX(k.date), i.synced FROM kayit k "
+                "LEFT JOIN imlec i ON i.device=k.device AND i.kind=k.kind GROUP BY k.device, k.kind").fetchall()
+        return [{"device": d, "kind": k, "count": n, "first": a, "last": b, "synced": s}
+                for d, k, n, a, b, s in rows]
+
+    def search(self, query: str = "", kisiler: Optional[List[Kisi]] = None, kind: Optional[str] = None,
+               device: Optional[str] = None, since_ms: Optional[int] = None, limit: int = 100) -> List[Record]:
+        """Metin, numara veya kişi adıyla ara; en yeniler önce.
+
+        Sorgu kelimeleri mesaj/ad/numara metninde önek olarak aranır (hepsi
+        uymalı); kişiler verilirse adı sorguya uyan kişilerin numaralarına
+        ait kayıtlar da gelir. Rakam sorgusu numara anahtarında aranır.
+        """
+        conds: List[str] = []
+        params: List = []
+        query = query.strip()
+        toks = _WORD.findall(_fold(query))
+        digits = number_key(query) if re.fullmatch(r"[\d\s+()\-]+", query) else ""
+        if len(digits) == 10:
+            conds.append("num_key = ?")  # tam numara: dizinden
+            params.append(digits)
+        elif digits:
+            conds.append("instr(num_key, ?) > 0")
+            params.append(digits)
+        elif toks:
+            if self.fts:
+                conds.append("id IN (SELECT rowid FROM kayit_fts WHERE kayit_fts MATCH ?)")
+                params.append(" ".join(f'"{t}"*' for t in toks))
+            else:
+                conds.append("(" + " AND ".join("ara LIKE ?" for _ in toks) + ")")
+                params += [f"%{t}%" for t in toks]
+            keys = self._contact_keys(query, kisiler) if kisiler else []
+            if keys:
+                conds.append(f"num_key IN ({','.join('?' * len(keys))})")
+                params += keys
+        where = [f"({' OR '.join(conds)})"] if conds else []
+        if kind:
+            where.append("kind = ?")
+            params.append(kind)
+        if device:
+            where.append("device = ?")
+            params.append(device)
+        if since_ms:
+            where.append("date >= ?")
+            params.append(int(since_ms))
+        sql = ("SELECT device, kind, rid, date, number, type, duration, body, name, num_key FROM kayit"
+               + (" WHERE " + " AND ".join(where) if where else "") + " ORDER BY date DESC LIMIT ?")
+        with self._lock:
+            rows = self._db.execute(sql, params + [int(limit)]).fetchall()
+        names = {number_key(k.numara): k.ad for k in kisiler or ()}
+        return [Record(*r[:9], kisi=names.get(r[9], "")) for r in rows]
+
+    def _contact_keys(self, query: str, kisiler: List[Kisi]) -> List[str]:
+        """Adı sorguya uyan kişilerin numara anahtarları (kişi dizini liste değişene dek saklanır)"""
+        from pypirt_search import SearchIndex
+
+        if self._index is None or self._index[:2] != (id(kisiler), len(kisiler)):
+            self._index = (id(kisiler), len(kisiler), SearchIndex(kisiler))
+        ids = self._index[2].search(query, limit=200)
+        return sorted({number_key(kisiler[i].numara) for i in ids} - {""})
+
+    def for_number(self, numara: str, limit: int = 100, kisiler: Optional[List[Kisi]] = None) -> List[Record]:
+        """Bir numaranın (kişinin) tüm geçmişi, en yeniler önce"""
+        key = number_key(numara)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT device, kind, rid, date, number, type, duration, body, name FROM kayit "
+                "WHERE num_key = ? ORDER BY date DESC LIMIT ?", (key, int(limit))).fetchall()
+        name = next((k.ad for k in kisiler or () if number_key(k.numara) == key), "")
+        return [Record(*r, kisi=name) for r in rows]
+
+
+# ---- Eşitleme ----
+
+
+def sync(client: ADBClient, store: HistoryStore, kinds: Sequence[str] = ("sms", "arama"),
+         device: Optional[str] = None) -> Dict[str, int]:
+    """Cihazdaki yeni satırları (imleçten sonrakileri) akış olarak oku ve depoya ekle"""
+    device = device or device_id(client)
+    added: Dict[str, int] = {}
+    for kind in kinds:
+        t0 = time.perf_counter()
+        last_id, last_date = store.cursor(device, kind)
+        cursor = (last_id, last_date)
+        proc = client.popen(client._adb("shell", _query_script(kind, last_id, last_date)))
+        added[kind] = 0
+        seen = 0
+        first: List[str] = []  # satır gelmezse hata iletisi için
+
+        def lines():
+            for line in proc.stdout:
+                if not first:
+                    first.append(line.strip())
+                yield line
+
+        batch: List[Dict[str, str]] = []
+        try:
+            for row in parse_rows(lines(), SOURCES[kind][1]):
+                batch.append(row)
+                cursor = (max(cursor[0], _int(row["_id"])), max(cursor[1], _int(row["date"])))
+                if len(batch) >= BATCH:
+                    added[kind] += store.add(device, kind, batch, cursor)
+                    seen += len(batch)
+                    batch = []
+            added[kind] += store.add(device, kind, batch, cursor)  # boş olsa da eşitleme zamanı yazılır
+            seen += len(batch)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+        if not seen and first and not first[0].startswith(("Row:", "No result")):
+            client.on_log(f"Geçmiş okunamadı ({kind}): {first[0]}")
+        client.on_log(f"Geçmiş eşitleme ({device}, {kind}): {seen} satır okundu, {added[kind]} yeni, "
+                      f"{time.perf_counter() - t0:.1f} sn")
+    return added
@@ -0,0 +1,313 @@
+"""PyPIRT uygulama adları (başlatıcı etiketleri).
+
+Uygulama adı APK'nın kaynaklarındadır; kabuktan okunabilecek bir yerde
+değildir. Önbellekte olmayan paketler için cihazda tek bir kabuk çağrısı
+her APK'dan yalnızca AndroidManifest.xml ve resources.arsc'yi çıkarır ve
+bunları tek bir (varsa gzip'li) tar akışı olarak gönderir. Uygulama başına
+ayrı adb gidiş-dönüşü yoktur. Bilgisayar tarafında ikili manifestten
+başlatıcı etkinliğinin (yoksa uygulamanın) etiketi bulunur ve kaynak
+tablosundan cihaz diline en uygun değer çözülür.
+
+Sonuçlar cihaz (ro.serialno) ve sürüm kodu başına önbelleğe yazılır;
+uygulama güncellenmedikçe bir daha çekilmez.
+"""
+import json
+import shlex
+import struct
+import tarfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pypirt_core
+from pypirt_core import ADBClient
+
+
+_RES_STRING_POOL, _RES_TABLE, _RES_XML = 0x0001, 0x0002, 0x0003
+_RES_XML_START, _RES_XML_END, _RES_XML_RESMAP = 0x0102, 0x0103, 0x0180
+_RES_PACKAGE, _RES_TYPE = 0x0200, 0x0201
+_T_REFERENCE, _T_STRING = 0x01, 0x03
+_ATTR_LABEL, _ATTR_NAME = 0x01010001, 0x01010003
+_NO_ENTRY = 0xFFFFFFFF
+
+
+def cache_path() -> Path:
+    return pypirt_core.DATA_DIR / "uygulama_adlari.json"
+
+
+class StringPool:
+    """ResStringPool; dizeler istendikçe çözülür (büyük tablolarda hepsi gerekmez)"""
+
+    def __init__(self, data: bytes, off: int):
+        header_size, self.size = struct.unpack_from("<HI", data, off + 2)
+        count, _, flags, strings_start, _ = struct.unpack_from("<5I", data, off + 8)
+        self.data = data
+        self.utf8 = bool(flags & 0x100)
+        self.offsets = struct.unpack_from(f"<{count}I", data, off + header_size)
+        self.base = off + strings_start
+        self._cache: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def get(self, i: int) -> str:
+        if i < 0 or i >= len(self.offsets):
+            return ""
+        s = self._cache.get(i)
+        if s is None:
+            s = self._cache[i] = self._decode(self.base + self.offsets[i])
+        return s
+
+    def _decode(self, p: int) -> str:
+        d = self.data
+        if self.utf8:
+            p += 2 if d[p] & 0x80 else 1  # karakter sayısı (kullanılmaz)
+            n = d[p]
+            if n & 0x80:
+                n = ((n & 0x7F) << 8) | d[p + 1]
+                p += 1
+            p += 1
+            return d[p:p + n].decode("utf-8", "replace")
+        n = struct.unpack_from("<H", d, p)[0]
+        p += 2
+        if n & 0x8000:
+            n = ((n & 0x7FFF) << 16) | struct.unpack_from("<H", d, p)[0]
+            p += 2
+        return d[p:p + 2 * n].decode("utf-16-le", "replace")
+
+
+def _chunks(data: bytes, start: int, end: int):
+    """(tür, konum, başlık boyu, boy) — [start, end) aralığındaki ardışık parçalar"""
+    p = start
+    while p + 8 <= end:
+        ctype, hsize, size = struct.unpack_from("<HHI", data, p)
+        if size < 8:
+            break
+        yield ctype, p, hsize, size
+        p += size
+
+
+def manifest_label(axml: bytes) -> Optional[Tuple[int, object]]:
+    """İkili manifestten başlatıcı etiketi: (_T_REFERENCE, kaynak no) veya (_T_STRING, metin)"""
+    if len(axml) < 8 or struct.unpack_from("<H", axml)[0] != _RES_XML:
+        return None
+    pool: Optional[StringPool] = None
+    resmap: Tuple[int, ...] = ()
+    app_label = None
+    activity = None  # {"label": ..., "launcher": bool}
+    filt = None  # intent-filter içindeki action/category adları
+    for ctype, p, hsize, size in _chunks(axml, 8, len(axml)):
+        if ctype == _RES_STRING_POOL:
+            pool = StringPool(axml, p)
+        elif ctype == _RES_XML_RESMAP:
+            resmap = struct.unpack_from(f"<{(size - hsize) // 4}I", axml, p + hsize)
+        elif ctype == _RES_XML_START and pool is not None:
+            _, name, a_start, a_size, a_count = struct.unpack_from("<IIHHH", axml, p + hsize)
+            tag = pool.get(name)
+            attrs = {}
+            for k in range(a_count):
+                q = p + hsize + a_start + k * a_size
+                _, a_name, raw, _, _, dtype, value = struct.unpack_from("<IIIHBBI", axml, q)
+                aid = resmap[a_name] if a_name < len(resmap) else 0
+                if aid in (_ATTR_LABEL, _ATTR_NAME):
+                    if dtype == _T_STRING or raw != _NO_ENTRY:
+                        attrs[aid] = (_T_STRING, pool.get(raw if raw != _NO_ENTRY else value))
+                    elif dtype == _T_REFERENCE:
+                        attrs[aid] = (_T_REFERENCE, value)
+            if tag == "application":
+                app_label = attrs.get(_ATTR_LABEL)
+            elif tag in ("activity", "activity-alias"):
+                activity = {"label": attrs.get(_ATTR_LABEL), "launcher": False}
+            elif tag == "intent-filter":
+                filt = set()
+            elif tag in ("action", "category") and filt is not None and _ATTR_NAME in attrs:
+                filt.add(attrs[_ATTR_NAME][1])
+        elif ctype == _RES_XML_END and pool is not None:
+            tag = pool.get(struct.unpack_from("<II", axml, p + hsize)[1])
+            if tag == "intent-filter" and activity is not None and filt is not None:
+                if {"android.intent.action.MAIN", "android.intent.category.LAUNCHER"} <= filt:
+                    activity["launcher"] = True
+                filt = None
+            elif tag in ("activity", "activity-alias") and activity is not None:
+                if activity["launcher"]:
+                    return activity["label"] or app_label
+                activity = None
+    return app_label
+
+
+class ResourceTable:
+    """resources.arsc; yalnızca istenen kaynak türlerinin parçaları dolaşılır"""
+
+    def __init__(self, arsc: bytes):
+        self.data = arsc
+        self.strings: Optional[StringPool] = None
+        self.types: Dict[Tuple[int, int], List[int]] = {}  # (paket, tür) → TYPE parça konumları
+        if len(arsc) < 12 or struct.unpack_from("<H", arsc)[0] != _RES_TABLE:
+            return
+        hsize = struct.unpack_from("<H", arsc, 2)[0]
+        for ctype, p, _, size in _chunks(arsc, hsize, len(arsc)):
+            if ctype == _RES_STRING_POOL and self.strings is None:
+                self.strings = StringPool(arsc, p)
+            elif ctype == _RES_PACKAGE:
+                phsize = struct.unpack_from("<H", arsc, p + 2)[0]
+                pkg_id = struct.unpack_from("<I", arsc, p + 8)[0]
+                for t, q, _, _ in _chunks(arsc, p + phsize, p + size):
+                    if t == _RES_TYPE:
+                        self.types.setdefault((pkg_id, arsc[q + 8]), []).append(q)
+
+    def _entry(self, q: int, index: int) -> Optional[Tuple[int, int]]:
+        """TYPE parçasında index'teki değer: (veri türü, veri)"""
+        d = self.data
+        hsize = struct.unpack_from("<H", d, q + 2)[0]
+        flags = d[q + 9]
+        count, entries_start = struct.unpack_from("<II", d, q + 12)
+        offs = q + hsize
+        if flags & 0x01:  # seyrek: (index, konum/4) çiftleri
+            off = None
+            for k in range(count):
+                idx, o = struct.unpack_from("<HH", d, offs + 4 * k)
+                if idx == index:
+                    off = o * 4
+                    break
+        elif index >= count:
+            return None
+        elif flags & 0x02:  # 16 bit konumlar
+            o = struct.unpack_from("<H", d, offs + 2 * index)[0]
+            off = None if o == 0xFFFF else o * 4
+        else:
+            o = struct.unpack_from("<I", d, offs + 4 * index)[0]
+            off = None if o == _NO_ENTRY else o
+        if off is None:
+            return None
+        e = q + entries_start + off
+        esize, eflags = struct.unpack_from("<HH", d, e)
+        if eflags & 0x08:  # sıkıştırılmış giriş (Android 14+)
+            return eflags >> 8, struct.unpack_from("<I", d, e + 4)[0]
+        if eflags & 0x01:  # karmaşık değer (stil, dizi...)
+            return None
+        _, _, dtype, value = struct.unpack_from("<HBBI", d, e + esize)
+        return dtype, value
+
+    def resolve(self, resid: int, lang: str = "", country: str = "", depth: int = 0) -> Optional[str]:
+        """Kaynak numarasını dizeye çöz; önce cihaz dili, sonra varsayılan yapılandırma"""
+        if self.strings is None or depth > 4:
+            return None
+        best, best_score = None, -1
+        for q in self.types.get((resid >> 24, (resid >> 16) & 0xFF), ()):
+            val = self._entry(q, resid & 0xFFFF)
+            if val is None:
+                continue
+            # TYPE başlığında yapılandırma 20. bayttan başlar: size(4) mcc(2) mnc(2) language(2) country(2)
+            cfg = q + 20
+            c_lang = self.data[cfg + 8:cfg + 10].rstrip(b"\0").decode("ascii", "replace")
+            c_country = self.data[cfg + 10:cfg + 12].rstrip(b"\0").decode("ascii", "replace")
+            if c_lang and c_lang == lang:
+                score = 3 if c_country == country else 2
+            elif not c_lang:
+                score = 1
+            else:
+                score = 0
+            if score > best_score:
+                best, best_score = val, score
+        if best is None:
+            return None
+        dtype, value = best
+        if dtype == _T_STRING:
+            return self.strings.get(value)
+        if dtype == _T_REFERENCE:
+            return self.resolve(value, lang, country, depth + 1)
+        return None
+
+
+def label_from_files(axml: bytes, arsc: bytes, locale: str = "") -> Optional[str]:
+    """Manifest + kaynak tablosundan etiket (çözülemezse None)"""
+    found = manifest_label(axml)
+    if found is None:
+        return None
+    kind, value = found
+    if kind == _T_STRING:
+        return value or None
+    lang, _, country = locale.replace("_", "-").partition("-")
+    return ResourceTable(arsc).resolve(value, lang.lower(), country.upper().split("-")[0])
+
+
+def _extract_script(entries: List[Tuple[str, str]]) -> str:
+    """Paketlerin manifest ve kaynak tablolarını tek tar akışına yazan betik"""
+    items = " ".join(shlex.quote(f"{pkg}={apk}") for pkg, apk in entries)
+    return ("T=/data/local/tmp/pypirt_lbl.$$; mkdir -p $T && cd $T || exit 1; "
+            "Z=cat; command -v gzip >/dev/null 2>&1 && Z='gzip -1'; "
+            f"(for e in {items}; do p=${{e%%=*}}; a=${{e#*=}}; mkdir -p $p; "
+            "unzip -o -q \"$a\" AndroidManifest.xml resources.arsc -d $p >/dev/null 2>&1; "
+            "tar -c $p 2>/dev/null; rm -rf $p; done) | $Z; cd /; rm -rf $T")
+
+
+def _resolve(client: ADBClient, pkg: str, got: Dict[str, bytes], locale: str) -> str:
+    """Tek paketin etiketi; bozuk manifest/kaynak tablosu yalnızca o paketi etkiler"""
+    try:
+        return label_from_files(got.get("AndroidManifest.xml", b""), got.get("resources.arsc", b""), locale) or ""
+    except (struct.error, IndexError, ValueError) as e:
+        client.on_log(f"Uygulama adı çözülemedi ({pkg}): {e}")
+        return ""
+
+
+def fetch_labels(client: ADBClient, entries: List[Tuple[str, str]], locale: str = "") -> Dict[str, str]:
+    """[(paket, apk yolu)] için etiketleri tek çağrıda çek ve çöz.
+
+    Dosyaları alınan her paket sonuçta yer alır (çözülemediyse ""); akış
+    yarıda kesildiği için alınamayanlar yer almaz.
+    """
+    if not entries:
+        return {}
+    labels: Dict[str, str] = {}
+    proc = client.popen(client._adb("exec-out", _extract_script(entries)), binary=True)
+    files: Dict[str, Dict[str, bytes]] = {}
+    complete = False
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode="r|*", ignore_zeros=True) as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                pkg, _, fname = member.name.partition("/")
+                got = files.setdefault(pkg, {})
+                got[fname] = tar.extractfile(member).read()
+                if len(got) == 2:  # paketin iki dosyası da geldi; belleği hemen bırak
+                    try:
+                        labels[pkg] = _resolve(client, pkg, got, locale)
+                    finally:
+                        files.pop(pkg)
+        complete = True
+    except (tarfile.TarError, OSError) as e:
+        client.on_log(f"Uygulama adları okunamadı: {e}")
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    if complete:
+        for pkg, got in files.items():  # resources.arsc'siz paketler (etiket düz metinse)
+            labels[pkg] = _resolve(client, pkg, got, locale)
+    return labels
+
+
+def _load_cache() -> Dict:
+    try:
+        return json.loads(cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def label_packages(client: ADBClient, entries: List[Tuple[str, str, str]], device_id: str,
+                   locale: str = "") -> Dict[str, str]:
+    """[(paket, apk yolu, sürüm anahtarı)] → {paket: etiket}; yalnızca önbellekte olmayanlar çekilir"""
+    cache = _load_cache()
+    dev = cache.setdefault(device_id or client.serial or "varsayilan", {})
+    key_of = {pkg: f"{version}|{locale}" for pkg, _, version in entries}
+    missing = [(pkg, apk) for pkg, apk, _ in entries if dev.get(pkg, [None])[0] != key_of[pkg]]
+    if missing:
+        fetched = fetch_labels(client, missing, locale)
+        for pkg, label in fetched.items():
+            if pkg in key_of:
+                dev[pkg] = [key_of[pkg], label]  # alınıp çözülemeyen de kaydedilir, tekrar çekilmez
+        try:
+            cache_path().write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        except OSError:
+            pass
+        client.on_log(f"Uygulama adları: {len(fetched)}/{len(missing)} paket çekildi, {len(entries) - len(missing)} önbellekten")
+    return {pkg: dev[pkg][1] for pkg, _, _ in entries if dev.get(pkg, ["", ""])[1]}
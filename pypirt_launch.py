@@ -0,0 +1,231 @@
+"""PyPIRT uygulama açma ve açılış süresi ölçümü.
+
+`monkey -p <paket> 1` rastgele olay üretecini başlatır, yavaştır ve süre
+vermez. Bunun yerine paketin başlatıcı etkinliği
+`cmd package resolve-activity` ile çözülür (birden çok paket tek kabuk
+çağrısında; sonuç cihaz başına önbellekte) ve `am start -W -n` ile açılır.
+-W, etkinlik çizilene kadar bekler ve sistemin ölçtüğü süreleri yazar:
+  * ThisTime: son etkinliğin açılışı,
+  * TotalTime: uygulama sürecinin başlatılması dahil toplam açılış,
+  * WaitTime: am'nin bekleme süresi (sistem yükü dahil).
+Android 10+ ayrıca LaunchState (COLD/WARM/HOT) bildirir.
+
+Ölçüm kipi:
+  * soğuk: `am force-stop` ile süreç öldürülür, ardından açılır;
+  * sıcak: uygulama açıkken ana ekrana dönülür (HOME), sonra yeniden açılır;
+    süreç ayakta olduğundan yalnızca etkinlik öne gelir.
+Her koşu ayrı bir satır (StartResult) olarak döner; summarize() paket ve
+kip başına dağılımı (en az, p50, p90, en çok, ortalama, sapma) çıkarır.
+Cihazlar paralel, bir cihazdaki paketler sırayla ölçülür (aynı cihazda
+eşzamanlı açılışlar birbirinin süresini bozar). Özetler bir önceki
+koşunun özetiyle karşılaştırılabilir; böylece açılış süresi gerilemeleri
+yakalanır.
+"""
+import json
+import re
+import shlex
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from pypirt_core import ADBClient
+
+
+COLD, WARM = "soguk", "sicak"
+MODES = (COLD, WARM)
+START_TIMEOUT = 60  # am start -W üst sınırı, saniye
+SETTLE = 1.0  # Koşular arasında cihazın durulması için bekleme, saniye
+REGRESSION_TOLERANCE = 15.0  # Önceki p50'ye göre izin verilen artış, %
+
+_activity_cache: Dict[str, Dict[str, str]] = {}
+_cache_lock = threading.Lock()
+_FIELD = re.compile(r"^(Status|LaunchState|Activity|ThisTime|TotalTime|WaitTime):\s*(.*?)\s*$", re.M)
+_COMPONENT = re.compile(r"^[\w.]+/[\w.$]+$")
+
+
+@dataclass
+class StartResult:
+    device: str
+    package: str
+    activity: str = ""
+    mode: str = ""  # soguk / sicak; tekil açılışta boş
+    run: int = 0
+    ok: bool = False
+    launch_state: str = ""  # COLD / WARM / HOT (Android 10+)
+    this_ms: Optional[int] = None
+    total_ms: Optional[int] = None
+    wait_ms: Optional[int] = None
+    error: str = ""
+    at: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _device_key(client: ADBClient) -> str:
+    return client.serial or client.target or ""
+
+
+def resolve_activities(client: ADBClient, packages: Sequence[str]) -> Dict[str, str]:
+    """Paket → başlatıcı bileşen (paket/.Etkinlik); önbellekte olmayanlar tek çağrıda çözülür"""
+    key = _device_key(client)
+    with _cache_lock:
+        cache = _activity_cache.setdefault(key, {})
+        missing = [p for p in packages if p not in cache]
+    if missing:
+        script = "; ".join(
+            f"echo @@{p}; cmd package resolve-activity --brief -c android.intent.category.LAUNCHER "
+            f"{shlex.quote(p)} 2>/dev/null | tail -n 1" for p in missing)
+        try:
+            out = client._run(client._adb("shell", script), quiet=True).stdout or ""
+        except Exception:
+            out = ""
+        found: Dict[str, str] = {}
+        current = None
+        for line in out.splitlines():
+            line = line.strip()
+            if line.startswith("@@"):
+                current = line[2:]
+            elif current and _COMPONENT.match(line):
+                found[current] = line
+        with _cache_lock:
+            cache.update(found)
+    with _cache_lock:
+        return {p: cache[p] for p in packages if p in cache}
+
+
+def parse_am_start(output: str) -> Dict[str, str]:
+    """`am start -W` çıktısındaki alanlar"""
+    return {k: v for k, v in _FIELD.findall(output or "")}
+
+
+def _fill(result: StartResult, output: str):
+    fields = parse_am_start(output)
+    status = fields.get("Status", "")
+    result.launch_state = fields.get("LaunchState", "")
+    for name, attr in (("ThisTime", "this_ms"), ("TotalTime", "total_ms"), ("WaitTime", "wait_ms")):
+        if fields.get(name, "").isdigit():
+            setattr(result, attr, int(fields[name]))
+    result.ok = status == "ok" and result.total_ms is not None
+    # "Warning: Activity not started, ... brought to the front" ok sayılır ama süre 0'dır; ölçüme girmez
+    notes = [ln.strip() for ln in (output or "").splitlines() if ln.strip().startswith(("Error", "Warning"))]
+    if notes:
+        result.error = notes[0]
+    elif not result.ok:
+        result.error = f"Status: {status}" if status else "Süre bildirilmedi"
+
+
+def start(client: ADBClient, package: str, mode: str = "", run: int = 0,
+          activity: Optional[str] = None) -> StartResult:
+    """Paketi başlatıcı etkinliğinden `am start -W` ile aç; mode: soguk (önce force-stop), sicak (önce HOME)"""
+    result = StartResult(device=_device_key(client), package=package, mode=mode, run=run, at=time.time())
+    if activity is None:
+        activity = resolve_activities(client, [package]).get(package)
+    if not activity:
+        result.error = "Başlatıcı etkinlik bulunamadı"
+        return result
+    result.activity = activity
+    prefix = ""
+    if mode == COLD:
+        prefix = f"am force-stop {shlex.quote(package)}; "
+    elif mode == WARM:
+        prefix = "input keyevent KEYCODE_HOME; sleep 0.5; "
+    try:
+        cp = client._run(client._adb("shell", prefix + f"am start -W -n {shlex.quote(activity)}"),
+                         timeout=START_TIMEOUT, quiet=True)
+    except Exception as e:
+        result.error = str(e) or type(e).__name__
+        return result
+    _fill(result, cp.stdout or "")
+    return result
+
+
+def benchmark(client: ADBClient, devices: Sequence[str], packages: Sequence[str], runs: int = 5,
+              modes: Sequence[str] = MODES, on_result: Optional[Callable[[StartResult], None]] = None,
+              settle: float = SETTLE) -> List[StartResult]:
+    """Her cihazda her paketi her kipte runs kez aç; cihazlar paralel"""
+    results: List[StartResult] = []
+    lock = threading.Lock()
+
+    def one_device(serial: str):
+        c = client.for_device(serial) if serial else client
+        activities = resolve_activities(c, packages)
+        for pkg in packages:
+            activity = activities.get(pkg)
+            for mode in modes:
+                if mode == WARM:
+                    # Sıcak ölçümden önce sürecin ayakta olduğundan emin ol (ölçülmez)
+                    start(c, pkg, activity=activity or "")
+                    time.sleep(settle)
+                for i in range(1, runs + 1):
+                    r = start(c, pkg, mode=mode, run=i, activity=activity or "")
+                    with lock:
+                        results.append(r)
+                    if on_result:
+                        on_result(r)
+                    time.sleep(settle)
+            try:
+                c._run(c._adb("shell", "am", "force-stop", pkg), quiet=True)
+            except Exception:
+                pass
+
+    with ThreadPoolExecutor(max_workers=max(1, len(devices)), thread_name_prefix="pypirt-acilis") as pool:
+        list(pool.map(one_device, devices or [""]))
+    return results
+
+
+def _pct(values: List[int], q: float) -> int:
+    s = sorted(values)
+    return s[min(len(s) - 1, int(q * len(s)))]
+
+
+def summarize(results: Sequence[StartResult]) -> List[Dict]:
+    """(cihaz, paket, kip) başına TotalTime dağılımı, ms"""
+    groups: Dict[tuple, List[StartResult]] = {}
+    for r in results:
+        groups.setdefault((r.device, r.package, r.mode), []).append(r)
+    out = []
+    for (device, package, mode), rs in sorted(groups.items()):
+        measured = [r for r in rs if r.ok and r.total_ms]
+        total = [r.total_ms for r in measured]
+        row = {"device": device, "package": package, "mode": mode, "n": len(rs), "failed": len(rs) - len(total)}
+        if total:
+            row.update({
+                "min": min(total), "p50": _pct(total, 0.5), "p90": _pct(total, 0.9), "max": max(total),
+                "mean": round(statistics.mean(total), 1),
+                "stdev": round(statistics.stdev(total), 1) if len(total) > 1 else 0.0,
+                "wait_p50": _pct([r.wait_ms or 0 for r in measured], 0.5),
+                "states": sorted({r.launch_state for r in measured if r.launch_state}),
+            })
+        out.append(row)
+    return out
+
+
+def compare(current: Sequence[Dict], baseline: Sequence[Dict],
+            tolerance: float = REGRESSION_TOLERANCE) -> List[Dict]:
+    """p50'si önceki özete göre tolerance %'den fazla artan (ya da artık açılamayan) satırlar"""
+    base = {(b["device"], b["package"], b["mode"]): b for b in baseline}
+    regressions = []
+    for row in current:
+        b = base.get((row["device"], row["package"], row["mode"]))
+        if b is None or "p50" not in b:
+            continue
+        if "p50" not in row:
+            regressions.append(dict(row, baseline_p50=b["p50"], change_pct=None))
+            continue
+        change = (row["p50"] - b["p50"]) / b["p50"] * 100 if b["p50"] else 0.0
+        if change > tolerance:
+            regressions.append(dict(row, baseline_p50=b["p50"], change_pct=round(change, 1)))
+    return regressions
+
+
+def save_summary(rows: Sequence[Dict], path: Path):
+    Path(path).write_text(json.dumps(list(rows), ensure_ascii=False, indent=1), encoding="utf-8")
+
+
+def load_summary(path: Path) -> List[Dict]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
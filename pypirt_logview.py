@@ -0,0 +1,387 @@
+"""PyPIRT log görüntüleyici ve dizini.
+
+PyPIRT.log hiç döndürülmediği için birkaç GB'a çıkabilir. Dosya belleğe
+eşlenir (mmap) ve okunmaz; sayfalar işletim sisteminin önbelleğinden gelir.
+Seyrek bir dizin her STRIDE baytta bir satır başının (konum, satır no,
+zaman) üçlüsünü tutar: GB başına yaklaşık 16 bin kayıt, birkaç yüz KB.
+Satır numaraları bloklar arasındaki "\\n" sayısından (bytes.count, C
+hızında) bulunur; bir satıra ya da zamana gitmek için önce dizinde ikili
+arama yapılır, sonra en çok bir blok taranır.
+
+Dizin artımlıdır: refresh() yalnızca son dizinlenen konumdan sonra eklenen
+tam satırları tarar ve PyPIRT.log.idx dosyasına yazılır; büyük bir log bir
+kez dizinlenir. Dosya kısalmış ya da değiştirilmişse dizin baştan kurulur.
+
+Düz metin araması mmap üzerinde find ile (büyük/küçük harf duyarsızsa
+SCAN_CHUNK'lık parçalar ASCII küçültülerek), düzenli ifade araması re ile
+yapılır; zaman aralığı verilirse yalnızca o aralığın baytları taranır.
+Sonuçlar üreteçle döner, bellek kullanımı dosya boyundan bağımsızdır.
+"""
+import bisect
+import datetime
+import hashlib
+import mmap
+import os
+import re
+import struct
+import threading
+from array import array
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import pypirt_core
+
+
+STRIDE = 64 * 1024  # Dizin kayıtları arası bayt
+PAGE = 200  # Görüntüleyicide bir sayfadaki satır
+SCAN_CHUNK = 4 << 20  # Büyük/küçük harf duyarsız aramada bir seferde kopyalanan bayt
+_IDX_MAGIC = b"PYPIRTX1"
+_IDX_HEAD = struct.Struct("<8sqqqqq")  # magic, stride, taranan bayt, satır, son zaman, baş özeti
+_TS = re.compile(rb"\[(\d{4})-(\d\d)-(\d\d) (\d\d):(\d\d):(\d\d)\]")
+
+
+def _count_nl(mm, start: int, end: int, chunk: int = 1 << 20) -> int:
+    """mmap[start:end] içindeki satır sonları; en çok chunk baytlık kopyalarla"""
+    n = 0
+    while start < end:
+        stop = min(end, start + chunk)
+        n += mm[start:stop].count(b"\n")
+        start = stop
+    return n
+
+
+def _parse_ts(mm, pos: int) -> Optional[int]:
+    """Satır başındaki [YYYY-MM-DD HH:MM:SS] → epoch saniye"""
+    m = _TS.match(mm, pos, pos + 21)
+    if m is None:
+        return None
+    try:
+        return int(datetime.datetime(*map(int, m.groups())).timestamp())
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse_time(text: str) -> float:
+    """"2026-10-19 14:30", "2026-10-19" ya da "14:30" (bugün) → epoch saniye"""
+    text = text.strip()
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(text, fmt).timestamp()
+        except ValueError:
+            pass
+    for fmt in ("%H:%M:%S", "%H:%M"):
+        try:
+            t = datetime.datetime.strptime(text, fmt).time()
+            return datetime.datetime.combine(datetime.date.today(), t).timestamp()
+        except ValueError:
+            pass
+    raise ValueError(f"Zaman anlaşılamadı: {text}")
+
+
+@dataclass
+class Hit:
+    offset: int
+    line: int  # 1'den başlar
+    time: str
+    text: str
+
+    def to_dict(self):
+        return asdict(self)
+
+
+class LogIndex:
+    """Büyük log dosyası için mmap + seyrek satır/zaman dizini"""
+
+    def __init__(self, path: Optional[Path] = None, stride: int = STRIDE, persist: bool = True):
+        self.path = Path(path) if path else pypirt_core.LOG_PATH
+        self.idx_path = self.path.with_name(self.path.name + ".idx") if persist else None
+        self.stride = stride
+        self._mm: Optional[mmap.mmap] = None
+        self._file = None
+        self._lock = threading.RLock()
+        self._reset()
+        self._load()
+        if self._upto:
+            self._remap()  # kayıtlı dizin: yalnızca eklenenler taranacak
+
+    # ---- dizin ----
+
+    def _reset(self):
+        self._offs = array("q")  # blok başı konumları (satır başı)
+        self._lines = array("q")  # blok başından önceki satır sayısı
+        self._times = array("q")  # blok başındaki satırın zamanı (zamansız satırda öncekinin)
+        self._upto = 0  # bu konuma kadar tam satırlar dizinlendi
+        self._nlines = 0
+        self._last_ts = 0
+        self._head = 0
+
+    def _head_sum(self) -> int:
+        """Dosya başının özeti; log değiştirilmiş/yeniden oluşturulmuşsa dizin atılır"""
+        with self.path.open("rb") as f:
+            return int.from_bytes(hashlib.blake2b(f.read(256), digest_size=8).digest(), "little") >> 1
+
+    def _load(self):
+        if self.idx_path is None or not self.idx_path.exists() or not self.path.exists():
+            return
+        try:
+            data = self.idx_path.read_bytes()
+            magic, stride, upto, nlines, last_ts, head = _IDX_HEAD.unpack_from(data)
+            if magic != _IDX_MAGIC or stride != self.stride or upto > self.path.stat().st_size:
+                return
+            if head != self._head_sum():
+                return
+            body = array("q")
+            body.frombytes(data[_IDX_HEAD.size:])
+            n = len(body) // 3
+            self._offs, self._lines, self._times = body[:n], body[n:2 * n], body[2 * n:3 * n]
+            self._upto, self._nlines, self._last_ts, self._head = upto, nlines, last_ts, head
+        except (OSError, struct.error, ValueError):
+            self._reset()
+
+    def _save(self):
+        if self.idx_path is None:
+            return
+        try:
+            tmp = self.idx_path.with_name(self.idx_path.name + ".tmp")
+            with tmp.open("wb") as f:
+                f.write(_IDX_HEAD.pack(_IDX_MAGIC, self.stride, self._upto, self._nlines, self._last_ts, self._head))
+                for arr in (self._offs, self._lines, self._times):
+                    arr.tofile(f)
+            os.replace(str(tmp), str(self.idx_path))
+        except OSError:
+            pass
+
+    def refresh(self) -> int:
+        """Eklenen tam satırları dizinle; yeni dizinlenen bayt sayısı"""
+        with self._lock:
+            size = self.path.stat().st_size if self.path.exists() else 0
+            if size < self._upto or (self._upto and self._head != self._head_sum()):
+                self._reset()  # log kısaltılmış ya da değiştirilmiş
+            if size == 0:
+                self._unmap()
+                return 0
+            if self._mm is None or len(self._mm) != size:
+                self._remap()
+            mm = self._mm
+            end = mm.rfind(b"\n", self._upto, size) + 1  # yarım kalan son satır sonraki sefere
+            if end <= self._upto:
+                return 0
+            if not self._upto:
+                self._head = self._head_sum()
+            start = self._upto
+            pos = start
+            next_cp = self._offs[-1] + self.stride if len(self._offs) else 0
+            while True:
+                if next_cp < pos:
+                    next_cp = pos
+                if next_cp >= end:
+                    break
+                if next_cp > 0 and mm[next_cp - 1] != 0x0A:  # satır başına hizala
+                    next_cp = mm.find(b"\n", next_cp, end) + 1
+                    if next_cp <= 0 or next_cp >= end:
+                        break
+                self._nlines += _count_nl(mm, pos, next_cp)
+                ts = _parse_ts(mm, next_cp)
+                if ts is None:
+                    ts = self._ts_before(next_cp, pos)
+                self._last_ts = ts
+                self._offs.append(next_cp)
+                self._lines.append(self._nlines)
+                self._times.append(ts)
+                pos = next_cp
+                next_cp += self.stride
+            self._nlines += _count_nl(mm, pos, end)
+            self._last_ts = self._ts_before(end, pos) or self._last_ts
+            self._upto = end
+            self._save()
+            return end - start
+
+    def _ts_before(self, pos: int, floor: int) -> int:
+        """pos'tan önceki en yakın zamanlı satırın zamanı (floor'a kadar geriye bakılır)"""
+        mm = self._mm
+        p = pos
+        while p > floor:
+            p = mm.rfind(b"\n[", max(floor - 1, 0), p - 1)
+            if p < 0:
+                break
+            ts = _parse_ts(mm, p + 1)
+            if ts is not None:
+                return ts
+        if floor == 0:
+            ts = _parse_ts(mm, 0)
+            if ts is not None:
+                return ts
+        return self._last_ts
+
+    def _line_ts(self, pos: int) -> int:
+        """Satırın zamanı; zamansız (devam) satırında bloğu içindeki önceki zamanlı satırınki"""
+        ts = _parse_ts(self._mm, pos)
+        if ts is not None:
+            return ts
+        i = bisect.bisect_right(self._offs, pos) - 1
+        if i < 0:
+            return self._ts_before(pos, 0)
+        return self._ts_before(pos, self._offs[i]) if pos > self._offs[i] else self._times[i]
+
+    def _remap(self):
+        self._unmap()
+        self._file = self.path.open("rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _unmap(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        with self._lock:
+            self._unmap()
+
+    # ---- sorgular ----
+
+    @property
+    def line_count(self) -> int:
+        return self._nlines
+
+    @property
+    def size(self) -> int:
+        return self._upto
+
+    def time_span(self) -> Tuple[int, int]:
+        """(ilk, son) satır zamanı, epoch saniye"""
+        if not self._upto:
+            return 0, 0
+        first = _parse_ts(self._mm, 0) or (self._times[0] if len(self._times) else 0)
+        return first, self._last_ts
+
+    def _block(self, i: int) -> Tuple[int, int, int]:
+        """i. blok: (başlangıç, bitiş, başlangıçtan önceki satır)"""
+        if i < 0:
+            start, lines = 0, 0
+        else:
+            start, lines = self._offs[i], self._lines[i]
+        end = self._offs[i + 1] if i + 1 < len(self._offs) else self._upto
+        return start, end, lines
+
+    def offset_for_line(self, line: int) -> int:
+        """1'den başlayan satır numarasının konumu"""
+        with self._lock:
+            line = max(1, min(line, self._nlines or 1))
+            i = bisect.bisect_right(self._lines, line - 1) - 1
+            start, _, before = self._block(i)
+            pos = start
+            for _ in range(line - 1 - before):
+                pos = self._mm.find(b"\n", pos, self._upto) + 1
+            return pos
+
+    def line_at(self, offset: int) -> int:
+        """Konumdaki satırın numarası (1'den)"""
+        with self._lock:
+            i = bisect.bisect_right(self._offs, offset) - 1
+            start, _, before = self._block(i)
+            return before + _count_nl(self._mm, start, offset) + 1
+
+    def offset_for_time(self, ts: float) -> int:
+        """Zamanı ts'den küçük olmayan ilk satırın konumu (yoksa dosya sonu)"""
+        with self._lock:
+            if not self._upto:
+                return 0
+            i = bisect.bisect_left(self._times, int(ts)) - 1
+            pos = self._offs[i] if i >= 0 else 0
+            mm = self._mm
+            while pos < self._upto:
+                line_ts = _parse_ts(mm, pos)
+                if line_ts is not None and line_ts >= ts:
+                    return pos
+                pos = mm.find(b"\n", pos, self._upto) + 1
+                if pos <= 0:
+                    break
+            return self._upto
+
+    def lines(self, offset: int, count: int = PAGE) -> List[Tuple[int, str]]:
+        """offset'ten başlayan en çok count satır: (konum, metin)"""
+        with self._lock:
+            out = []
+            mm = self._mm
+            pos = offset
+            while pos < self._upto and len(out) < count:
+                nl = mm.find(b"\n", pos, self._upto)
+                nl = self._upto if nl < 0 else nl
+                out.append((pos, mm[pos:nl].decode("utf-8", "replace")))
+                pos = nl + 1
+            return out
+
+    def back(self, offset: int, count: int = PAGE) -> int:
+        """offset'ten count satır önceki satırın konumu"""
+        with self._lock:
+            pos = offset
+            for _ in range(count):
+                if pos <= 0:
+                    return 0
+                pos = self._mm.rfind(b"\n", 0, pos - 1) + 1
+            return pos
+
+    def _finder(self, text: str, regex: bool, ignore_case: bool):
+        """(mmap, başlangıç, bitiş) → ilk eşleşmenin konumu ya da -1"""
+        if regex:
+            rx = re.compile(text.encode("utf-8"), re.IGNORECASE if ignore_case else 0)
+
+            def find(mm, pos: int, end: int) -> int:
+                m = rx.search(mm, pos, end)
+                return m.start() if m else -1
+            return find
+        needle = text.encode("utf-8")
+        if not ignore_case:
+            return lambda mm, pos, end: mm.find(needle, pos, end)
+        # re.IGNORECASE çok yavaş; ASCII küçültülmüş parçalarda düz find
+        needle = needle.lower()
+
+        def find_ci(mm, pos: int, end: int) -> int:
+            while pos < end:
+                stop = min(end, pos + SCAN_CHUNK)
+                i = mm[pos:min(end, stop + len(needle) - 1)].lower().find(needle)
+                if i >= 0:
+                    return pos + i
+                pos = stop
+            return -1
+        return find_ci
+
+    def search(self, text: str, since: Optional[float] = None, until: Optional[float] = None,
+               regex: bool = False, ignore_case: bool = True, limit: int = 1000) -> Iterator[Hit]:
+        """Metni (ya da düzenli ifadeyi) [since, until) aralığındaki satırlarda ara"""
+        with self._lock:
+            if not self._upto or not text:
+                return
+            start = self.offset_for_time(since) if since else 0
+            end = self.offset_for_time(until) if until else self._upto
+        find = self._finder(text, regex, ignore_case)
+        found = 0
+        line_no = None
+        counted_to = start
+        pos = start
+        while pos < end and found < limit:
+            with self._lock:
+                mm = self._mm  # refresh() yeniden eşlemiş olabilir; konumlar aynı kalır
+                if mm is None or self._upto < end:
+                    return  # log kısaltıldı
+                at = find(mm, pos, end)
+                if at < 0:
+                    return
+                ls = mm.rfind(b"\n", 0, at) + 1
+                le = mm.find(b"\n", at, self._upto)
+                le = self._upto if le < 0 else le
+                if line_no is None:
+                    line_no = self.line_at(ls)
+                else:
+                    line_no += _count_nl(mm, counted_to, ls)
+                counted_to = ls
+                line = mm[ls:le].decode("utf-8", "replace")
+                ts = self._line_ts(ls)
+            found += 1
+            yield Hit(offset=ls, line=line_no, text=line,
+                      time=datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else "")
+            pos = le + 1
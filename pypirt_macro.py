@@ -0,0 +1,244 @@
+"""PyPIRT giriş makroları.
+
+Her `adb shell input ...` çağrısı hem yeni bir adb oturumu hem de cihazda
+yeni bir JVM başlatır (≈300 ms). Burada makro adımları tek bir kabuk
+betiğine derlenir, cihaza bir kez gönderilir ve tek oturumda çalıştırılır;
+USB/Wi-Fi gecikmesi zamanlamayı bozmaz. Beklemeler göreli `sleep dt`
+değil, betik başından ölçülen mutlak son tarihlerdir: her adımdan önce
+geçen süre kabuğun kendi saatinden ($EPOCHREALTIME, yoksa /proc/uptime)
+okunur ve yalnızca kalan süre kadar uyunur. Böylece `input`/`sendevent`
+komutlarının kendi süreleri birikip makroyu kaydırmaz.
+
+Makro iki türlü adım içerebilir:
+  * Ham olaylar: cihazda `getevent -t` akışından kaydedilir ve `sendevent`
+    ile (JVM'siz) aynen geri oynatılır. Olay aygıtları (/dev/input/eventN)
+    cihaza özgü olduğundan aynı model cihazlarda oynatılmalıdır.
+  * Üst düzey adımlar (tap, swipe, text, key): `input` komutlarına
+    derlenir, her cihazda çalışır; JVM maliyeti sürer ama adb gidiş-dönüşü
+    ve bekleme kayması ortadan kalkar.
+"""
+import json
+import re
+import shlex
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pypirt_core import ADBClient
+
+
+REMOTE_SCRIPT = "/data/local/tmp/pypirt_macro.sh"
+MIN_SLEEP = 0.005  # Bundan kısa beklemeler bir sonrakine eklenir
+
+# Mutlak zamanlama yardımcıları (mksh; çatallanmadan, 32 bit tamsayı aritmetiğiyle).
+# _m: başlangıçtan beri geçen ms; _w N: başlangıçtan N ms sonrasına kadar uyu.
+_PRELUDE = """\
+if [ -n "$EPOCHREALTIME" ]; then
+  _S0=${EPOCHREALTIME%.*}
+  _now() { _t=$EPOCHREALTIME; _m=$(( (${_t%.*} - _S0) * 1000 + 10#${_t#*.} / 1000 - _B )); }
+else
+  read _t _x < /proc/uptime; _S0=${_t%.*}
+  _now() { read _t _x < /proc/uptime; _m=$(( (${_t%.*} - _S0) * 1000 + 10#${_t#*.} * 10 - _B )); }
+fi
+_w() { _now; _d=$(( $1 - _m )); if [ $_d -ge 5 ]; then _f=$(( _d % 1000 + 1000 )); sleep $(( _d / 1000 )).${_f#1}; fi; }
+_B=0; _now; _B=$_m
+"""
+
+# [   1234.567890] /dev/input/event2: 0003 0035 000001a4
+_GETEVENT = re.compile(r"^\[\s*(\d+\.\d+)\]\s+(/dev/input/event\d+):\s+([0-9a-f]{4})\s+([0-9a-f]{4})\s+([0-9a-f]{8})")
+
+
+@dataclass
+class Step:
+    t: float  # makro başından itibaren saniye
+    op: str  # event / tap / swipe / text / key
+    args: List = field(default_factory=list)
+
+
+def _step_command(st: Step) -> str:
+    a = st.args
+    if st.op == "event":
+        return f"sendevent {a[0]} {int(a[1])} {int(a[2])} {int(a[3])}"
+    if st.op == "tap":
+        return f"input tap {int(a[0])} {int(a[1])}"
+    if st.op == "swipe":
+        return f"input swipe {int(a[0])} {int(a[1])} {int(a[2])} {int(a[3])} {int(a[4])}"
+    if st.op == "text":
+        return "input text " + shlex.quote(str(a[0]).replace(" ", "%s"))
+    if st.op == "key":
+        return f"input keyevent {shlex.quote(str(a[0]))}"
+    raise ValueError(f"Bilinmeyen makro adımı: {st.op}")
+
+
+class Macro:
+    """Zaman damgalı giriş adımları"""
+
+    def __init__(self, steps: Optional[List[Step]] = None):
+        self.steps: List[Step] = steps or []
+        self._cursor = 0.0  # üst düzey adımlar için eklenme zamanı
+
+    @property
+    def duration(self) -> float:
+        return self.steps[-1].t if self.steps else 0.0
+
+    # ---- Üst düzey adımlar (zincirlenebilir) ----
+
+    def _add(self, op: str, *args) -> "Macro":
+        self.steps.append(Step(self._cursor, op, list(args)))
+        return self
+
+    def wait(self, seconds: float) -> "Macro":
+        self._cursor += seconds
+        return self
+
+    def tap(self, x: int, y: int) -> "Macro":
+        return self._add("tap", x, y)
+
+    def swipe(self, x1: int, y1: int, x2: int, y2: int, ms: int = 300) -> "Macro":
+        return self._add("swipe", x1, y1, x2, y2, ms)
+
+    def text(self, value: str) -> "Macro":
+        return self._add("text", value)
+
+    def key(self, code) -> "Macro":
+        return self._add("key", code)
+
+    # ---- Derleme ve dosya ----
+
+    def to_script(self, speed: float = 1.0, repeat: int = 1) -> str:
+        """Tek oturumda çalışacak sh betiği; adım zamanları speed'e bölünür, her tekrar baştan zamanlanır"""
+        if not speed > 0:
+            raise ValueError(f"Oynatma hızı pozitif olmalı: {speed}")
+        body = []
+        prev = 0.0
+        for st in self.steps:
+            if (st.t - prev) / speed >= MIN_SLEEP:
+                body.append(f"_w {int(round(st.t / speed * 1000))}")
+                prev = st.t
+            body.append(_step_command(st))
+        lines = ["#!/system/bin/sh", _PRELUDE.rstrip("\n")]
+        if repeat > 1:
+            lines += ["i=0", f"while [ $i -lt {int(repeat)} ]; do", "_B=0; _now; _B=$_m"]  # her tekrar kendi başlangıcından
+            lines += body + ["i=$((i+1))", "done"]
+        else:
+            lines += body
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: Path):
+        data = {"version": 1, "steps": [asdict(st) for st in self.steps]}
+        Path(path).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "Macro":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        m = cls([Step(**st) for st in data.get("steps", [])])
+        m._cursor = m.duration
+        return m
+
+
+def parse_getevent(lines) -> List[Step]:
+    """`getevent -t` satırlarını ilk olaya göre zamanlanmış ham adımlara çevir"""
+    steps: List[Step] = []
+    t0 = None
+    for line in lines:
+        m = _GETEVENT.match(line.strip())
+        if not m:
+            continue
+        ts = float(m.group(1))
+        if t0 is None:
+            t0 = ts
+        steps.append(Step(round(ts - t0, 6), "event",
+                          [m.group(2), int(m.group(3), 16), int(m.group(4), 16), int(m.group(5), 16)]))
+    return steps
+
+
+class MacroRecorder:
+    """Cihazdaki dokunma/tuş olaylarını tek bir getevent akışından kaydeder"""
+
+    def __init__(self, client: ADBClient):
+        self.client = client
+        self._lines: List[str] = []
+        self._proc = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._proc = self.client.popen(self.client._adb("shell", "getevent", "-t"))
+        self._thread = threading.Thread(target=self._reader, daemon=True)
+        self._thread.start()
+
+    def _reader(self):
+        for line in self._proc.stdout:
+            self._lines.append(line)
+
+    def stop(self) -> Macro:
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+        if self._thread:
+            self._thread.join(2)
+        m = Macro(parse_getevent(self._lines))
+        m._cursor = m.duration
+        return m
+
+
+@dataclass
+class PlayResult:
+    device: str
+    ok: bool = False
+    steps: int = 0
+    expected_s: float = 0.0  # makronun speed'e göre süresi
+    elapsed_s: float = 0.0  # betiğin çalışma süresi (gönderim hariç, kabuk açılışı dahil)
+    upload_ms: float = 0.0
+    error: str = ""
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def play(client: ADBClient, macro: Macro, speed: float = 1.0, repeat: int = 1) -> PlayResult:
+    """Makroyu betik olarak cihaza gönder ve tek kabuk oturumunda çalıştır"""
+    script = macro.to_script(speed, repeat)
+    res = PlayResult(device=client.serial or "", steps=len(macro.steps) * repeat,
+                     expected_s=round(macro.duration / speed * repeat, 3))
+    with tempfile.NamedTemporaryFile("w", suffix=".sh", delete=False, encoding="utf-8", newline="\n") as f:
+        f.write(script)
+        local = f.name
+    try:
+        t0 = time.perf_counter()
+        cp = client._run(client._adb("push", local, REMOTE_SCRIPT), quiet=True)
+        res.upload_ms = round((time.perf_counter() - t0) * 1000, 1)
+        if cp.returncode != 0:
+            res.error = (cp.stdout or "").strip() or "betik gönderilemedi"
+            return res
+        t0 = time.perf_counter()
+        cp = client._run(client._adb("shell", "sh", REMOTE_SCRIPT), timeout=int(res.expected_s) + 60, quiet=True)
+        res.elapsed_s = round(time.perf_counter() - t0, 3)
+        res.ok = cp.returncode == 0
+        if not res.ok:
+            res.error = (cp.stdout or "").strip()[-200:]
+    except Exception as e:
+        res.error = str(e)
+    finally:
+        try:
+            Path(local).unlink()
+        except OSError:
+            pass
+    return res
+
+
+def play_many(adb: ADBClient, devices: List[str], macro: Macro, speed: float = 1.0,
+              repeat: int = 1) -> List[PlayResult]:
+    """Aynı makroyu cihazlarda paralel oynat"""
+    results: List[Optional[PlayResult]] = [None] * len(devices)
+
+    def worker(k: int, serial: str):
+        results[k] = play(adb.for_device(serial) if serial else adb, macro, speed, repeat)
+
+    threads = [threading.Thread(target=worker, args=(k, d), daemon=True) for k, d in enumerate(devices)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    return [r for r in results if r is not None]
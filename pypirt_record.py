@@ -0,0 +1,185 @@
+"""PyPIRT ekran kaydı.
+
+`adb exec-out screenrecord --output-format=h264 -` çıktısı cihazda bir
+dosyaya yazılıp sonradan çekilmek yerine doğrudan yerel dosyaya akıtılır.
+Borudan okuma ve diske yazma ayrı iş parçacıklarıdır; aradaki sınırlı
+kuyruk dolarsa (disk yetişemiyorsa) okuyucu bekler ve adb borusu geri
+basınç uygular. Parça düşürülmez: H.264 akışından rastgele bir 64 KB'lık
+dilim atılırsa sonraki anahtar kareye kadar görüntü bozulur. Bekleme süresi
+sayılır. Yazma hatasında (disk dolu) kayıt durdurulur. Cihazın kayıt süresi
+sınırına (çoğu sürümde 180 sn) gelindiğinde yeni bir parça başlatılıp aynı
+dosyaya eklenir: ham H.264 akışında her parça kendi SPS/PPS ve anahtar
+karesiyle başladığından birleşik dosya oynatılabilir (ffplay, VLC).
+"""
+import datetime
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from pypirt_core import ADBClient
+
+
+DEVICE_TIME_LIMIT = 180  # screenrecord --time-limit üst sınırı
+CHUNK_SIZE = 64 * 1024
+MAX_PENDING = 256  # diske yazılmayı bekleyebilecek parça sayısı (≈16 MB)
+
+
+@dataclass
+class RecordStats:
+    device: str
+    path: str
+    bytes: int = 0  # borudan okunan
+    chunks: int = 0
+    stalls: int = 0  # kuyruk dolu olduğu için okuyucunun beklediği parça sayısı
+    stall_ms: float = 0.0  # toplam bekleme (diskin yetişemediği süre)
+    segments: int = 0
+    segment_gaps_ms: List[float] = field(default_factory=list)  # parça geçişlerinde görüntü gelmeyen süre
+    duration_s: float = 0.0
+    error: str = ""
+
+    @property
+    def bitrate_kbps(self) -> float:
+        return round(self.bytes * 8 / self.duration_s / 1000, 1) if self.duration_s else 0.0
+
+    def to_dict(self) -> Dict:
+        d = asdict(self)
+        d["bitrate_kbps"] = self.bitrate_kbps
+        return d
+
+
+def default_path(device: str, directory: Path = Path(".")) -> Path:
+    """kayit_<cihaz>_<zaman>.h264 (Wi-Fi serilerindeki ':' dosya adına uygun hale getirilir)"""
+    safe = re.sub(r"[^\w.-]", "_", device or "varsayilan")
+    return Path(directory) / datetime.datetime.now().strftime(f"kayit_{safe}_%Y%m%d_%H%M%S.h264")
+
+
+class ScreenRecorder:
+    """Bir cihazın ekranını parça parça tek bir yerel .h264 dosyasına akıtır"""
+
+    def __init__(self, client: ADBClient, path: Path, bit_rate_mbps: Optional[float] = None,
+                 size: Optional[str] = None, segment_s: int = DEVICE_TIME_LIMIT, max_s: Optional[float] = None,
+                 on_done: Optional[Callable[[RecordStats], None]] = None):
+        self.client = client
+        self.path = Path(path)
+        self.bit_rate_mbps = bit_rate_mbps
+        self.size = size  # GENxYÜK, örn. 1280x720
+        self.segment_s = max(1, min(int(segment_s), DEVICE_TIME_LIMIT))
+        self.max_s = max_s
+        self.on_done = on_done
+        self.stats = RecordStats(device=client.serial or "", path=str(self.path))
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(MAX_PENDING)
+        self._stop = threading.Event()
+        self._proc = None
+        self._threads: List[threading.Thread] = []
+
+    def _args(self, limit: int) -> List[str]:
+        args = ["screenrecord", "--output-format=h264", "--time-limit", str(limit)]
+        if self.bit_rate_mbps:
+            args += ["--bit-rate", str(int(self.bit_rate_mbps * 1_000_000))]
+        if self.size:
+            args += ["--size", self.size]
+        return self.client._adb("exec-out", *args, "-")
+
+    def start(self):
+        self._threads = [threading.Thread(target=self._read, daemon=True),
+                         threading.Thread(target=self._write, args=(self.path.open("wb"),), daemon=True)]
+        for th in self._threads:
+            th.start()
+
+    def stop(self):
+        self._stop.set()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+
+    @property
+    def running(self) -> bool:
+        return any(th.is_alive() for th in self._threads)
+
+    def wait(self, timeout: Optional[float] = None) -> RecordStats:
+        for th in self._threads:
+            th.join(timeout)
+        return self.stats
+
+    def _read(self):
+        st = self.stats
+        t0 = time.monotonic()
+        segment_end = None
+        try:
+            while not self._stop.is_set():
+                limit = self.segment_s
+                if self.max_s is not None:
+                    remaining = self.max_s - (time.monotonic() - t0)
+                    if remaining < 1:
+                        break
+                    limit = min(limit, int(remaining + 0.5))
+                self._proc = proc = self.client.popen(self._args(limit), binary=True)
+                if self._stop.is_set():  # stop() popen sırasında geldiyse
+                    proc.terminate()
+                got_data = False
+                while True:
+                    data = proc.stdout.read1(CHUNK_SIZE)
+                    if not data:
+                        break
+                    if not got_data:
+                        got_data = True
+                        if segment_end is not None:
+                            st.segment_gaps_ms.append(round((time.monotonic() - segment_end) * 1000, 1))
+                    st.chunks += 1
+                    st.bytes += len(data)
+                    try:
+                        self._queue.put_nowait(data)
+                    except queue.Full:
+                        t_stall = time.monotonic()
+                        self._queue.put(data)  # yazıcı her durumda kuyruğu boşaltır
+                        st.stalls += 1
+                        st.stall_ms = round(st.stall_ms + (time.monotonic() - t_stall) * 1000, 1)
+                proc.wait()
+                segment_end = time.monotonic()
+                if not got_data:
+                    if not self._stop.is_set():
+                        st.error = "screenrecord veri üretmedi (ekran kapalı veya cihaz desteklemiyor)"
+                    break
+                st.segments += 1
+        except Exception as e:
+            st.error = str(e)
+        finally:
+            st.duration_s = round(time.monotonic() - t0, 2)
+            self._queue.put(None)
+
+    def _write(self, fh):
+        st = self.stats
+        failed = False
+        with fh:
+            while True:
+                data = self._queue.get()
+                if data is None:
+                    break
+                if failed:
+                    continue  # okuyucu beklemesin diye kuyruk boşaltılmaya devam eder
+                try:
+                    fh.write(data)
+                except OSError as e:
+                    failed = True
+                    st.error = f"Yazma hatası: {e}"
+                    self.stop()
+        self.client.on_log(f"Ekran kaydı bitti ({st.device or 'varsayılan'}): {st.path}, {st.segments} parça, "
+                           f"{st.bytes / 2 ** 20:.1f} MB, {st.bitrate_kbps} kbps, "
+                           f"disk beklemesi {st.stall_ms / 1000:.1f} sn ({st.stalls} kez)")
+        if self.on_done:
+            self.on_done(st)
+
+
+def record_many(adb: ADBClient, devices: List[str], directory: Path = Path("."), **kwargs) -> Dict[str, ScreenRecorder]:
+    """Her cihaz için ayrı dosyaya eşzamanlı kayıt başlat"""
+    recorders = {}
+    for d in devices:
+        client = adb.for_device(d) if d else adb
+        rec = ScreenRecorder(client, default_path(d, directory), **kwargs)
+        rec.start()
+        recorders[d] = rec
+    return recorders
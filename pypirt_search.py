@@ -0,0 +1,436 @@
+"""PyPIRT kişi arama dizini.
+
+Her kişi için isim, numara ve etiketlerden Türkçe kurallarıyla
+küçültülmüş (tr_fold) ve ASCII'ye indirgenmiş anahtarlar bir kez üretilir
+ve sıralı bir dizide tutulur. Sorgudaki her kelime bir anahtarın başına
+(önek) uymalıdır; aralıklar bisect ile bulunur, kesişimler int bit
+maskeleriyle alınır. Sonuçlar tam eşleşme, favori ve rehber sırasına göre
+sıralanır. Kişi eklenip değiştikçe dizin artımlı olarak güncellenir.
+
+Etiketler tamsayı kimliklere çevrilir (intern) ve her etiket ile favoriler
+için birer bit maskesi tutulur; etiket/favori süzgeçleri ve birleşimleri
+tek tek kişi gezilmeden bit işlemleriyle hesaplanır.
+"""
+import bisect
+import re
+import sys
+import time
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from pypirt_core import Kisi, ascii_fold, tr_fold
+
+
+_WORD = re.compile(r"\w+")
+_NUMBER_QUERY = re.compile(r"^[\s+()\-]*\d[\d\s+()\-]*$")
+
+
+def _digits(text: str) -> str:
+    """Rakamlar, baştaki sıfırlar (0 / 00 önekleri) atılmış"""
+    digits = re.sub(r"\D", "", text)
+    return digits.lstrip("0") or digits
+
+
+def _number_keys(numara: str) -> Set[str]:
+    """Numara için aranabilir anahtarlar: tüm rakamlar ve (ülke kodluysa) son 10 hane"""
+    digits = _digits(numara)
+    if not digits:
+        return set()
+    return {digits, digits[-10:]}
+
+
+def kisi_keys(kisi: Kisi) -> Set[str]:
+    """Kişinin dizine girecek tüm anahtarları"""
+    keys: Set[str] = set()
+    text = tr_fold(" ".join([kisi.ad, *kisi.etiketler]))
+    keys.update(_WORD.findall(text))
+    keys.update(_WORD.findall(ascii_fold(text)))  # harf harf çeviri: kelime sınırları değişmez
+    keys.update([_digits(k) for k in keys if k.isdigit()])  # sorgu rakamlarıyla aynı biçim
+    keys |= _number_keys(kisi.numara)
+    # Aynı anahtar metni tüm kişilerde tek nesne
+    return {sys.intern(k) for k in keys}
+
+
+def query_tokens(query: str) -> List[str]:
+    """Sorguyu dizinle aynı kurallarla kelimelere ayır.
+
+    Sadece numara karakterlerinden oluşan sorgu ("0555 123 45") tek bir
+    rakam dizisi olarak, baştaki 0 olmadan aranır.
+    """
+    if _NUMBER_QUERY.match(query):
+        return [_digits(query)]
+    return [_digits(t) if t.isdigit() else t for t in _WORD.findall(tr_fold(query))]
+
+
+def _mask(ids: Iterable[int], nbytes: int) -> int:
+    """Kimlik listesinden bit maskesi (bit i = kimlik i)"""
+    buf = bytearray(nbytes)
+    for i in ids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _bits(mask: int, limit: Optional[int] = None) -> List[int]:
+    """Maskedeki kimlikler, küçükten büyüğe (en fazla limit tane)"""
+    out: List[int] = []
+    if not mask:
+        return out
+    s = bin(mask)[:1:-1]  # ters çevrilmiş: s[i] == "1" ⇔ kimlik i
+    pos = s.find("1")
+    while pos >= 0 and (limit is None or len(out) < limit):
+        out.append(pos)
+        pos = s.find("1", pos + 1)
+    return out
+
+
+class SearchIndex:
+    """Önek aramalı, sıralı kişi dizini.
+
+    Anahtar başına sıralı kimlik listeleri (posting) tutulur; kümeler Python
+    int'leri üzerinde bit maskesi olarak birleştirilip kesiştirilir. HOT
+    sayıda ya da daha çok kişiye uyan anahtarların ve öneklerin maskeleri
+    rebuild() sırasında hazırlanır; böylece "a" veya "905" gibi geniş
+    sorgular da sabit sürede, diğerleri en fazla HOT kimlik taranarak
+    cevaplanır. Artımlı eklemeler mevcut maskeleri günceller, yeni geniş
+    önekler bir sonraki rebuild()'de maskelenir.
+
+    Kimlikler (id) çağıranın verdiği tamsayılardır (arayüzde rehber
+    listesindeki sıra). Liste ortasından silmede delete() sonraki kimlikleri
+    anahtarlar yeniden üretilmeden kaydırır.
+    """
+
+    HOT = 256
+
+    def __init__(self, kisiler: Optional[Iterable[Kisi]] = None):
+        # anahtar → sıralı kimlikler; tek kişilik anahtarlarda liste yerine kimliğin kendisi
+        self._post: Dict[str, Union[int, List[int]]] = {}
+        self._uniq: List[str] = []  # sıralı anahtarlar (önek aralığı için)
+        self._hot: Dict[str, int] = {}  # sık anahtarların maskeleri (tam eşleşme)
+        self._hot_prefix: Dict[str, int] = {}  # geniş öneklerin maskeleri
+        self._by_id: Dict[int, Tuple[str, ...]] = {}
+        self._tags_of: Dict[int, Tuple[int, ...]] = {}  # kişi → etiket kimlikleri
+        self._tag_ids: Dict[str, int] = {}  # tr_fold(etiket) → etiket kimliği
+        self._tag_names: List[str] = []  # etiket kimliği → ilk görülen yazılış
+        self._tag_masks: List[int] = []  # etiket kimliği → kişi maskesi
+        self._fav = 0
+        self._all = 0
+        self._nbytes = 1
+        if kisiler is not None:
+            self.rebuild(kisiler)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def rebuild(self, kisiler: Iterable[Kisi]):
+        self._post = {}
+        self._by_id = {}
+        self._tags_of = {}
+        self._tag_ids, self._tag_names = {}, []
+        favs = []
+        tagged: List[List[int]] = []
+        for i, k in enumerate(kisiler):
+            keys = tuple(kisi_keys(k))
+            self._by_id[i] = keys
+            if k.favori:
+                favs.append(i)
+            for key in keys:
+                ids = self._post.get(key)
+                if ids is None:
+                    self._post[key] = i
+                elif type(ids) is int:
+                    self._post[key] = [ids, i]
+                else:
+                    ids.append(i)
+            tids = self._intern_tags(k.etiketler)
+            self._tags_of[i] = tids
+            for t in tids:
+                if t == len(tagged):
+                    tagged.append([])
+                tagged[t].append(i)
+        self._nbytes = len(self._by_id) // 8 + 1
+        self._tag_masks = [_mask(ids, self._nbytes) for ids in tagged]
+        self._all = (1 << len(self._by_id)) - 1
+        self._uniq = sorted(self._post)
+        self._hot = {key: _mask(ids, self._nbytes) for key, ids in self._post.items()
+                     if type(ids) is list and len(ids) >= self.HOT}
+        self._hot_prefix = {}
+        for p in sorted(self._wide_prefixes(), key=len, reverse=True):
+            self._hot_prefix[p] = self._prefix_mask(p)  # uzunlar önce: kısalar onları kullanır
+        self._fav = _mask(favs, self._nbytes)
+
+    def _wide_prefixes(self) -> List[str]:
+        """HOT veya daha çok (tekrarlı) kimliğe uyan önekler.
+
+        Sıralı anahtarlar üzerinde kümülatif kimlik sayısıyla, sadece geniş
+        öneklerin alt dallarına inilerek bulunur.
+        """
+        cum = [0]
+        for key in self._uniq:
+            ids = self._post[key]
+            cum.append(cum[-1] + (1 if type(ids) is int else len(ids)))
+        out: List[str] = []
+        stack = [("", 0, len(self._uniq))]
+        while stack:
+            p, lo, hi = stack.pop()
+            n = len(p)
+            if n and self._uniq[lo] == p:
+                lo += 1  # önekin kendisi olan anahtar; alt dal değil
+            while lo < hi:
+                child = self._uniq[lo][:n + 1]
+                end = bisect.bisect_left(self._uniq, child + "\uffff", lo, hi)
+                if cum[end] - cum[lo] >= self.HOT:
+                    out.append(child)
+                    stack.append((child, lo, end))
+                lo = end
+        return out
+
+    def _intern_tags(self, etiketler: Iterable[str]) -> Tuple[int, ...]:
+        tids = []
+        for name in etiketler:
+            folded = tr_fold(name.strip())
+            if not folded:
+                continue
+            t = self._tag_ids.get(folded)
+            if t is None:
+                t = self._tag_ids[folded] = len(self._tag_names)
+                self._tag_names.append(name.strip())
+            if t not in tids:
+                tids.append(t)
+        return tuple(tids)
+
+    def add(self, i: int, kisi: Kisi):
+        if i in self._by_id:
+            self.remove(i)
+        if i >> 3 >= self._nbytes:
+            self._nbytes = (i >> 3) + 1
+        keys = tuple(kisi_keys(kisi))
+        self._by_id[i] = keys
+        bit = 1 << i
+        self._all |= bit
+        if kisi.favori:
+            self._fav |= bit
+        tids = self._intern_tags(kisi.etiketler)
+        self._tags_of[i] = tids
+        for t in tids:
+            if t == len(self._tag_masks):
+                self._tag_masks.append(0)
+            self._tag_masks[t] |= bit
+        for key in keys:
+            ids = self._post.get(key)
+            if ids is None:
+                self._post[key] = i
+                bisect.insort(self._uniq, key)
+                ids = (i,)
+            elif type(ids) is int:
+                ids = self._post[key] = sorted((ids, i))
+            else:
+                bisect.insort(ids, i)
+            if key in self._hot:
+                self._hot[key] |= bit
+            elif len(ids) >= self.HOT:
+                self._hot[key] = _mask(ids, self._nbytes)
+            for n in range(1, len(key) + 1):
+                if key[:n] in self._hot_prefix:
+                    self._hot_prefix[key[:n]] |= bit
+
+    update = add
+
+    def remove(self, i: int):
+        keys = self._by_id.pop(i, ())
+        bit = 1 << i
+        self._all &= ~bit
+        self._fav &= ~bit
+        for t in self._tags_of.pop(i, ()):
+            self._tag_masks[t] &= ~bit
+        for key in keys:
+            ids = self._post[key]
+            if key in self._hot:
+                self._hot[key] &= ~bit
+            if type(ids) is int:
+                del self._post[key]
+                self._hot.pop(key, None)
+                del self._uniq[bisect.bisect_left(self._uniq, key)]
+                continue
+            ids.remove(i)
+            if len(ids) == 1:
+                self._post[key] = ids[0]
+        for p in {key[:n] for key in keys for n in range(1, len(key) + 1)}:
+            if p in self._hot_prefix:
+                self._hot_prefix[p] &= ~bit
+
+    def delete(self, i: int):
+        """i'yi çıkar ve sonraki kimlikleri bir azalt (listeden `del kisiler[i]` karşılığı)"""
+        self.remove(i)
+        low = (1 << i) - 1
+
+        def shift(m: int) -> int:
+            return (m & low) | ((m >> 1) & ~low)
+
+        self._all, self._fav = shift(self._all), shift(self._fav)
+        self._tag_masks = [shift(m) for m in self._tag_masks]
+        self._hot = {k: shift(m) for k, m in self._hot.items()}
+        self._hot_prefix = {k: shift(m) for k, m in self._hot_prefix.items()}
+        self._by_id = {(k - 1 if k > i else k): v for k, v in self._by_id.items()}
+        self._tags_of = {(k - 1 if k > i else k): v for k, v in self._tags_of.items()}
+        for key, ids in self._post.items():
+            if type(ids) is int:
+                if ids > i:
+                    self._post[key] = ids - 1
+            else:
+                pos = bisect.bisect_right(ids, i)
+                if pos < len(ids):
+                    ids[pos:] = [x - 1 for x in ids[pos:]]
+
+    def _key_mask(self, key: str) -> int:
+        hot = self._hot.get(key)
+        if hot is not None:
+            return hot
+        ids = self._post.get(key)
+        if ids is None:
+            return 0
+        return 1 << ids if type(ids) is int else _mask(ids, self._nbytes)
+
+    def _prefix_mask(self, tok: str) -> int:
+        hot = self._hot_prefix.get(tok)
+        if hot is not None:
+            return hot
+        lo = bisect.bisect_left(self._uniq, tok)
+        hi = bisect.bisect_left(self._uniq, tok + "\uffff", lo)
+        mask = 0
+        cold = []
+        pos = lo
+        n = len(tok) + 1
+        while pos < hi:
+            key = self._uniq[pos]
+            hot = self._hot_prefix.get(key[:n])
+            if hot is not None:
+                # Bir harf uzun önek maskelenmişse onun aralığı atlanır
+                mask |= hot
+                pos = bisect.bisect_left(self._uniq, key[:n] + "\uffff", pos, hi)
+                continue
+            ids = self._post[key]
+            cold.append((ids,) if type(ids) is int else ids)
+            pos += 1
+        if cold:
+            mask |= _mask(chain.from_iterable(cold), self._nbytes)
+        return mask
+
+    def etiketler(self) -> List[str]:
+        """Dizindeki etiketler (ilk görülen yazılışlarıyla)"""
+        return [name for name, m in zip(self._tag_names, self._tag_masks) if m]
+
+    def filter_mask(self, favori: bool = False, etiketler: Iterable[str] = ()) -> int:
+        """Favori ve (hepsine sahip olunması gereken) etiket süzgecinin maskesi"""
+        mask = self._fav if favori else self._all
+        for name in etiketler:
+            t = self._tag_ids.get(tr_fold(name.strip()))
+            if t is None:
+                return 0
+            mask &= self._tag_masks[t]
+        return mask
+
+    def filter(self, favori: bool = False, etiketler: Iterable[str] = (), limit: Optional[int] = None) -> List[int]:
+        """Süzgece uyan kimlikler, rehber sırasıyla"""
+        return _bits(self.filter_mask(favori, etiketler), limit)
+
+    def search(self, query: str, limit: Optional[int] = None, favori: bool = False,
+               etiketler: Iterable[str] = ()) -> List[int]:
+        """Sorguya uyan kimlikler: tam eşleşenler, sonra favoriler, sonra rehber sırası"""
+        toks = query_tokens(query)
+        if not toks:
+            return []
+        # Her kelime hem Türkçe hem ASCII haliyle denenir (ör. "isik" → "ışık")
+        cands = self.filter_mask(favori, etiketler)
+        for tok in sorted(set(toks), key=len, reverse=True):
+            mask = self._prefix_mask(tok)
+            alt = ascii_fold(tok)
+            if alt != tok:
+                mask |= self._prefix_mask(alt)
+            cands &= mask
+            if not cands:
+                return []
+
+        exact = 0
+        for tok in set(toks):
+            exact |= self._key_mask(tok)
+        exact &= cands
+        rest = cands & ~exact
+        out: List[int] = []
+        for g in (exact & self._fav, exact & ~self._fav, rest & self._fav, rest & ~self._fav):
+            out.extend(_bits(g, None if limit is None else limit - len(out)))
+            if limit is not None and len(out) >= limit:
+                break
+        return out
+
+
+def _synthetic(n: int) -> List[Dict]:
+    """Ölçümler için rehber.json biçiminde sentetik kişiler"""
+    import random
+    rnd = random.Random(1)
+    adlar = ["Ayşe", "Ahmet", "Işık", "İsmail", "Mehmet", "Çağla", "Şükrü", "Gülşen", "Oğuz", "Ümit", "Zeynep", "Irmak"]
+    soyadlar = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Öztürk", "Aydın", "Arslan", "Doğan", "Kılıç"]
+    etiketler = ["is", "aile", "acil", "okul", "müşteri", "tedarikçi"]
+    return [dict(ad=f"{rnd.choice(adlar)} {rnd.choice(soyadlar)} {i}",
+                 numara=f"+90 5{rnd.randint(10, 59)} {rnd.randint(100, 999)} {rnd.randint(1000, 9999)}",
+                 etiketler=rnd.sample(etiketler, rnd.randint(0, 2)), favori=rnd.random() < 0.05)
+            for i in range(n)]
+
+
+def benchmark(n: int = 50000, queries: Iterable[str] = ("a", "ay", "ayşe", "ışık", "İSMAİL", "0555 12", "is", "yılmaz me"),
+              limit: int = 100, repeat: int = 50) -> Dict[str, float]:
+    """Sentetik rehberle sorgu sürelerini ölç (ms, ortalama)"""
+    kisiler = [Kisi(**d) for d in _synthetic(n)]
+    t0 = time.perf_counter()
+    idx = SearchIndex(kisiler)
+    result = {"build_ms": (time.perf_counter() - t0) * 1000}
+    for q in queries:
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            idx.search(q, limit=limit)
+        result[q] = (time.perf_counter() - t0) * 1000 / repeat
+    return result
+
+
+def benchmark_filters(n: int = 50000, repeat: int = 20) -> Dict[str, float]:
+    """Eski model (liste + her seferinde küçültülen etiketler) ile bit maskeli
+    süzgeçlerin bellek (MB) ve süre (ms) karşılaştırması"""
+    import json
+    import tracemalloc
+    from dataclasses import make_dataclass
+
+    # Önceki Kisi: __dict__'li dataclass, JSON'dan gelen her etiket ayrı bir str
+    EskiKisi = make_dataclass("EskiKisi", [("ad", str), ("numara", str), ("etiketler", list),
+                                           ("favori", bool), ("profil_foto", Optional[str], None)])
+    raw = json.dumps(_synthetic(n))
+    result: Dict[str, float] = {}
+    tracemalloc.start()
+    eski = [EskiKisi(**d) for d in json.loads(raw)]
+    result["eski_mb"] = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    tracemalloc.stop()
+    tracemalloc.start()
+    yeni = [Kisi(**d) for d in json.loads(raw)]
+    result["yeni_mb"] = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    idx = SearchIndex(yeni)
+    result["yeni_dizinli_mb"] = tracemalloc.get_traced_memory()[0] / 2 ** 20
+    tracemalloc.stop()
+
+    def timed(fn) -> float:
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        return (time.perf_counter() - t0) * 1000 / repeat
+
+    for fav, tags in ((True, ()), (False, ("aile",)), (True, ("aile", "acil"))):
+        name = "+".join((["fav"] if fav else []) + list(tags))
+        result[f"eski_{name}_ms"] = timed(lambda: [
+            i for i, k in enumerate(eski)
+            if (not fav or k.favori) and all(t in [e.lower() for e in k.etiketler] for t in tags)])
+        result[f"yeni_{name}_ms"] = timed(lambda: idx.filter(fav, tags))
+    return result
+
+
+if __name__ == "__main__":
+    for name, ms in benchmark().items():
+        print(f"{name:>12}: {ms:.3f} ms")
+    for name, val in benchmark_filters().items():
+        print(f"{name:>20}: {val:.3f}")
@@ -0,0 +1,285 @@
+"""PyPIRT yerel tıkla-ara HTTP servisi (asyncio).
+
+CRM gibi yerel uygulamaların arama/SMS tetiklemesi için. Her cihazın kendi
+FIFO kuyruğu vardır: aynı cihaza gelen işler sırayla, farklı cihazlara
+gelenler eşzamanlı çalışır. Sadece 127.0.0.1'e bağlanır.
+
+Her istek X-PyPIRT-Token başlığını taşımalıdır; token verilmezse rastgele
+üretilir (arayüz ve komut satırı ayarlarda saklar). Tarayıcıda açık bir
+sayfanın localhost'a istek atıp arama/SMS kuyruğa eklemesini önlemek için
+Origin başlığı taşıyan istekler (tarayıcılar çapraz kaynaklı her POST'ta
+ekler) 403 ile, JSON olmayan gövdeler (form / text/plain "basit istekleri")
+415 ile reddedilir.
+
+    POST /jobs        tek iş veya iş listesi (JSON), ?wait=0 ile beklemeden döner
+        {"action": "call" | "dial" | "sms", "to": "isim veya numara",
+         "device": "serial (opsiyonel)", "body": "SMS metni (opsiyonel)"}
+    GET  /jobs/<id>   iş durumu
+    GET  /queues      cihaz başına bekleyen iş sayısı
+"""
+import asyncio
+import hmac
+import itertools
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from pypirt_core import ADBClient, Kisi, resolve_hedef
+
+
+DEFAULT_PORT = 8765
+MAX_BODY = 1 << 20  # 1 MB
+MAX_JOBS_KEPT = 1000  # /jobs/<id> için saklanan son iş sayısı
+
+ACTIONS = ("call", "dial", "sms")
+
+
+def new_token() -> str:
+    return secrets.token_urlsafe(24)
+
+
+@dataclass
+class Job:
+    id: int
+    action: str
+    to: str
+    device: str
+    body: str = ""
+    status: str = "queued"  # queued / running / done / failed
+    ok: bool = False
+    position: int = 0  # kuyruğa girdiğinde önündeki iş sayısı
+    ad: str = ""
+    numara: str = ""
+    error: Optional[str] = None
+    enqueued_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        d = {
+            "id": self.id, "action": self.action, "to": self.to, "device": self.device,
+            "status": self.status, "ok": self.ok, "position": self.position,
+        }
+        if self.ad:
+            d["name"] = self.ad
+        if self.error:
+            d["error"] = self.error
+        if self.started_at is not None:
+            d["wait_ms"] = round((self.started_at - self.enqueued_at) * 1000, 1)
+        if self.finished_at is not None:
+            d["latency_ms"] = round((self.finished_at - self.enqueued_at) * 1000, 1)
+        return d
+
+
+class DialServer:
+    """Cihaz başına FIFO kuyruklu asyncio HTTP sunucusu.
+
+    adb ve kisiler_provider arayüzle paylaşılır; ADB çağrıları bloklayıcı
+    olduğundan her iş bir iş parçacığında çalıştırılır.
+    """
+
+    def __init__(self, adb: ADBClient, kisiler_provider: Optional[Callable[[], List[Kisi]]] = None,
+                 host: str = "127.0.0.1", port: int = DEFAULT_PORT, token: Optional[str] = None):
+        self.adb = adb
+        self.kisiler_provider = kisiler_provider
+        self.host = host
+        self.port = port
+        self.token = token or new_token()
+        self._ids = itertools.count(1)
+        self._jobs: "OrderedDict[int, Job]" = OrderedDict()
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._running: Dict[str, int] = {}
+        self._done_events: Dict[int, asyncio.Event] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ---- Kuyruklar ----
+
+    def _client_for(self, device: str) -> ADBClient:
+        if not device or device == (self.adb.serial or ""):
+            return self.adb
+        return self.adb.for_device(device)
+
+    def _pending(self, device: str) -> int:
+        q = self._queues.get(device)
+        return (q.qsize() if q else 0) + self._running.get(device, 0)
+
+    def enqueue(self, action: str, to: str, device: str = "", body: str = "") -> Job:
+        if action not in ACTIONS:
+            raise ValueError(f"Geçersiz action: {action!r} (izinli: {', '.join(ACTIONS)})")
+        if not to:
+            raise ValueError("'to' alanı zorunlu")
+        device = device or (self.adb.serial or "")
+        job = Job(id=next(self._ids), action=action, to=to, device=device, body=body,
+                  position=self._pending(device), enqueued_at=time.perf_counter())
+        self._remember(job)
+        self._done_events[job.id] = asyncio.Event()
+        if device not in self._queues:
+            self._queues[device] = asyncio.Queue()
+            self._workers[device] = asyncio.ensure_future(self._worker(device))
+        self._queues[device].put_nowait(job)
+        return job
+
+    def _remember(self, job: Job):
+        self._jobs[job.id] = job
+        while len(self._jobs) > MAX_JOBS_KEPT:
+            old_id, _ = self._jobs.popitem(last=False)
+            self._done_events.pop(old_id, None)
+
+    async def _worker(self, device: str):
+        q = self._queues[device]
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await q.get()
+            self._running[device] = 1
+            job.status = "running"
+            job.started_at = time.perf_counter()
+            try:
+                job.ok = await loop.run_in_executor(None, self._execute, job)
+                job.status = "done" if job.ok else "failed"
+            except Exception as e:
+                job.status = "failed"
+                job.error = str(e)
+            finally:
+                job.finished_at = time.perf_counter()
+                self._running[device] = 0
+                ev = self._done_events.get(job.id)
+                if ev is not None:
+                    ev.set()
+                q.task_done()
+
+    def _execute(self, job: Job) -> bool:
+        kisiler = self.kisiler_provider() if self.kisiler_provider else None
+        job.ad, job.numara = resolve_hedef(job.to, kisiler)
+        adb = self._client_for(job.device)
+        if job.action == "call":
+            ok = adb.call_immediate(job.numara)
+        elif job.action == "dial":
+            ok = adb.call_dialer(job.numara)
+        else:
+            ok = adb.open_sms(job.numara, job.body)
+        adb.on_log(f"[HTTP] {job.action} {job.ad} ({job.device or 'varsayılan'}): {'başarılı' if ok else 'başarısız'}")
+        return ok
+
+    async def wait(self, jobs: List[Job]):
+        await asyncio.gather(*(self._done_events[j.id].wait() for j in jobs if j.id in self._done_events))
+
+    # ---- HTTP ----
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            status, payload = await self._dispatch(reader)
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n")
+        try:
+            writer.write(head.encode("ascii") + data)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, reader: asyncio.StreamReader):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        if not request_line:
+            return 400, {"error": "Boş istek"}
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            return 400, {"error": "Geçersiz istek satırı"}
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            k, _, v = line.partition(":")
+            headers[k.strip().lower()] = v.strip()
+
+        if "origin" in headers:
+            return 403, {"error": "Tarayıcı kaynaklı isteklere izin verilmiyor"}
+        if not hmac.compare_digest(headers.get("x-pypirt-token", "").encode(), self.token.encode()):
+            return 401, {"error": "Geçersiz token"}
+
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        path = url.path.rstrip("/")
+
+        if method == "GET" and path == "/queues":
+            return 200, {dev or "varsayılan": self._pending(dev) for dev in self._queues}
+        if method == "GET" and path.startswith("/jobs/"):
+            try:
+                job = self._jobs.get(int(path.rsplit("/", 1)[1]))
+            except ValueError:
+                job = None
+            return (200, job.to_dict()) if job else (404, {"error": "İş bulunamadı"})
+        if method == "POST" and path == "/jobs":
+            if headers.get("content-type", "").split(";")[0].strip().lower() != "application/json":
+                return 415, {"error": "Content-Type: application/json olmalı"}
+            length = int(headers.get("content-length", "0") or 0)
+            if length > MAX_BODY:
+                return 413, {"error": "Gövde çok büyük"}
+            try:
+                raw = json.loads((await reader.readexactly(length)).decode("utf-8") or "null")
+            except (ValueError, asyncio.IncompleteReadError) as e:
+                return 400, {"error": f"JSON okunamadı: {e}"}
+            items = raw if isinstance(raw, list) else [raw]
+            jobs, results = [], []
+            for item in items:
+                if not isinstance(item, dict):
+                    results.append({"status": "rejected", "error": "İş bir JSON nesnesi olmalı"})
+                    continue
+                try:
+                    job = self.enqueue(str(item.get("action", "")), str(item.get("to", "")),
+                                       str(item.get("device", "") or ""), str(item.get("body", "") or ""))
+                except ValueError as e:
+                    results.append({"status": "rejected", "error": str(e)})
+                    continue
+                jobs.append(job)
+                results.append(job)
+            if query.get("wait", ["1"])[0] not in ("0", "false"):
+                await self.wait(jobs)
+            out = [r.to_dict() if isinstance(r, Job) else r for r in results]
+            return (200 if jobs else 400), (out if isinstance(raw, list) else out[0])
+        return 404, {"error": "Bilinmeyen adres"}
+
+    # ---- Çalıştırma ----
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.adb.on_log(f"HTTP servisi dinliyor: http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def run_in_thread(self) -> threading.Thread:
+        """Sunucuyu arka planda kendi olay döngüsüyle çalıştır (arayüz için)"""
+        def runner():
+            try:
+                asyncio.run(self.serve_forever())
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                self.adb.on_log(f"HTTP servisi hatası: {e}")
+        th = threading.Thread(target=runner, daemon=True)
+        th.start()
+        return th
+
+    def stop(self):
+        """Başka bir iş parçacığından sunucuyu durdur"""
+        if self._loop and self._server:
+            self._loop.call_soon_threadsafe(self._server.close)
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden", 404: "Not Found",
+            413: "Payload Too Large", 415: "Unsupported Media Type", 500: "Internal Server Error"}
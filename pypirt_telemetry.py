@@ -0,0 +1,192 @@
+"""PyPIRT cihaz telemetrisi.
+
+Arka planda belirli aralıklarla pil seviyesi/sıcaklığı, CPU yükü
+(/proc/stat), bellek kullanımı (/proc/meminfo) ve Wi-Fi sinyal gücü
+(/proc/net/wireless) örneklenir. Her örnek tek bir `adb shell` çağrısıyla
+alınır ve cihaz/metrik başına sabit boyutlu, array tabanlı halka
+tamponlara yazılır; günlerce çalışsa da bellek kullanımı sabittir.
+"""
+import csv
+import datetime
+import re
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pypirt_core import ADBClient
+
+
+METRICS = ("battery_level", "battery_temp", "cpu", "mem_used", "wifi_rssi")
+METRIC_LABELS = {
+    "battery_level": ("Pil", "%"),
+    "battery_temp": ("Pil sıcaklığı", "°C"),
+    "cpu": ("CPU", "%"),
+    "mem_used": ("Bellek", "%"),
+    "wifi_rssi": ("Wi-Fi", "dBm"),
+}
+
+# Tek çağrıda tüm kaynaklar; çıktılar cihazda süzülür
+_SAMPLE_CMD = (
+    "dumpsys battery | grep -E '^ +(level|temperature):'; echo @@STAT; head -1 /proc/stat; "
+    "echo @@MEM; grep -E '^(MemTotal|MemAvailable):' /proc/meminfo; "
+    "echo @@WIFI; cat /proc/net/wireless 2>/dev/null"
+)
+
+
+class RingBuffer:
+    """Zaman damgalı, sabit kapasiteli double halka tampon"""
+
+    __slots__ = ("capacity", "_ts", "_val", "_head", "_count")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._ts = array("d", bytes(8 * capacity))
+        self._val = array("d", bytes(8 * capacity))
+        self._head = 0  # bir sonraki yazılacak konum
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, ts: float, value: float):
+        self._ts[self._head] = ts
+        self._val[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def last(self) -> Optional[Tuple[float, float]]:
+        if not self._count:
+            return None
+        i = (self._head - 1) % self.capacity
+        return self._ts[i], self._val[i]
+
+    def items(self, last: Optional[int] = None) -> List[Tuple[float, float]]:
+        """Eskiden yeniye (zaman, değer) listesi; last verilirse yalnızca son last örnek kopyalanır"""
+        n = self._count if last is None else max(0, min(last, self._count))
+        start = (self._head - n) % self.capacity
+        return [(self._ts[(start + k) % self.capacity], self._val[(start + k) % self.capacity])
+                for k in range(n)]
+
+    def values(self, last: Optional[int] = None) -> List[float]:
+        return [v for _, v in self.items(last)]
+
+
+def parse_sample(text: str) -> Tuple[Dict[str, float], Optional[Tuple[int, int]]]:
+    """Örnek çıktısını metriklere çevir; CPU için (toplam, boşta) sayaçlarını ayrıca döndür"""
+    out: Dict[str, float] = {}
+    cpu = None
+    section = "BAT"
+    mem: Dict[str, int] = {}
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("@@"):
+            section = line[2:]
+            continue
+        if section == "BAT":
+            m = re.match(r"(level|temperature):\s*(-?\d+)", line)
+            if m and m.group(1) == "level":
+                out["battery_level"] = float(m.group(2))
+            elif m:
+                out["battery_temp"] = int(m.group(2)) / 10.0  # onda bir derece
+        elif section == "STAT" and line.startswith("cpu "):
+            nums = [int(x) for x in line.split()[1:]]
+            idle = nums[3] + (nums[4] if len(nums) > 4 else 0)  # idle + iowait
+            cpu = (sum(nums), idle)
+        elif section == "MEM":
+            m = re.match(r"(\w+):\s*(\d+)", line)
+            if m:
+                mem[m.group(1)] = int(m.group(2))
+        elif section == "WIFI":
+            m = re.match(r"\w+:\s+\S+\s+\S+\s+(-?\d+)\.?", line)
+            if m:
+                out["wifi_rssi"] = float(m.group(1))
+    if mem.get("MemTotal") and "MemAvailable" in mem:
+        out["mem_used"] = round(100.0 * (1 - mem["MemAvailable"] / mem["MemTotal"]), 1)
+    return out, cpu
+
+
+class TelemetrySampler:
+    """Cihaz başına bir iş parçacığıyla örnekleyen telemetri toplayıcı"""
+
+    def __init__(self, adb: ADBClient, devices: List[str], interval: float = 5.0, capacity: int = 17280):
+        # Varsayılan kapasite: 5 sn aralıkla 24 saat
+        self.adb = adb
+        self.devices = devices
+        self.interval = interval
+        self.capacity = capacity
+        self.buffers: Dict[Tuple[str, str], RingBuffer] = {
+            (d, m): RingBuffer(capacity) for d in devices for m in METRICS
+        }
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._stop.clear()
+        self._threads = [threading.Thread(target=self._loop, args=(d,), daemon=True) for d in self.devices]
+        for th in self._threads:
+            th.start()
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def running(self) -> bool:
+        return any(th.is_alive() for th in self._threads)
+
+    def _loop(self, device: str):
+        client = self.adb.for_device(device) if device else self.adb
+        prev_cpu = None
+        next_at = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                cp = client._run(client._adb("shell", _SAMPLE_CMD), timeout=max(5, int(self.interval * 2)), quiet=True)
+                vals, cpu = parse_sample(cp.stdout or "")
+            except Exception:
+                vals, cpu = {}, None
+            ts = time.time()
+            if cpu and prev_cpu:
+                d_total, d_idle = cpu[0] - prev_cpu[0], cpu[1] - prev_cpu[1]
+                if d_total > 0:
+                    vals["cpu"] = round(100.0 * (1 - d_idle / d_total), 1)
+            prev_cpu = cpu or prev_cpu
+            with self._lock:
+                for metric, value in vals.items():
+                    self.buffers[(device, metric)].append(ts, value)
+            # Sabit aralık: örnekleme süresi kaymaya dahil edilmez. Geride kalındıysa (uzun
+            # zaman aşımı, uyku) kaçırılan örnekler art arda alınmaz; takvim şimdiden yeniden kurulur.
+            next_at += self.interval
+            now = time.monotonic()
+            if next_at <= now:
+                next_at = now + self.interval
+            self._stop.wait(max(0.0, next_at - time.monotonic()))
+
+    def latest(self, device: str, metric: str) -> Optional[float]:
+        with self._lock:
+            item = self.buffers[(device, metric)].last()
+        return item[1] if item else None
+
+    def series(self, device: str, metric: str, last: Optional[int] = None) -> List[Tuple[float, float]]:
+        with self._lock:
+            return self.buffers[(device, metric)].items(last)
+
+    def values(self, device: str, metric: str, last: Optional[int] = None) -> List[float]:
+        """Son last değer (grafik yalnızca görünen pencereyi okur)"""
+        with self._lock:
+            return self.buffers[(device, metric)].values(last)
+
+    def export_csv(self, path: Path) -> int:
+        """Tüm tamponları uzun formatta (zaman, cihaz, metrik, değer) CSV'ye yaz"""
+        rows = 0
+        with Path(path).open("w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["timestamp", "device", "metric", "value"])
+            for (device, metric) in self.buffers:
+                for ts, value in self.series(device, metric):
+                    stamp = datetime.datetime.fromtimestamp(ts).isoformat(timespec="seconds")
+                    w.writerow([stamp, device or "default", metric, value])
+                    rows += 1
+        return rows
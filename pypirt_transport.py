@@ -0,0 +1,284 @@
+"""PyPIRT çoklu bağlantı yolu seçimi.
+
+Aynı telefon adb'de birden çok seri numarasıyla görünebilir: USB kablosu
+(`R58N...`), `adb tcpip` ile Wi-Fi (`192.168.1.20:5555`), kablosuz hata
+ayıklama (`adb-R58N..._adb-tls-connect._tcp`) ya da birden çok Wi-Fi adresi.
+Her yol ayrı yoklanır ve `ro.serialno` değerine göre fiziksel cihaz altında
+gruplanır:
+  * gecikme: `adb shell true` birkaç kez çalıştırılır, en kısa süre alınır
+    (adb sürecinin başlatma maliyeti her yolda aynı olduğundan karşılaştırma
+    adildir);
+  * aktarım hızı: `exec-out` ile cihazdan 2 MiB sıfır okunur.
+Aynı cihazın yolları sırayla ölçülür (aynı adbd'yi paylaşırlar); farklı
+cihazlar paralel ölçülür.
+
+ADBClient._run ve popen her cihaz komutunu buraya sorar: arama, tuş ve
+`am` gibi kısa kabuk komutları en düşük gecikmeli yola, push/pull/install
+ve exec-out akışları en hızlı aktarım yoluna gider. Devresi açık
+(bkz. pypirt_health) ya da adb'nin "device not found/offline" dediği yol
+atlanır; ölü yola gitmiş bir komut bir sonraki yolda yeniden denenir.
+Komut çalıştıktan sonra zaman aşımına uğrarsa (ör. bir arama) yeniden
+denenmez, çünkü ikinci kez çalışabilir.
+
+Ölçümler yollar.json'a yazılır; komut satırı her çağrıda yeniden ölçmeden
+son ölçümü (CACHE_TTL içindeyse) kullanır.
+"""
+import json
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from pypirt_health import DEVICE_VERBS, OPEN as HEALTH_OPEN, registry as health_registry
+
+
+LATENCY, BULK = "gecikme", "aktarim"
+BULK_VERBS = {"push", "pull", "install", "install-multiple", "bugreport", "exec-out"}
+PROBE_ROUNDS = 5  # Gecikme ölçümünde `shell true` sayısı
+PROBE_TIMEOUT = 5
+THROUGHPUT_BYTES = 2 << 20
+CACHE_TTL = 600.0  # Kaydedilen ölçümün komut satırında geçerli sayıldığı süre, saniye
+WORKERS = 8
+# Tüm cihazlarda aynı dönen ya da boş seri numaraları gruplamada kullanılmaz
+_BOGUS_SERIALNO = {"", "unknown", "0123456789abcdef", "0000000000000000"}
+_LOST = re.compile(r"error: (?:device (?:'[^']*' )?(?:not found|offline)|no devices/emulators found|closed)")
+
+
+@dataclass
+class Transport:
+    serial: str  # adb -s değeri
+    device: str = ""  # ro.serialno (gruplama anahtarı)
+    wifi: bool = False
+    rtt_ms: float = 0.0
+    mbps: float = 0.0  # MB/sn
+    alive: bool = False
+    error: str = ""
+    at: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def is_wifi(serial: str) -> bool:
+    return ":" in serial or "._adb" in serial
+
+
+def command_class(args: Sequence[str]) -> str:
+    """Komutun yönlendirme sınıfı: BULK ya da LATENCY"""
+    rest = args[3:] if list(args[1:2]) == ["-s"] else args[1:]
+    return BULK if rest and rest[0] in BULK_VERBS else LATENCY
+
+
+def default_path() -> Path:
+    import pypirt_core
+    return pypirt_core.DATA_DIR / "yollar.json"
+
+
+def _adb_run(serial: str, command: str, binary: bool = False) -> subprocess.CompletedProcess:
+    # Yönlendiriciyi atlamak için doğrudan: ölçüm tam olarak bu yoldan geçmeli
+    return subprocess.run(["adb", "-s", serial, "exec-out" if binary else "shell", command],
+                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL,
+                          timeout=PROBE_TIMEOUT)
+
+
+def _identify(t: Transport):
+    try:
+        cp = _adb_run(t.serial, "getprop ro.serialno")
+    except (subprocess.TimeoutExpired, OSError) as e:
+        t.error = str(e) or "zaman aşımı"
+        return
+    serialno = cp.stdout.decode("utf-8", "replace").strip()
+    if cp.returncode != 0:
+        t.error = serialno or f"çıkış kodu {cp.returncode}"
+        return
+    t.device = serialno if serialno.lower() not in _BOGUS_SERIALNO else t.serial
+    t.alive = True
+
+
+def _measure(t: Transport, rounds: int = PROBE_ROUNDS):
+    try:
+        rtts = []
+        for _ in range(rounds):
+            t0 = time.perf_counter()
+            if _adb_run(t.serial, "true").returncode == 0:
+                rtts.append(time.perf_counter() - t0)
+        if not rtts:
+            t.alive, t.error = False, "yanıt yok"
+            return
+        t.rtt_ms = round(min(rtts) * 1000, 2)
+        t0 = time.perf_counter()
+        cp = _adb_run(t.serial, f"dd if=/dev/zero bs=65536 count={THROUGHPUT_BYTES >> 16} 2>/dev/null", binary=True)
+        spent = time.perf_counter() - t0 - min(rtts)
+        if len(cp.stdout) and spent > 0:
+            t.mbps = round(len(cp.stdout) / spent / 2 ** 20, 1)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        t.alive, t.error = False, str(e) or "zaman aşımı"
+
+
+def probe(serials: Sequence[str], rounds: int = PROBE_ROUNDS) -> List[Transport]:
+    """Yolları tanı (paralel), sonra cihaz başına sırayla gecikme ve hız ölç"""
+    transports = [Transport(serial=s, wifi=is_wifi(s), at=time.time()) for s in serials]
+    if not transports:
+        return []
+    with ThreadPoolExecutor(max_workers=min(WORKERS, len(transports)), thread_name_prefix="pypirt-yol") as pool:
+        list(pool.map(_identify, transports))
+        groups: Dict[str, List[Transport]] = {}
+        for t in transports:
+            if t.alive:
+                groups.setdefault(t.device, []).append(t)
+
+        def measure_group(group: List[Transport]):
+            for t in group:
+                _measure(t, rounds)
+
+        list(pool.map(measure_group, groups.values()))
+    return transports
+
+
+class TransportRouter:
+    """Seri numarası → fiziksel cihazın yolları; komut sınıfına göre yol seçer"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._by_serial: Dict[str, Transport] = {}
+        self._groups: Dict[str, List[Transport]] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def update(self, transports: Sequence[Transport], save: bool = True):
+        """Yeni ölçümleri uygula (ölçülen cihazların eski yolları atılır)"""
+        with self._lock:
+            self._loaded = True
+            devices = {t.device for t in transports if t.device}
+            for serial, old in list(self._by_serial.items()):
+                if old.device in devices or any(t.serial == serial for t in transports):
+                    del self._by_serial[serial]
+            for t in transports:
+                if t.device:
+                    self._by_serial[t.serial] = t
+            self._regroup()
+        if save:
+            self.save()
+
+    def _regroup(self):
+        self._groups = {}
+        for t in self._by_serial.values():
+            self._groups.setdefault(t.device, []).append(t)
+
+    def groups(self) -> Dict[str, List[Transport]]:
+        self._ensure_loaded()
+        with self._lock:
+            return {d: list(ts) for d, ts in self._groups.items()}
+
+    def forget(self, serial: str):
+        """Yol bilerek kapatıldı (adb disconnect)"""
+        with self._lock:
+            if self._by_serial.pop(serial, None) is not None:
+                self._regroup()
+
+    def route(self, serial: str, kind: str = LATENCY) -> Optional[str]:
+        """serial'in cihazına giden en uygun canlı yol; bilinmiyorsa None"""
+        self._ensure_loaded()
+        with self._lock:
+            t = self._by_serial.get(serial)
+            if t is None:
+                return None
+            usable = [x for x in self._groups.get(t.device, ())
+                      if x.alive and health_registry.get(x.serial).state != HEALTH_OPEN]
+        if not usable:
+            return None
+        if kind == BULK:
+            best = max(usable, key=lambda x: (x.mbps, not x.wifi, -x.rtt_ms))
+        else:
+            best = min(usable, key=lambda x: (x.rtt_ms or float("inf"), x.wifi))
+        return best.serial
+
+    def reroute(self, args: List[str]) -> List[str]:
+        """Komutu en uygun yola çevir; değişiklik yoksa aynı liste döner"""
+        if len(args) < 2:
+            return args
+        if args[1] == "-s" and len(args) > 3:
+            serial = args[2]
+        elif args[1] in DEVICE_VERBS:
+            # -s yoksa adb tek cihaz bekler; bilinen tek cihaz birden çok yoldaysa yolu biz seçeriz
+            groups = self.groups()
+            if len(groups) != 1:
+                return args
+            ts = next(iter(groups.values()))
+            if len(ts) < 2:
+                return args
+            serial = ts[0].serial
+            args = [args[0], "-s", serial] + args[1:]
+        else:
+            return args
+        best = self.route(serial, command_class(args))
+        if best is None or best == serial:
+            return args
+        return [args[0], "-s", best] + args[3:]
+
+    def lost(self, args: List[str], output: str) -> bool:
+        """adb çıktısı yolun kaybolduğunu söylüyorsa yolu ölü işaretle; başka canlı yol varsa True"""
+        if args[1:2] != ["-s"] or not _LOST.search(output or ""):
+            return False
+        serial = args[2]
+        with self._lock:
+            t = self._by_serial.get(serial)
+            if t is None or not t.alive:
+                return False
+            t.alive, t.error = False, (output or "").strip().splitlines()[-1]
+            return any(x.alive for x in self._groups.get(t.device, ()))
+
+    def save(self):
+        path = self._path or default_path()
+        with self._lock:
+            data = {"at": time.time(), "transports": [t.to_dict() for t in self._by_serial.values()]}
+        try:
+            path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+        except OSError:
+            pass
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                data = json.loads((self._path or default_path()).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return
+            if time.time() - data.get("at", 0) > CACHE_TTL:
+                return
+            names = {f.name for f in fields(Transport)}
+            for d in data.get("transports", []):
+                t = Transport(**{k: v for k, v in d.items() if k in names})
+                if t.device:
+                    self._by_serial[t.serial] = t
+            self._regroup()
+
+
+def probe_all(client, serials: Optional[Sequence[str]] = None, save: bool = True) -> List[Transport]:
+    """adb'deki tüm (ya da verilen) yolları ölç ve yönlendiriciye uygula"""
+    if serials is None:
+        serials = client.devices()
+    transports = probe(serials)
+    router.update(transports, save=save)
+    return transports
+
+
+def summary(groups: Dict[str, List[Transport]]) -> List[Dict]:
+    """Cihaz başına yollar ve seçilen gecikme/aktarım yolu"""
+    out = []
+    for device, ts in sorted(groups.items()):
+        first = ts[0].serial
+        out.append({"device": device, LATENCY: router.route(first, LATENCY), BULK: router.route(first, BULK),
+                    "yollar": [t.to_dict() for t in ts]})
+    return out
+
+
+router = TransportRouter()
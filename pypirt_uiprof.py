@@ -0,0 +1,236 @@
+"""PyPIRT arayüz takılma izleyicisi ve işlem profili.
+
+İsteğe bağlıdır; ayarlardaki "izleme" anahtarıyla açılır. Ana döngüye
+kısa aralıklarla `after()` ile bir nabız kurulur ve her nabızda planlanan ile
+gerçekleşen zaman arasındaki gecikme ölçülür. Ayrı bir bekçi iş parçacığı
+son nabzın ne kadar önce atıldığına bakar; eşik aşıldığında ana iş
+parçacığının o anki Python yığınını (`sys._current_frames`) yakalar. Böylece
+yığın, takılma bittikten sonra değil, takılma sürerken alınır.
+
+Adı verilen arayüz işlemleri (örn. _refresh_list) örnek üzerinde sarılır;
+her çağrının süresi tutulur, istenirse aynı çağrılar cProfile ile profillenir
+veya tracemalloc ile bellek farkı ölçülür. Kapanışta özet rapor yazılır.
+
+    "izleme": {"esik_ms": 150, "profil": "cprofile"}   # ya da "tracemalloc"
+"""
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pypirt_core
+
+
+TICK_MS = 50  # Nabız aralığı
+STALL_MS = 150  # Bu kadar nabız gelmezse takılma sayılır
+MAX_STALLS = 200  # Raporda tutulan en fazla takılma
+LAG_SAMPLES = 5000  # Gecikme yüzdelikleri için son örnekler
+UI_OPS = ("_refresh_list", "_update_apps_list", "_set_status", "_load_profile_image")
+
+
+def default_report() -> Path:
+    return pypirt_core.DATA_DIR / "ui_izleme.txt"
+
+
+@dataclass
+class Stall:
+    at: float  # time.time()
+    ms: float = 0.0  # takılma süresi (nabız gelene kadar)
+    stack: str = ""
+
+
+@dataclass
+class OpStats:
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    mem_kb: float = 0.0  # tracemalloc: çağrılardan sonra kalan net ayırma toplamı
+
+
+def _pct(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    return s[min(len(s) - 1, int(q * len(s)))]
+
+
+class StallMonitor:
+    """Tk ana döngüsünün nabzını ölçer, takılmalarda ana iş parçacığı yığınını yakalar"""
+
+    def __init__(self, root, threshold_ms: float = STALL_MS, tick_ms: int = TICK_MS,
+                 on_log: Callable[[str], None] = pypirt_core.append_log):
+        self.root = root
+        self.threshold = threshold_ms / 1000
+        self.tick_ms = tick_ms
+        self.on_log = on_log
+        self.lags_ms: "deque[float]" = deque(maxlen=LAG_SAMPLES)
+        self.stalls: List[Stall] = []
+        self.ticks = 0
+        self._main_id = threading.main_thread().ident
+        self._last_beat = time.perf_counter()
+        self._pending: Optional[Stall] = None  # bekçinin yakaladığı, henüz bitmemiş takılma
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        self._last_beat = time.perf_counter()
+        self.root.after(self.tick_ms, self._beat, self._last_beat + self.tick_ms / 1000)
+        threading.Thread(target=self._watch, daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+        with self._lock:
+            st, self._pending = self._pending, None
+            if st is not None:  # kapanışta hâlâ süren takılma
+                st.ms = round((time.perf_counter() - self._last_beat) * 1000, 1)
+
+    def _beat(self, expected: float):
+        if self._stop.is_set():
+            return
+        now = time.perf_counter()
+        lag = now - expected
+        self.ticks += 1
+        self.lags_ms.append(lag * 1000)
+        with self._lock:
+            self._last_beat = now
+            st, self._pending = self._pending, None
+        if st is not None:
+            st.ms = round(lag * 1000 + self.tick_ms, 1)
+            self.on_log(f"[İzleme] Arayüz {st.ms:.0f} ms takıldı:\n{st.stack}")
+        self.root.after(self.tick_ms, self._beat, now + self.tick_ms / 1000)
+
+    def _watch(self):
+        period = min(self.threshold / 3, 0.05)
+        while not self._stop.wait(period):
+            with self._lock:
+                silent = time.perf_counter() - self._last_beat - self.tick_ms / 1000
+                if silent < self.threshold or self._pending is not None:
+                    continue
+                frame = sys._current_frames().get(self._main_id)
+                if frame is None:
+                    continue
+                st = Stall(at=time.time(), stack="".join(traceback.format_stack(frame)))
+                self._pending = st
+                if len(self.stalls) < MAX_STALLS:
+                    self.stalls.append(st)
+
+    def summary(self) -> List[str]:
+        lags = list(self.lags_ms)
+        lines = [f"Nabız: {self.ticks} (her {self.tick_ms} ms), gecikme p50 {_pct(lags, 0.5):.1f} ms, "
+                 f"p95 {_pct(lags, 0.95):.1f} ms, p99 {_pct(lags, 0.99):.1f} ms, en çok {max(lags, default=0):.1f} ms",
+                 f"Takılma (> {self.threshold * 1000:.0f} ms): {len(self.stalls)}"]
+        # Aynı yerde tekrarlanan takılmalar tek satırda toplanır (yığının son çerçevesi)
+        groups: Dict[str, List[Stall]] = {}
+        for st in self.stalls:
+            frames = st.stack.strip().splitlines()
+            groups.setdefault(frames[-2].strip() if len(frames) >= 2 else "?", []).append(st)
+        for where, items in sorted(groups.items(), key=lambda kv: -sum(s.ms for s in kv[1])):
+            worst = max(items, key=lambda s: s.ms)
+            lines.append(f"  {len(items)}x, toplam {sum(s.ms for s in items):.0f} ms, en uzun {worst.ms:.0f} ms — {where}")
+            lines.extend("      " + ln for ln in worst.stack.rstrip().splitlines()[-8:])
+        return lines
+
+
+class OpProfiler:
+    """Adı verilen örnek metotlarını sarar: süre, isteğe bağlı cProfile / tracemalloc"""
+
+    def __init__(self, mode: Optional[str] = None):
+        if mode not in (None, "", "cprofile", "tracemalloc"):
+            raise ValueError(f"Bilinmeyen profil türü: {mode}")
+        self.mode = mode or None
+        self.ops: Dict[str, OpStats] = {}
+        self._profile = cProfile.Profile() if self.mode == "cprofile" else None
+        self._depth = 0  # iç içe sarılı çağrılarda profil bir kez açılır
+        if self.mode == "tracemalloc":
+            import tracemalloc
+            tracemalloc.start(10)
+
+    def wrap(self, obj, names: Sequence[str] = UI_OPS):
+        """Metotları örnek üzerinde değiştir (widget'lar oluşturulmadan önce çağrılmalı)"""
+        for name in names:
+            fn = getattr(obj, name, None)
+            if fn is not None:
+                setattr(obj, name, self._wrapped(name, fn))
+
+    def _wrapped(self, name: str, fn):
+        stats = self.ops.setdefault(name, OpStats())
+
+        def call(*args, **kwargs):
+            mem0 = self._traced() if self.mode == "tracemalloc" else 0
+            outer = self._depth == 0
+            self._depth += 1
+            if outer and self._profile is not None:
+                self._profile.enable()
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                ms = (time.perf_counter() - t0) * 1000
+                if outer and self._profile is not None:
+                    self._profile.disable()
+                self._depth -= 1
+                stats.calls += 1
+                stats.total_ms += ms
+                stats.max_ms = max(stats.max_ms, ms)
+                if self.mode == "tracemalloc":
+                    stats.mem_kb += (self._traced() - mem0) / 1024
+
+        call.__name__ = name
+        call.__wrapped__ = fn
+        return call
+
+    @staticmethod
+    def _traced() -> int:
+        import tracemalloc
+        return tracemalloc.get_traced_memory()[0]
+
+    def summary(self, top: int = 25) -> List[str]:
+        lines = ["İşlem                      çağrı   toplam ms   ort ms   en çok ms" +
+                 ("   net KB" if self.mode == "tracemalloc" else "")]
+        for name, st in sorted(self.ops.items(), key=lambda kv: -kv[1].total_ms):
+            avg = st.total_ms / st.calls if st.calls else 0.0
+            row = f"{name:<26} {st.calls:>5} {st.total_ms:>11.1f} {avg:>8.2f} {st.max_ms:>11.1f}"
+            if self.mode == "tracemalloc":
+                row += f" {st.mem_kb:>8.1f}"
+            lines.append(row)
+        if self._profile is not None:
+            buf = io.StringIO()
+            pstats.Stats(self._profile, stream=buf).sort_stats("cumulative").print_stats(top)
+            lines += ["", "cProfile (sarılı işlemler, kümülatif):", buf.getvalue().rstrip()]
+        elif self.mode == "tracemalloc":
+            import tracemalloc
+            lines += ["", "tracemalloc (en çok ayıran satırlar):"]
+            for stat in tracemalloc.take_snapshot().statistics("lineno")[:top]:
+                lines.append(f"  {stat}")
+            tracemalloc.stop()
+        return lines
+
+
+class UiWatch:
+    """Ayarlardan kurulan izleyici + profil; close() raporu yazar"""
+
+    def __init__(self, root, options, on_log: Callable[[str], None] = pypirt_core.append_log):
+        options = options if isinstance(options, dict) else {}  # "izleme": true → varsayılanlar
+        self.on_log = on_log
+        self.started = time.time()
+        self.monitor = StallMonitor(root, float(options.get("esik_ms", STALL_MS)), on_log=on_log)
+        self.profiler = OpProfiler(options.get("profil"))
+        self.profiler.wrap(root, options.get("islemler", UI_OPS))
+        self.report_path = Path(options["rapor"]) if options.get("rapor") else default_report()
+        self.monitor.start()
+
+    def close(self) -> Path:
+        self.monitor.stop()
+        lines = [f"PyPIRT arayüz izleme raporu — {time.strftime('%Y-%m-%d %H:%M:%S')}",
+                 f"Süre: {time.time() - self.started:.0f} sn", ""]
+        lines += self.monitor.summary() + [""] + self.profiler.summary()
+        self.report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        self.on_log(f"[İzleme] Rapor yazıldı: {self.report_path}")
+        return self.report_path
@@ -0,0 +1,241 @@
+"""PyPIRT ekran görüntüsü karşılaştırma.
+
+Piksel farkları Pillow'un C tarafındaki toplu işlemleriyle hesaplanır
+(ImageChops.difference, kanal başına en büyük fark, eşik tablosu);
+Python'da piksel piksel dolaşılmaz. Maske BLOCK'un katına doldurulur ve
+tam BLOCK x BLOCK'luk hücrelere indirgenir (Image.reduce; hücre ızgarası
+piksellerle birebir hizalıdır), komşu hücreler birleştirilerek değişen
+bölgelerin kutuları bulunur. Tam çözünürlüklü bir kare birkaç on
+milisaniyede karşılaştırılır; yüzlerce ekranlık toplu çalışmalar için
+uygundur.
+
+Karşılaştırma iki dosya, iki klasör (aynı adlı dosyalar), bir cihazın anlık
+ekranı ile referans görüntü veya aynı ekranın tüm cihazlardaki hali
+arasında yapılabilir. Sonuçlar JSON olarak ve değişen bölgeleri vurgulayan
+PNG'ler olarak yazılır.
+"""
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pypirt_core import ADBClient
+
+
+THRESHOLD = 24  # Kanal farkı bundan büyükse piksel değişmiş sayılır (0-255)
+BLOCK = 16  # Bölge kutuları için hücre boyu, piksel
+TOLERANCE = 0.001  # Değişen piksel oranı bunun altındaysa görüntüler aynı sayılır
+
+Box = Tuple[int, int, int, int]  # x0, y0, x1, y1 (x1/y1 hariç)
+
+
+def _pil():
+    from PIL import Image, ImageChops, ImageDraw
+    return Image, ImageChops, ImageDraw
+
+
+@dataclass
+class DiffResult:
+    name: str
+    width: int = 0
+    height: int = 0
+    changed_pixels: int = 0
+    changed_ratio: float = 0.0
+    different: bool = False
+    boxes: List[Box] = field(default_factory=list)
+    ms: float = 0.0
+    overlay: str = ""
+    error: str = ""
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _cells(mask, block: int, gw: int, gh: int) -> bytes:
+    """Maskeyi gw x gh hücreye indir; değişmiş piksel içeren hücre 1, diğerleri 0"""
+    Image, _, _ = _pil()
+    if mask.size != (gw * block, gh * block):
+        padded = Image.new("L", (gw * block, gh * block), 0)
+        padded.paste(mask, (0, 0))
+        mask = padded
+    # reduce ortalamayı yuvarlar; önce yatay, eşikleme, sonra dikey indirgenir ki tek bir
+    # değişmiş piksel (255 / block) büyük bloklarda da sıfıra yuvarlanmasın.
+    row = mask.reduce((block, 1)).point([0] + [255] * 255)
+    return row.reduce((1, block)).point([0] + [1] * 255).tobytes()
+
+
+def _regions(cells, gw: int, gh: int) -> List[Tuple[int, int, int, int]]:
+    """Değişmiş hücrelerin 8-komşulukla birleşmiş kutuları (hücre biriminde)"""
+    seen = bytearray(gw * gh)
+    out = []
+    for start in range(gw * gh):
+        if not cells[start] or seen[start]:
+            continue
+        seen[start] = 1
+        stack = [start]
+        x0 = x1 = start % gw
+        y0 = y1 = start // gw
+        while stack:
+            i = stack.pop()
+            x, y = i % gw, i // gw
+            x0, x1, y0, y1 = min(x0, x), max(x1, x), min(y0, y), max(y1, y)
+            for ny in (y - 1, y, y + 1):
+                if 0 <= ny < gh:
+                    for nx in (x - 1, x, x + 1):
+                        if 0 <= nx < gw:
+                            j = ny * gw + nx
+                            if cells[j] and not seen[j]:
+                                seen[j] = 1
+                                stack.append(j)
+        out.append((x0, y0, x1 + 1, y1 + 1))
+    return out
+
+
+def diff_images(a, b, name: str = "", threshold: int = THRESHOLD, block: int = BLOCK,
+                tolerance: float = TOLERANCE):
+    """İki PIL görüntüsünü karşılaştır; (DiffResult, değişim maskesi) döndür"""
+    Image, ImageChops, _ = _pil()
+    t0 = time.perf_counter()
+    res = DiffResult(name=name, width=a.width, height=a.height)
+    if a.size != b.size:
+        res.error = f"Boyutlar farklı: {a.size} / {b.size}"
+        res.different = True
+        return res, None
+    d = ImageChops.difference(a.convert("RGB"), b.convert("RGB"))
+    r, g, bl = d.split()
+    d = ImageChops.lighter(ImageChops.lighter(r, g), bl)  # kanal başına en büyük fark
+    mask = d.point([0] * (threshold + 1) + [255] * (255 - threshold))
+    res.changed_pixels = mask.histogram()[255]
+    res.changed_ratio = round(res.changed_pixels / (a.width * a.height), 6)
+    res.different = res.changed_ratio > tolerance
+    if res.changed_pixels:
+        gw, gh = -(-a.width // block), -(-a.height // block)
+        cells = _cells(mask, block, gw, gh)
+        for x0, y0, x1, y1 in _regions(cells, gw, gh):
+            res.boxes.append((x0 * block, y0 * block, min(x1 * block, a.width), min(y1 * block, a.height)))
+    res.ms = round((time.perf_counter() - t0) * 1000, 1)
+    return res, mask
+
+
+def render_overlay(base, mask, boxes: List[Box]):
+    """Değişen pikselleri kırmızıya boyanmış, bölgeleri çerçeveli görüntü"""
+    Image, _, ImageDraw = _pil()
+    img = Image.blend(base.convert("RGB"), Image.new("RGB", base.size, (0, 0, 0)), 0.45)
+    if mask is not None:
+        img.paste((255, 40, 40), mask=mask)
+    draw = ImageDraw.Draw(img)
+    for box in boxes:
+        draw.rectangle((box[0], box[1], box[2] - 1, box[3] - 1), outline=(255, 220, 0), width=3)
+    return img
+
+
+def compare_files(a_path: Path, b_path: Path, out_dir: Optional[Path] = None, **kwargs) -> DiffResult:
+    Image, _, _ = _pil()
+    name = Path(b_path).name
+    try:
+        with Image.open(a_path) as a, Image.open(b_path) as b:
+            res, mask = diff_images(a, b, name=name, **kwargs)
+            if out_dir is not None and res.different and mask is not None:
+                res.overlay = str(_write_overlay(b, mask, res, out_dir))
+    except OSError as e:
+        res = DiffResult(name=name, different=True, error=str(e))
+    return res
+
+
+def _write_overlay(img, mask, res: DiffResult, out_dir: Path) -> Path:
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"fark_{Path(res.name).stem}.png"
+    render_overlay(img, mask, res.boxes).save(path, compress_level=1)  # hız için düşük sıkıştırma
+    return path
+
+
+def compare_dirs(base_dir: Path, cur_dir: Path, out_dir: Optional[Path] = None, workers: int = 4,
+                 **kwargs) -> List[DiffResult]:
+    """İki klasördeki aynı adlı PNG'leri paralel karşılaştır (Pillow işlemleri GIL'i bırakır)"""
+
+    def one(cur: Path) -> DiffResult:
+        base = Path(base_dir) / cur.name
+        if not base.exists():
+            return DiffResult(name=cur.name, different=True, error="Referansta yok")
+        return compare_files(base, cur, out_dir, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(one, sorted(Path(cur_dir).glob("*.png"))))
+
+
+def capture(client: ADBClient):
+    """Ekranı cihazda dosya oluşturmadan (exec-out screencap) PIL görüntüsü olarak al"""
+    Image, _, _ = _pil()
+    proc = client.popen(client._adb("exec-out", "screencap", "-p"), binary=True)
+    data, _ = proc.communicate(timeout=30)
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    return img
+
+
+def compare_device(client: ADBClient, baseline: Path, out_dir: Optional[Path] = None, **kwargs) -> DiffResult:
+    """Cihazın şu anki ekranını referans görüntüyle karşılaştır"""
+    Image, _, _ = _pil()
+    name = f"{(client.serial or 'cihaz').replace(':', '_')}.png"
+    try:
+        cur = capture(client)
+        with Image.open(baseline) as base:
+            res, mask = diff_images(base, cur, name=name, **kwargs)
+        if out_dir is not None and res.different and mask is not None:
+            res.overlay = str(_write_overlay(cur, mask, res, out_dir))
+    except Exception as e:
+        res = DiffResult(name=name, different=True, error=str(e))
+    return res
+
+
+def compare_fleet(adb: ADBClient, devices: List[str], reference: Optional[str] = None,
+                  out_dir: Optional[Path] = None, **kwargs) -> List[DiffResult]:
+    """Tüm cihazların ekranını paralel al, referans cihazınkiyle karşılaştır"""
+    shots: Dict[str, object] = {}
+    errors: Dict[str, str] = {}
+
+    def grab(serial: str):
+        try:
+            shots[serial] = capture(adb.for_device(serial))
+        except Exception as e:
+            errors[serial] = str(e)
+
+    threads = [threading.Thread(target=grab, args=(d,), daemon=True) for d in devices]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    reference = reference or devices[0]
+    if reference not in shots:
+        raise RuntimeError(f"Referans cihazın ekranı alınamadı: {errors.get(reference, reference)}")
+    ref = shots[reference]
+    if out_dir is not None:
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+        ref.save(Path(out_dir) / f"referans_{reference.replace(':', '_')}.png")
+    results = []
+    for d in devices:
+        name = f"{d.replace(':', '_')}.png"
+        if d == reference:
+            continue
+        if d not in shots:
+            results.append(DiffResult(name=name, different=True, error=errors.get(d, "")))
+            continue
+        res, mask = diff_images(ref, shots[d], name=name, **kwargs)
+        if out_dir is not None and res.different and mask is not None:
+            res.overlay = str(_write_overlay(shots[d], mask, res, out_dir))
+        results.append(res)
+    return results
+
+
+def write_report(results: List[DiffResult], path: Path):
+    data = {
+        "toplam": len(results),
+        "farkli": sum(1 for r in results if r.different),
+        "sonuclar": [r.to_dict() for r in results],
+    }
+    Path(path).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -0,0 +1,250 @@
+"""PyPIRT dosya aktarımı bütünlük doğrulaması.
+
+`adb push/pull` çıktısı yalnızca aktarımın bittiğini söyler. İstenirse
+aktarılan her dosyanın özeti iki tarafta hesaplanıp karşılaştırılır:
+cihazda `sha256sum` (yoksa `md5sum`), bilgisayarda aynı algoritmayla
+hashlib. Kaynağın özeti aktarımla eşzamanlı hesaplanır (push'ta yerel
+dosya, pull'da cihazdaki dosya değişmediği için); hedefin özeti ise bir
+sonraki dosyanın aktarımıyla eşzamanlı yürür. Böylece çok GB'lık
+aktarımlarda doğrulama toplam süreye yalnızca son dosyanın hedef özeti
+kadar ekler.
+
+Yerel özet dosyayı CHUNK'lık parçalar halinde okur; okumalar bir iş
+havuzunda önden yürür (PREFETCH parça), hashlib de büyük parçalarda GIL'i
+bıraktığından disk okuması ile özet hesabı üst üste biner. (sha256 tek bir
+akış olduğundan parçalar sırayla özete verilir; cihazın sha256sum
+çıktısıyla karşılaştırılabilmesi için ağaç özeti kullanılmaz.)
+
+Her doğrulanan dosyanın sonucu aktarim_dogrulama.jsonl'a bir satır olarak
+eklenir.
+"""
+import hashlib
+import json
+import os
+import posixpath
+import shlex
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pypirt_core
+from pypirt_core import ADBClient
+
+
+CHUNK = 4 << 20  # Yerel okuma parçası, bayt
+PREFETCH = 4  # Özete verilmeyi bekleyen en fazla okunmuş parça
+READ_WORKERS = 4
+REMOTE_TIMEOUT = 1800  # Cihazda özet hesabı üst sınırı, saniye
+ALGOS = ("sha256sum", "md5sum")  # Cihazda tercih sırası
+_HEX_LEN = {"sha256sum": 64, "md5sum": 32}
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+_algo_cache: Dict[str, str] = {}
+_record_lock = threading.Lock()
+
+
+def default_log() -> Path:
+    return pypirt_core.DATA_DIR / "aktarim_dogrulama.jsonl"
+
+
+@dataclass
+class Check:
+    direction: str  # push / pull
+    local: str
+    remote: str
+    ok: bool = False  # aktarım başarılı ve (doğrulandıysa) özetler aynı
+    transferred: bool = False
+    verified: bool = False
+    algo: str = ""
+    size: int = 0
+    local_hash: str = ""
+    remote_hash: str = ""
+    transfer_ms: float = 0.0
+    verify_ms: float = 0.0  # aktarım bittikten sonra doğrulamanın bitmesine kadar
+    error: str = ""
+    at: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _read_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=READ_WORKERS, thread_name_prefix="pypirt-ozet")
+        return _pool
+
+
+def _spawn(fn, *args) -> Future:
+    """fn'i ayrı bir iş parçacığında çalıştır (okuma havuzunu bekleyen işler havuza konmaz)"""
+    fut: Future = Future()
+
+    def run():
+        try:
+            fut.set_result(fn(*args))
+        except BaseException as e:
+            fut.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return fut
+
+
+def _hashlib_name(algo: str) -> str:
+    return algo[:-3]  # sha256sum → sha256
+
+
+def local_digest(path: Path, algo: str = "sha256sum") -> str:
+    """Dosyanın özeti; parçalar havuzda önden okunur, özete sırayla verilir"""
+    h = hashlib.new(_hashlib_name(algo))
+    size = os.path.getsize(path)
+    fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "pread"):
+            def read_at(offset: int) -> bytes:
+                return os.pread(fd, CHUNK, offset)
+        else:  # Windows: konumlu okuma yok, her parça kendi dosya nesnesiyle
+            def read_at(offset: int) -> bytes:
+                with open(path, "rb") as f:
+                    f.seek(offset)
+                    return f.read(CHUNK)
+
+        pool = _read_pool()
+        pending: "deque[Future]" = deque()
+        offsets = iter(range(0, size, CHUNK))
+        for offset in offsets:
+            pending.append(pool.submit(read_at, offset))
+            if len(pending) >= PREFETCH:
+                break
+        while pending:
+            data = pending.popleft().result()
+            nxt = next(offsets, None)
+            if nxt is not None:
+                pending.append(pool.submit(read_at, nxt))
+            h.update(data)
+    finally:
+        os.close(fd)
+    return h.hexdigest()
+
+
+def device_algo(client: ADBClient) -> str:
+    """Cihazda bulunan ilk özet aracı (cihaz başına bir kez sorulur); yoksa boş"""
+    key = client.serial or client.target or ""
+    if key not in _algo_cache:
+        script = f"for a in {' '.join(ALGOS)}; do command -v $a >/dev/null 2>&1 && echo $a && break; done"
+        try:
+            out = (client._run(client._adb("shell", script), quiet=True).stdout or "").split()
+        except Exception:
+            return ""
+        _algo_cache[key] = next((a for a in out if a in ALGOS), "")
+    return _algo_cache[key]
+
+
+def remote_digest(client: ADBClient, path: str, algo: str, name: str = "") -> str:
+    """Cihazdaki dosyanın özeti; path klasörse (push hedefi) içindeki `name` dosyası"""
+    script = f"p={shlex.quote(path)}; "
+    if name:
+        script += f"[ -d \"$p\" ] && p=\"$p\"/{shlex.quote(name)}; "
+    script += f"{algo} \"$p\""
+    out = (client._run(client._adb("shell", script), timeout=REMOTE_TIMEOUT, quiet=True).stdout or "").strip()
+    digest = out.split()[0].lower() if out else ""
+    if len(digest) != _HEX_LEN[algo] or any(c not in "0123456789abcdef" for c in digest):
+        raise RuntimeError(out.splitlines()[-1] if out else "Cihazda özet alınamadı")
+    return digest
+
+
+def record(checks: Sequence[Check], path: Optional[Path] = None):
+    """Sonuçları JSONL kaydına ekle"""
+    path = Path(path) if path else default_log()
+    with _record_lock, path.open("a", encoding="utf-8") as f:
+        for c in checks:
+            f.write(json.dumps(c.to_dict(), ensure_ascii=False) + "\n")
+
+
+def transfer(client: ADBClient, direction: str, pairs: Sequence[Tuple[str, str]], verify: bool = True,
+             on_result: Optional[Callable[[Check], None]] = None, log: Optional[Path] = None) -> List[Check]:
+    """(kaynak, hedef) çiftlerini sırayla aktar, isteğe bağlı olarak doğrula.
+
+    push: kaynak yerel, hedef cihaz yolu; pull: kaynak cihaz, hedef yerel yol.
+    Hedef klasörse dosya adı adb'de olduğu gibi eklenir.
+    """
+    if direction not in ("push", "pull"):
+        raise ValueError(f"Bilinmeyen yön: {direction}")
+    algo = device_algo(client) if verify else ""
+    checks: List[Check] = []
+    waits: List[Future] = []
+
+    for src, dst in pairs:
+        if direction == "push":
+            local, remote, name = str(src), str(dst), Path(src).name
+            if remote.endswith("/"):
+                remote, name = posixpath.join(remote, name), ""
+        else:
+            local, remote, name = str(dst), str(src), ""
+            if Path(local).is_dir():
+                local = str(Path(local) / posixpath.basename(remote.rstrip("/")))
+        check = Check(direction=direction, local=local, remote=remote, algo=algo, at=time.time())
+        checks.append(check)
+
+        src_hash: Optional[Future] = None
+        if verify and algo:
+            if direction == "push" and Path(local).is_file():
+                src_hash = _spawn(local_digest, Path(local), algo)
+            elif direction == "pull":
+                src_hash = _spawn(remote_digest, client, remote, algo)
+        t0 = time.perf_counter()
+        if direction == "push":
+            check.transferred = client.push_file(local, dst)
+        else:
+            check.transferred = client.pull_file(remote, local)
+        check.transfer_ms = round((time.perf_counter() - t0) * 1000, 1)
+        if Path(local).is_file():
+            check.size = Path(local).stat().st_size
+
+        if not verify:
+            check.ok = check.transferred
+        elif not check.transferred:
+            check.error = "Aktarım başarısız"
+        elif not algo:
+            check.error = "Cihazda sha256sum/md5sum yok; doğrulanmadı"
+        elif not Path(local).is_file():
+            check.ok = True
+            check.error = "Klasör; doğrulanmadı"
+        else:
+            # Hedef özeti arka planda; döngü sonraki dosyanın aktarımına geçer
+            dst_hash = (_spawn(remote_digest, client, remote, algo, name) if direction == "push"
+                        else _spawn(local_digest, Path(local), algo))
+            waits.append(_spawn(_finish, check, src_hash, dst_hash, time.perf_counter(), on_result, log))
+            continue
+        if verify:
+            record([check], log)
+        if on_result:
+            on_result(check)
+
+    for w in waits:
+        w.result()
+    return checks
+
+
+def _finish(check: Check, src_hash: Optional[Future], dst_hash: Future, t_end: float,
+            on_result: Optional[Callable[[Check], None]], log: Optional[Path]):
+    try:
+        hashes = [src_hash.result() if src_hash is not None else "", dst_hash.result()]
+        if check.direction == "pull":
+            hashes.reverse()
+        check.local_hash, check.remote_hash = hashes
+        check.verified = True
+        check.ok = bool(check.local_hash) and check.local_hash == check.remote_hash
+        if not check.ok:
+            check.error = "Özetler uyuşmuyor"
+    except Exception as e:
+        check.error = f"Doğrulanamadı: {e}"
+    check.verify_ms = round((time.perf_counter() - t_end) * 1000, 1)
+    record([check], log)
+    if on_result:
+        on_result(check)